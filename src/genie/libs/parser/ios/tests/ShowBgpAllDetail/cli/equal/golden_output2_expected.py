@@ -4,7 +4,7 @@ expected_output = {
             "vrf": {
                 "EVPN-BGP-Table": {
                     "address_family": {
-                        "vpnv4 unicast RD 65535:1": {
+                        "l2vpn e-vpn": {
                             "default_vrf": "evpn1",
                             "prefixes": {
                                 "10.1.1.0/17": {
@@ -22,7 +22,6 @@ expected_output = {
                                                 "router_mac": "MAC:001E.7AFF.FCD2",
                                             },
                                             "gateway": "0.0.0.0",
-                                            "inaccessible": False,
                                             "localpref": 100,
                                             "metric": 0,
                                             "next_hop": "0.0.0.0",
@@ -56,7 +55,6 @@ expected_output = {
                                                 "router_mac": "MAC:001E.7AFF.FCD2",
                                             },
                                             "gateway": "0.0.0.0",
-                                            "inaccessible": False,
                                             "localpref": 100,
                                             "metric": 0,
                                             "next_hop": "0.0.0.0",
@@ -82,7 +80,6 @@ expected_output = {
                                                 "router_mac": "MAC:001E.7AFF.FCD2",
                                             },
                                             "gateway": "10.36.3.254",
-                                            "inaccessible": False,
                                             "localpref": 100,
                                             "metric": 0,
                                             "next_hop": "10.36.3.254",
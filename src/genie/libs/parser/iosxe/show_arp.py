@@ -22,6 +22,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.stream import RecordParser
 
 
 # =============================================
@@ -64,7 +66,7 @@ class ShowArpSchema(MetaParser):
     }
 
 
-class ShowArp(ShowArpSchema):
+class ShowArp(RecordParser, ShowArpSchema):
     """ Parser for show arp
                   show arp <WROD>
                   show arp vrf <vrf>
@@ -73,6 +75,13 @@ class ShowArp(ShowArpSchema):
     cli_command = ['show arp','show arp vrf {vrf}','show arp vrf {vrf} {intf_or_ip}','show arp {intf_or_ip}']
     exclude = ['age']
 
+    patterns = PatternTable(
+        # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+        # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
+        p1=r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
+           r'(?P<mac>[\w\.]+) +(?P<type>\w+)( +(?P<interface>[\w\.\/\-]+))?$',
+    )
+
     def cli(self, vrf='', intf_or_ip='', cmd=None, output=None):
         if output is None:
             if not cmd:
@@ -88,14 +97,17 @@ class ShowArp(ShowArpSchema):
         else:
             out = output
 
-        # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
-        # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
-        p1 = re.compile(r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
-                         '(?P<mac>[\w\.]+) +(?P<type>\w+)( +(?P<interface>[\w\.\/\-]+))?$')
-        # initial variables
-        ret_dict = {}
+        return self.records_to_dict(self._records(out.splitlines()))
 
-        for line in out.splitlines():
+    def _records(self, lines):
+        '''yield a record per arp entry:
+            neighbors of an interface: interface and the fields of
+                interfaces/<interface>/ipv4/neighbors/<ip>
+            global static entries: the fields of global_static_table/<ip>
+        '''
+        p1 = self.patterns.p1
+
+        for line in lines:
             line = line.strip()
 
             # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
@@ -106,29 +118,34 @@ class ShowArp(ShowArpSchema):
                 address = group['address']
                 interface = group['interface']
                 if interface:
-                    final_dict = ret_dict.setdefault('interfaces', {}).setdefault(
-                        interface, {}).setdefault('ipv4', {}).setdefault(
-                        'neighbors', {}).setdefault(address, {})
-                    
-                    final_dict['ip'] = address
-                    final_dict['link_layer_address'] = group['mac']
-                    final_dict['type'] = group['type']
+                    record = {'interface': interface,
+                              'ip': address,
+                              'link_layer_address': group['mac'],
+                              'type': group['type']}
                     if group['age'] == '-':
-                        final_dict['origin'] = 'static'
+                        record['origin'] = 'static'
                     else:
-                        final_dict['origin'] = 'dynamic'
+                        record['origin'] = 'dynamic'
                 else:
-                    final_dict = ret_dict.setdefault(
-                        'global_static_table', {}).setdefault(address, {})
-                    final_dict['ip_address'] = address
-                    final_dict['mac_address'] = group['mac']
-                    final_dict['encap_type'] = group['type']
-
-                final_dict['age'] = group['age']
-                final_dict['protocol'] = group['protocol']
-                continue
-
-        return ret_dict
+                    record = {'ip_address': address,
+                              'mac_address': group['mac'],
+                              'encap_type': group['type']}
+
+                record['age'] = group['age']
+                record['protocol'] = group['protocol']
+                yield record
+                continue
+
+    def _add_record(self, ret_dict, record):
+        if 'interface' in record:
+            final_dict = ret_dict.setdefault('interfaces', {}).setdefault(
+                record['interface'], {}).setdefault('ipv4', {}).setdefault(
+                'neighbors', {}).setdefault(record['ip'], {})
+            final_dict.update(record)
+            del final_dict['interface']
+        else:
+            ret_dict.setdefault('global_static_table', {}).setdefault(
+                record['ip_address'], {}).update(record)
 
 # =====================================
 # Parser for 'show ip arp, show ip arp vrf <vrf>'
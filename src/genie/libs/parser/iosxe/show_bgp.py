@@ -115,6 +115,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils.stream import StreamParser
+from genie.libs.parser.utils.parallel import ChunkedParser
+from genie.libs.parser.utils.incremental import IncrementalParser
 
 
 # ============================================
@@ -193,7 +196,7 @@ class ShowBgpSchema(MetaParser):
 #   * 'show ip bgp {address_family} rd {rd}'
 #   * 'show ip bgp {address_family} vrf {vrf}'
 # ============================================
-class ShowBgpSuperParser(ShowBgpSchema):
+class ShowBgpSuperParser(StreamParser, ShowBgpSchema):
 
     ''' Super Parser for:
         * 'show bgp all'
@@ -890,7 +893,7 @@ class ShowBgpAllDetailSchema(MetaParser):
 #   * 'show ip bgp {address_family} vrf {vrf} detail'
 #   * 'show ip bgp {address_family} rd {rd} detail'
 # ======================================================
-class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
+class ShowBgpDetailSuperParser(ChunkedParser, ShowBgpAllDetailSchema):
 
     ''' Super Parser for:
         * 'show bgp all detail'
@@ -901,6 +904,14 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         * 'show ip bgp {address_family} rd {rd} detail'
     '''
 
+    # BGP routing table entry for 10.4.1.1/32, version 4
+    record_start = r'^BGP +routing +table +entry +for'
+
+    # For address family: IPv4 Unicast
+    # Route Distinguisher: 100:100 (default for vrf VRF1)
+    record_context = (r'^For +address +family:',
+                      r'^Route +Distinguisher:')
+
     def cli(self, address_family='', vrf='', rd='', output=None):
         # Init dictionary
         ret_dict = {}
@@ -1092,6 +1103,11 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 index = 0
                 address_family = m.groupdict()['address_family'].lower()
                 original_address_family = address_family
+                # The route distinguisher of the previous address family
+                # does not apply to this one
+                route_distinguisher = ''
+                new_address_family = ''
+                default_vrf = None
                 if 'instance' not in ret_dict:
                     ret_dict['instance'] = {}
                 if 'default' not in ret_dict['instance']:
@@ -2760,7 +2776,7 @@ class ShowBgpAllNeighborsSchema(MetaParser):
 #   * 'show ip bgp {address_family} vrf {vrf} neighbors'
 #   * 'show ip bgp {address_family} vrf {vrf} neighbors {neighbor}'
 # ==================================================================
-class ShowBgpNeighborSuperParser(MetaParser):
+class ShowBgpNeighborSuperParser(IncrementalParser, MetaParser):
 
     ''' Super parser for:
         * 'show bgp all neighbors'
@@ -2785,12 +2801,35 @@ class ShowBgpNeighborSuperParser(MetaParser):
         * 'show ip bgp {address_family} vrf {vrf} neighbors {neighbor}'
     '''
 
+    # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
+    record_start = r'^BGP +neighbor +is'
+
+    # For address family: IPv4 Unicast
+    record_context = (r'^For +address +family:',)
+
+    # ' For address family: VPNv4 Unicast', indented within a neighbor,
+    # belongs to that neighbor
+    record_context_outer = True
+
+    def _merge_chunks(self, partials):
+        # Each chunk lists its own neighbors
+        list_of_neighbors = []
+        for partial in partials:
+            list_of_neighbors.extend(partial.pop('list_of_neighbors', []))
+        parsed = super()._merge_chunks(partials)
+        if list_of_neighbors:
+            parsed['list_of_neighbors'] = list_of_neighbors
+        return parsed
+
     def cli(self, neighbor='', address_family='', vrf='', output=None):
 
         # Init vars
         ret_dict = {}
         list_of_neighbors = []
         af_name = None ; af_dict = {} ; nbr_dict = {}
+        # Last address family listed outside of a neighbor, and indentation
+        # of the current neighbor
+        outer_af_name = None ; nbr_indent = None
         message_statistics = False
         prefix_activity = True
         local_prefix = False
@@ -3159,12 +3198,16 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
         for line in output.splitlines():
 
+            indent = len(line) - len(line.lstrip())
             line = line.strip()
 
             # For address family: IPv4 Unicast
             m = p1.match(line)
             if m:
                 af_name = m.groupdict()['af'].lower().replace("-", "")
+                # Indented within a neighbor, it only applies to that neighbor
+                if nbr_indent is None or indent <= nbr_indent:
+                    outer_af_name = af_name
                 # af_dict
                 if nbr_dict:
                     af_dict = nbr_dict.setdefault('address_family', {}).\
@@ -3191,6 +3234,8 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 nbr_dict['remote_as'] = int(group['remote_as'])
                 nbr_dict['link'] = group['link']
                 nbr_dict['shutdown'] = False
+                nbr_indent = indent
+                af_name = outer_af_name
 
                 # af_dict
                 if af_name:
@@ -3218,6 +3263,8 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 nbr_dict['remote_as'] = int(group['remote_as'])
                 nbr_dict['link'] = group['link']
                 nbr_dict['shutdown'] = False
+                nbr_indent = indent
+                af_name = outer_af_name
 
                 # af_dict
                 if af_name:
@@ -3255,6 +3302,8 @@ class ShowBgpNeighborSuperParser(MetaParser):
                     nbr_dict['no_prepend'] = True
                 else:
                     nbr_dict['no_prepend'] = False
+                nbr_indent = indent
+                af_name = outer_af_name
 
                 # af_dict
                 if af_name:
@@ -20,6 +20,8 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.stream import RecordParser
 
 
 class ShowMacAddressTableSchema(MetaParser):
@@ -54,206 +56,237 @@ class ShowMacAddressTableSchema(MetaParser):
         Optional('total_mac_addresses'): int,
     }
 
-class ShowMacAddressTable(ShowMacAddressTableSchema):
+class ShowMacAddressTable(RecordParser, ShowMacAddressTableSchema):
     """Parser for show mac address-table"""
 
     cli_command = ['show mac address-table',
                    'show mac address-table vlan {vlan}']
 
-    def cli(self, vlan='', output=None):
-        if output is None:
-            # get output from device
-            if vlan:
-                out = self.device.execute(self.cli_command[1].format(vlan=vlan))
-            else:
-                out = self.device.execute(self.cli_command[0])
-        else:
-            out = output
-
-        # initial return dictionary
-        ret_dict = mac_dict = {}
-        entry_type = entry = learn = age = ''
-
+    patterns = PatternTable(
         # Total Mac Addresses for this criterion: 93
-        p1 = re.compile(r'^Total +Mac +Addresses +for +this +criterion: +(?P<val>\d+)$')
+        p1=r'^Total +Mac +Addresses +for +this +criterion: +(?P<val>\d+)$',
 
         # 10    aaaa.bbff.8888    STATIC      Gi1/0/8 Gi1/0/9
         # 20    aaaa.bbff.8888    STATIC      Drop
         # All    0100.0cff.999a    STATIC      CPU
-        p2 = re.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
-                        r' +(?P<entry_type>\w+) +(?P<intfs>\S+|[^\s]+\s[^\s]+)$')
+        p2=r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
+           r' +(?P<entry_type>\w+) +(?P<intfs>\S+|[^\s]+\s[^\s]+)$',
 
         # Gi1/9,Gi1/10,Gi1/11,Gi1/12
         #               Router,Switch
-        p3 = re.compile(r'^(?P<intfs>(vPC Peer-Link)?[\w\/\,\(\)]+)$')
+        p3=r'^(?P<intfs>(vPC Peer-Link)?[\w\/\,\(\)]+)$',
 
         # *  101  44dd.eeff.55bb   dynamic  Yes         10   Gi1/40
         # *  102  aa11.bbff.ee55    static  Yes          -   Gi1/2,Gi1/4,Gi1/5,Gi1/6
         # *  400  0000.0000.0000    static  No           -   vPC Peer-Link
         # *  ---  0000.0000.0000    static  No           -   Router
-        p4 = re.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
-                        r' +(?P<entry_type>\w+) +(?P<learn>\w+) +(?P<age>[\d\-\~]+) '
-                        r'+(?P<intfs>(vPC )?[\w\/\,\-\(\)\s]+)$')
+        p4=r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
+           r' +(?P<entry_type>\w+) +(?P<learn>\w+) +(?P<age>[\d\-\~]+) '
+           r'+(?P<intfs>(vPC )?[\w\/\,\-\(\)\s]+)$',
 
         # 964    0000.0000.0000   dynamic ip,ipx                Router
-        p5 = re.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) '
-                        r'+(?P<mac>[\w.]+) +(?P<entry_type>\w+) '
-                        r'+(?P<protocols>[\w\,]+) '
-                        r'+(?P<intfs>\S+|[^\s]+\s[^\s]+)$')
-        
-        for line in out.splitlines():
+        p5=r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) '
+           r'+(?P<mac>[\w.]+) +(?P<entry_type>\w+) '
+           r'+(?P<protocols>[\w\,]+) '
+           r'+(?P<intfs>\S+|[^\s]+\s[^\s]+)$',
+    )
+
+    def cli(self, vlan='', output=None):
+        if output is None:
+            # get output from device
+            if vlan:
+                out = self.device.execute(self.cli_command[1].format(vlan=vlan))
+            else:
+                out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        return self.records_to_dict(self._records(out.splitlines()))
+
+    def _records(self, lines):
+        '''yield a record per mac address and interface:
+            interfaces: vlan, mac_address and the fields of
+                mac_table/vlans/<vlan>/mac_addresses/<mac>/interfaces/<intf>
+            dropped: vlan, mac_address and the fields of
+                mac_table/vlans/<vlan>/mac_addresses/<mac>/drop
+            total: total_mac_addresses
+        '''
+        p = self.patterns
+
+        # vlan and mac address of the last entry, which the interfaces on
+        # the next lines belong to
+        vlan = mac = None
+        entry_type = entry = learn = age = ''
+
+        for line in lines:
             line = line.strip()
 
             # Total Mac Addresses for this criterion: 93
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
-                ret_dict.update({'total_mac_addresses': int(m.groupdict()['val'])})
+                yield {'total_mac_addresses': int(m.groupdict()['val'])}
                 continue
 
             # 10    aaaa.bbff.8888    STATIC      Gi1/0/8 Gi1/0/9
             # 20    aaaa.bbff.8888    STATIC      Drop
             # All    0100.0cff.999a    STATIC      CPU
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 mac = group['mac']
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    yield {'vlan': vlan,
+                           'mac_address': mac,
+                           'drop': True,
+                           'entry_type': group['entry_type'].lower()}
                     continue
 
                 for intf in intfs.replace(' ',',').split(','):
                     intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
                     entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
+                    record = {'vlan': vlan,
+                              'mac_address': mac,
+                              'interface': intf,
+                              'entry_type': entry_type}
                     if group['entry']:
                         entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
+                        record['entry'] = entry
+                    yield record
                 continue
 
             # Gi1/9,Gi1/10,Gi1/11,Gi1/12
             #               Router,Switch
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
+                if mac is None:
+                    # No entry to add the interfaces to
+                    continue
+
                 group = m.groupdict()
                 intfs = group['intfs'].strip()
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': entry_type})
+                    yield {'vlan': vlan,
+                           'mac_address': mac,
+                           'drop': True,
+                           'entry_type': entry_type}
                     continue
 
                 for intf in intfs.split(','):
                     intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
-                    intf_dict.update({'entry_type': entry_type})
+                    record = {'vlan': vlan,
+                              'mac_address': mac,
+                              'interface': intf,
+                              'entry_type': entry_type}
                     if entry:
-                        intf_dict.update({'entry': entry})
+                        record['entry'] = entry
                     if learn:
-                        intf_dict.update({'learn': learn})
+                        record['learn'] = learn
                     if age:
-                        intf_dict.update({'age': age})
+                        record['age'] = age
+                    yield record
                 continue
 
             # *  101  44dd.eeff.55bb   dynamic  Yes         10   Gi1/40
             # *  102  aa11.bbff.ee55    static  Yes          -   Gi1/2,Gi1/4,Gi1/5,Gi1/6
             # *  400  0000.0000.0000    static  No           -   vPC Peer-Link
             # *  ---  0000.0000.0000    static  No           -   Router
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 mac = group['mac']
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    yield {'vlan': vlan,
+                           'mac_address': mac,
+                           'drop': True,
+                           'entry_type': group['entry_type'].lower()}
                     continue
 
                 for intf in intfs.split(','):
                     intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
                     entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
+                    record = {'vlan': vlan,
+                              'mac_address': mac,
+                              'interface': intf,
+                              'entry_type': entry_type}
                     if group['entry']:
                         entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
+                        record['entry'] = entry
                     if group['learn']:
                         learn = group['learn']
-                        intf_dict.update({'learn': learn})
+                        record['learn'] = learn
                     if group['age']:
                         if group['age'].isdigit():
                             age = int(group['age'])
-                            intf_dict.update({'age': age})
+                            record['age'] = age
                         else:
                             age = None
+                    yield record
                 continue
 
             # 964    0000.0000.0000   dynamic ip,ipx                Router
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 mac = group['mac']
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    yield {'vlan': vlan,
+                           'mac_address': mac,
+                           'drop': True,
+                           'entry_type': group['entry_type'].lower()}
                     continue
 
                 for intf in intfs.replace(' ',',').split(','):
                     intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
                     entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
+                    record = {'vlan': vlan,
+                              'mac_address': mac,
+                              'interface': intf,
+                              'entry_type': entry_type}
                     if group['entry']:
                         entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
+                        record['entry'] = entry
 
                     if group['protocols']:
-                        intf_dict.update({'protocols': group['protocols'].split(',')})
+                        record['protocols'] = group['protocols'].split(',')
+                    yield record
                 continue
 
-        return ret_dict
+    def _add_record(self, ret_dict, record):
+        if 'mac_address' not in record:
+            ret_dict.update(record)
+            return
+
+        vlan = record['vlan']
+        mac = record['mac_address']
+        vlan_dict = ret_dict.setdefault('mac_table', {}) \
+            .setdefault('vlans', {}).setdefault(str(vlan), {})
+        vlan_dict['vlan'] = vlan
+        mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
+                            .setdefault(mac, {})
+        mac_dict['mac_address'] = mac
+
+        if 'drop' in record:
+            mac_dict.setdefault('drop', {}).update(
+                {'drop': record['drop'], 'entry_type': record['entry_type']})
+            return
+
+        intf_dict = mac_dict.setdefault('interfaces', {}) \
+                            .setdefault(record['interface'], {})
+        intf_dict.update(record)
+        del intf_dict['vlan'], intf_dict['mac_address']
 
 
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
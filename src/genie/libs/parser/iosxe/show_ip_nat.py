@@ -21,6 +21,8 @@ from genie.metaparser.util.schemaengine import (Schema,
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.stream import RecordParser
 
 
 class ShowIpNatTranslationsSchema(MetaParser):
@@ -61,7 +63,7 @@ class ShowIpNatTranslationsSchema(MetaParser):
     }
 
 
-class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
+class ShowIpNatTranslations(RecordParser, ShowIpNatTranslationsSchema):
     """
         * show ip nat translations
         * show ip nat translations verbose
@@ -74,21 +76,7 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
                    'show ip nat translations vrf {vrf}',
                    'show ip nat translations vrf {vrf} verbose']
 
-    def cli(self, vrf=None, option=None, output=None):
-        if output is None:
-            if option and vrf is None:
-                cmd = self.cli_command[1].format(verbose=option)
-            elif option and vrf:
-                cmd = self.cli_command[3].format(vrf=vrf, verbose=option)
-            elif vrf and option is None:
-                cmd = self.cli_command[2].format(vrf=vrf)
-            else:
-                cmd = self.cli_command[0]
-
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
+    patterns = PatternTable(
         # udp  10.5.5.1:1025          192.0.2.1:4000 --- ---
         # udp  10.5.5.1:1024          192.0.2.3:4000 --- ---
         # udp  10.5.5.1:1026          192.0.2.2:4000 --- ---
@@ -99,214 +87,178 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
         # tcp 172.16.94.209:1067  192.168.1.95:1067  172.16.196.161:23    172.16.196.161:23
         # icmp 10.10.140.200:66      10.10.40.100:66       10.10.140.110:66      10.10.140.110:66
         # any ---                ---                10.1.0.2          10.144.0.2
-        p1 = re.compile(r'^(?P<protocol>-+|udp|tcp|icmp|any) +(?P<inside_global>\S+) '
-                        r'+(?P<inside_local>\S+) +(?P<outside_local>\S+) '
-                        r'+(?P<outside_global>\S+)$')
-        
+        p1=r'^(?P<protocol>-+|udp|tcp|icmp|any) +(?P<inside_global>\S+) '
+           r'+(?P<inside_local>\S+) +(?P<outside_local>\S+) '
+           r'+(?P<outside_global>\S+)$',
+
         # create: 02/15/12 11:38:01, use: 02/15/12 11:39:02, timeout: 00:00:00
         # create 04/09/11 10:51:48, use 04/09/11 10:52:31, timeout: 00:01:00
-        p2 = re.compile(r'^create(?:\:)? +(?P<create>[\S ]+), '
-                        r'+use(?:\:)? +(?P<use>[\S ]+), +timeout(?:\:)? '
-                        r'+(?P<timeout>\S+)$')
+        p2=r'^create(?:\:)? +(?P<create>[\S ]+), '
+           r'+use(?:\:)? +(?P<use>[\S ]+), +timeout(?:\:)? '
+           r'+(?P<timeout>\S+)$',
 
-        # IOS-XE: 
+        # IOS-XE:
         # Map-Id(In): 1
-        # IOS: 
+        # IOS:
         # Map-Id(In):1, Mac-Address: 0000.0000.0000 Input-IDB: GigabitEthernet0/3/1
-        p3 = re.compile(r'^Map\-Id\(In\)[\:|\s]+(?P<map_id_in>\d+)(?:[\,|\s]'
-                        r'+Mac\-Address\: +(?P<mac_address>\S+) +Input\-IDB\: '
-                        r'+(?P<input_idb>\S+))?$')
+        p3=r'^Map\-Id\(In\)[\:|\s]+(?P<map_id_in>\d+)(?:[\,|\s]'
+           r'+Mac\-Address\: +(?P<mac_address>\S+) +Input\-IDB\: '
+           r'+(?P<input_idb>\S+))?$',
 
         # IOS-XE: Mac-Address: 0000.0000.0000    Input-IDB: TenGigabitEthernet1/1/0
-        p4 = re.compile(r'^Mac-Address: +(?P<mac_address>\S+) +Input-IDB: '
-                        r'+(?P<input_idb>\S+)$')
+        p4=r'^Mac-Address: +(?P<mac_address>\S+) +Input-IDB: '
+           r'+(?P<input_idb>\S+)$',
 
         # entry-id: 0x0, use_count:1
-        p5 = re.compile(r'^entry-id: +(?P<entry_id>\S+), '
-                        r'+use_count:+(?P<use_count>\d+)$')
+        p5=r'^entry-id: +(?P<entry_id>\S+), '
+           r'+use_count:+(?P<use_count>\d+)$',
 
         # Total number of translations: 3
-        p6 = re.compile(r'^Total +number +of +translations: '
-                        r'+(?P<number_of_translations>\d+)$')
-        
+        p6=r'^Total +number +of +translations: '
+           r'+(?P<number_of_translations>\d+)$',
+
         # Group_id:0   vrf: genie
-        p7 = re.compile(r'^Group_id\:(?P<group_id>\d+) +vrf\: +(?P<vrf_name>\S+)$')
+        p7=r'^Group_id\:(?P<group_id>\d+) +vrf\: +(?P<vrf_name>\S+)$',
 
         # Format(H:M:S) Time-left :0:0:-1
-        p8 = re.compile(r'^Format\S+ +Time\-left +\:(?P<time_left>\S+)$')
+        p8=r'^Format\S+ +Time\-left +\:(?P<time_left>\S+)$',
+    )
 
-        # initialize variables
-        ret_dict = {}
-        index_dict = {}
-        tmp_dict = {}
-        index = 1
-        m8_index = 1
-        vrf_name = ''
-        vrf_flag = False
+    def cli(self, vrf=None, option=None, output=None):
+        if output is None:
+            if option and vrf is None:
+                cmd = self.cli_command[1].format(verbose=option)
+            elif option and vrf:
+                cmd = self.cli_command[3].format(vrf=vrf, verbose=option)
+            elif vrf and option is None:
+                cmd = self.cli_command[2].format(vrf=vrf)
+            else:
+                cmd = self.cli_command[0]
 
-        for line in out.splitlines():
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        return self.records_to_dict(self._records(out.splitlines()))
+
+    def _records(self, lines):
+        '''yield a record per translation once all its lines are read:
+            translations: vrf, index and the fields of vrf/<vrf>/index/<index>
+            total: number_of_translations
+
+        A translation belongs to the vrf of its 'Group_id' line, or of the
+        last one seen before it, and to the default vrf if there is none.
+        '''
+        p = self.patterns
+
+        # translation being read
+        translation = None
+        index = 0
+        # vrf of the last 'Group_id' line
+        vrf_name = None
+
+        for line in lines:
             line = line.strip()
 
             # udp  10.5.5.1:1025          192.0.2.1:4000 --- ---
-            # udp  10.5.5.1:1024          192.0.2.3:4000 --- ---
-            # udp  10.5.5.1:1026          192.0.2.2:4000 --- ---
             # --- 172.16.94.209     192.168.1.95 --- ---
-            # --- 172.16.94.210     192.168.1.89 --- ---
-            # udp 172.16.94.209:1220  192.168.1.95:1220  172.16.169.132:53    172.16.169.132:53
-            # tcp 172.16.94.209:11012 192.168.1.89:11012 172.16.196.220:23    172.16.196.220:23
-            # tcp 172.16.94.209:1067  192.168.1.95:1067  172.16.196.161:23    172.16.196.161:23
             # any ---                ---                10.1.0.2          10.144.0.2
-            m1 = p1.match(line)
-            if m1:
-                group = m1.groupdict()
-                if 'vrf' in ret_dict:
-                    if vrf_flag:
-                        protocol_dict = index_dict.setdefault(index, {})
-                        protocol_dict.update(group)
-                        
-                    elif vrf_flag == False and index >= 2:
-                        default_dict = vrf_dict.setdefault('default', {})
-                        index_dict = default_dict.setdefault('index', {})
-                        protocol_dict = index_dict.setdefault(index, {})
-                        protocol_dict.update(group)
-                        
-                        if tmp_dict:
-                            default_dict = vrf_dict.setdefault('default', {})
-                            index_dict = default_dict.setdefault('index', {})
-                            protocol_dict = index_dict.setdefault(index, {})
-                            vrf_dict['default']['index'].update(tmp_dict)
-                            tmp_dict.clear()
-
-                else:
-                    vrf_dict = ret_dict.setdefault('vrf', {})
-
-                    itemp_dict = tmp_dict.setdefault(index, {})
+            m = p.p1.match(line)
+            if m:
+                if translation:
+                    translation.setdefault('vrf', vrf_name or 'default')
+                    yield translation
 
-                    itemp_dict.update(group)
-                    
-                    protocol_dict = index_dict.setdefault(index, {})
-                    
                 index += 1
+                translation = {'index': index}
+                translation.update(m.groupdict())
+                continue
+
+            # Total number of translations: 3
+            m = p.p6.match(line)
+            if m:
+                if translation:
+                    translation.setdefault('vrf', vrf_name or 'default')
+                    yield translation
+                    translation = None
+
+                yield {'number_of_translations':
+                       int(m.groupdict()['number_of_translations'])}
+                continue
 
+            if translation is None:
                 continue
-            
+
             # create: 02/15/12 11:38:01, use: 02/15/12 11:39:02, timeout: 00:00:00
             # create 04/09/11 10:51:48, use 04/09/11 10:52:31, timeout: 00:01:00
-            m2 = p2.match(line)
-            if m2:
-                group = m2.groupdict()
-                if protocol_dict:
-                    details_dict = protocol_dict.setdefault('details', {})
-                    details_dict.update(group)
-                        
-                else:
-                    tmp_details_dict = tmp_dict[1].setdefault('details', {})
-                    tmp_details_dict.update(group)
-
+            m = p.p2.match(line)
+            if m:
+                translation.setdefault('details', {}).update(m.groupdict())
                 continue
-            
-            # IOS-XE: 
+
+            # IOS-XE:
             # Map-Id(In): 1
-            # IOS: 
+            # IOS:
             # Map-Id(In):1, Mac-Address: 0000.0000.0000 Input-IDB: GigabitEthernet0/3/1
-            m3 = p3.match(line)
-            if m3:
-                group = m3.groupdict()
-
-                if protocol_dict:
-                    details_dict.update({'map_id_in': int(group['map_id_in'])})
-
-                    if group['mac_address']:
-                        details_dict.update({'mac_address': group['mac_address']})
-                    
-                    if group['input_idb']:
-                        details_dict.update({'input_idb': group['input_idb']})
+            m = p.p3.match(line)
+            if m:
+                group = m.groupdict()
+                details_dict = translation.setdefault('details', {})
+                details_dict.update({'map_id_in': int(group['map_id_in'])})
 
-                else:
-                    tmp_details_dict.update(
-                        {'mac_address': group['mac_address']})
-                    tmp_details_dict.update({'input_idb': group['input_idb']})
-                    tmp_details_dict.update(
-                        {'map_id_in': int(group['map_id_in'])})
+                if group['mac_address']:
+                    details_dict.update({'mac_address': group['mac_address']})
 
+                if group['input_idb']:
+                    details_dict.update({'input_idb': group['input_idb']})
                 continue
 
-            # IOS-XE: 
+            # IOS-XE:
             # Mac-Address: 0000.0000.0000    Input-IDB: TenGigabitEthernet1/1/0
-            m4 = p4.match(line)
-            if m4:
-                group = m4.groupdict()
-
-                if protocol_dict:
-                    details_dict.update(group)
-                else:
-                    tmp_details_dict.update(group)
-
+            m = p.p4.match(line)
+            if m:
+                translation.setdefault('details', {}).update(m.groupdict())
                 continue
-            
-            # entry-id: 0x0, use_count:1
-            m5 = p5.match(line)
-            if m5:
-                group = m5.groupdict()
-                if protocol_dict:
-                    details_dict.update({'entry_id': group['entry_id']})
-                    details_dict.update({'use_count': int(group['use_count'])})
-
-                else:
-                    tmp_details_dict.update({'entry_id': group['entry_id']})
-                    tmp_details_dict.update(
-                        {'use_count': int(group['use_count'])})
-
-                if tmp_dict:
-                    default_dict = vrf_dict.setdefault('default', {})
-                    index_dict = default_dict.setdefault('index', {})
-                    protocol_dict = index_dict.setdefault(index, {})   
-                    vrf_dict['default']['index'].update(tmp_dict)
-                    tmp_dict.clear()
-
-                continue
-            
-            # Total number of translations: 3
-            m6 = p6.match(line)
-            if m6:
-
-                anumber = int(m6.groupdict()['number_of_translations'])
-                total_dict = ret_dict.setdefault('vrf', {})
-                total_dict.update({'number_of_translations': anumber})
 
+            # entry-id: 0x0, use_count:1
+            m = p.p5.match(line)
+            if m:
+                group = m.groupdict()
+                details_dict = translation.setdefault('details', {})
+                details_dict.update({'entry_id': group['entry_id']})
+                details_dict.update({'use_count': int(group['use_count'])})
                 continue
 
             # Group_id:0   vrf: genie
-            m7 = p7.match(line)
-            if m7:
-                group = m7.groupdict()
+            m = p.p7.match(line)
+            if m:
+                group = m.groupdict()
                 vrf_name = group['vrf_name']
-                if tmp_dict:
-                    vrf_name_dict = vrf_dict.setdefault(group['vrf_name'], {})
-                    index_dict = vrf_name_dict.setdefault('index', {})
-                    tmp_dict[1].update({'group_id': int(group['group_id'])})
-                    vrf_flag = True
-
-                else:
-                    protocol_dict.update({'group_id': int(group['group_id'])})
-                
+                translation['vrf'] = vrf_name
+                translation['group_id'] = int(group['group_id'])
                 continue
 
             # Format(H:M:S) Time-left :0:0:-1
-            m8 = p8.match(line)
-            if m8:
-                time_left = m8.groupdict()['time_left']
-                if tmp_dict:
-                    m8_dict = vrf_name_dict.setdefault('index', {})
-                    tmp_dict[1].update({'time_left': time_left})
-                    vrf_dict[vrf_name]['index'].update(tmp_dict)
-                    tmp_dict.clear()
-                else:
-                    protocol_dict.update({'time_left': time_left})
-
+            m = p.p8.match(line)
+            if m:
+                translation['time_left'] = m.groupdict()['time_left']
                 continue
 
-        return ret_dict
+        if translation:
+            translation.setdefault('vrf', vrf_name or 'default')
+            yield translation
+
+    def _add_record(self, ret_dict, record):
+        vrf_dict = ret_dict.setdefault('vrf', {})
+        if 'index' not in record:
+            vrf_dict.update(record)
+            return
+
+        index_dict = vrf_dict.setdefault(record['vrf'], {}) \
+                             .setdefault('index', {}) \
+                             .setdefault(record['index'], {})
+        index_dict.update(record)
+        del index_dict['vrf'], index_dict['index']
 
 
 class ShowIpNatStatisticsSchema(MetaParser):
@@ -40,6 +40,7 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.incremental import IncrementalParser
 
 # ===========================================================
 # Schema for:
@@ -6367,7 +6368,8 @@ class ShowIpOspfDatabaseRouterSchema(MetaParser):
 # Parser for:
 #   * 'show ip ospf database router'
 # ==================================
-class ShowIpOspfDatabaseRouter(ShowIpOspfDatabaseRouterSchema, ShowIpOspfDatabaseTypeParser):
+class ShowIpOspfDatabaseRouter(IncrementalParser, ShowIpOspfDatabaseRouterSchema,
+                               ShowIpOspfDatabaseTypeParser):
 
     ''' Parser for:
         * 'show ip ospf database router'
@@ -6376,6 +6378,17 @@ class ShowIpOspfDatabaseRouter(ShowIpOspfDatabaseRouterSchema, ShowIpOspfDatabas
     cli_command = 'show ip ospf database router'
     exclude = ['age', 'seq_num', 'checksum', 'links']
 
+    # LS age: 1565
+    record_start = r'^LS +age:'
+
+    # Routing Bit Set on this LSA
+    record_lead = (r'^Routing +Bit +Set +on +this +LSA$',)
+
+    # OSPF Router with ID (10.36.3.3) (Process ID 1)
+    # Router Link States (Area 0)
+    record_context = (r'^OSPF +Router +with +ID',
+                      r'^.* +Link +States(?: +\(Area +\S+\))?$')
+
 
     def cli(self, output=None):
         if not output:
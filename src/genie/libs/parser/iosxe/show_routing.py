@@ -8,6 +8,16 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.dispatch import LineDispatcher
+from genie.libs.parser.utils.stream import RecordParser, StreamParser
+
+
+def _source_protocols(protocol_codes):
+    '''return route code -> source protocol from protocol -> route codes'''
+    return {code: protocol for protocol, codes in protocol_codes.items()
+            for code in codes}
+
 
 # ====================================================
 #  distributor class for show ip route
@@ -176,7 +186,7 @@ class ShowIpRouteSchema(MetaParser):
 # ====================================================
 #  parser for show ip route
 # ====================================================
-class ShowIpRoute(ShowIpRouteSchema):
+class ShowIpRoute(RecordParser, ShowIpRouteSchema):
     """Parser for :
         show ip route
         show ip route vrf <vrf>"""
@@ -186,6 +196,122 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = ['updated']
     IP_VER='ipv4'
 
+    # route code -> source protocol
+    source_protocols = _source_protocols({
+        'ospf': ['O','IA','N1','N2','E1','E2'],
+        'odr': ['o'],
+        'isis': ['i','su','L1','L2','ia', 'I1', 'I2'],
+        'eigrp': ['D','EX'],
+        'static': ['S'],
+        'mobile': ['M'],
+        'rip': ['R'],
+        'lisp': ['I', 'Ir','Ia','Id'],
+        'nhrp': ['H'],
+        'local': ['L'],
+        'connected': ['C'],
+        'local_connected': ['LC'],
+        'bgp': ['B'],
+    })
+
+    patterns = PatternTable(
+        # Routing Table: VRF1
+        # Routing Table: VRF-infra
+        p1=r'^Routing Table: +(?P<vrf>[\w?-]+)$',
+
+        # 10.1.0.0/32 is subnetted, 1 subnets
+        # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
+        p2=r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
+           r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$',
+
+        # C        10.4.1.1 is directly connected, Loopback0
+        # S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+        # S*       10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+        # O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
+        # i L1     10.151.22.22 [115/20] via 10.186.2.2, 06:47:04, GigabitEthernet0/1
+        # D        192.168.205.1
+        # S*       0.0.0.0/0 [1/0] via 10.50.15.1
+        p3=r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[0-9\.\:\/]+)?( '
+           r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
+           r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$',
+
+        # L        FF00::/8 [0/0]
+        p3_ipv6=r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[\w\.\:\/]+)?( '
+                r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
+                r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$',
+
+        #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
+        p4=r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
+           r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$',
+
+        #       is directly connected, GigabitEthernet0/2
+        p5=r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
+           r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
+           r'( +(?P<interface>[\S]+))?$',
+
+        #      via 2001:DB8:1:1::2
+        #      via 10.4.1.1%default, indirectly connected
+        #      via 2001:DB8:4:6::6
+        #      via 2001:DB8:20:4:6::6%VRF2
+        #      via Null0, receive
+        p6=r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
+           r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
+           r'( +directly connected)?( +indirectly connected)?$',
+
+        # Routing entry for 10.151.0.0/24, 1 known subnets
+        # Routing entry for 0.0.0.0/0, supernet
+        # Routing entry for 192.168.154.0/24
+        p100=r'^Routing +entry +for +'
+              '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
+              '(, +(?P<net>[\w\s]+))?$',
+
+        # Known via "eigrp 1", distance 130, metric 10880, type internal
+        # Known via "rip", distance 120, metric 2
+        p200=r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
+              'distance +(?P<distance>\d+), +'
+              'metric +(?P<metric>\d+)'
+              '(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$',
+
+        # Redistributing via rip
+        # Redistributing via eigrp 1
+        p300=r'^Redistributing +via +(?P<redist_via>\w+) *'
+              '(?P<redist_via_tag>\d+)?$',
+
+        # Last update from 192.168.151.2 on Vlan101, 2w3d ago
+        # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
+        p400=r'^Last +update +from +(?P<from>[\w\.]+) +'
+              'on +(?P<interface>[\w\.\/\-]+), +'
+              '(?P<age>[\w\.\:]+) +ago$',
+
+        # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
+        # * 10.69.1.2
+        p500=r'^\*? *(?P<nexthop>[\w\.]+)(, +'
+              'from +(?P<from>[\w\.]+), +'
+              '(?P<age>[\w\.\:]+) +ago, +'
+              'via +(?P<interface>[\w\.\/\-]+))?$',
+
+        # Route metric is 10880, traffic share count is 1
+        p600=r'^Route +metric +is +(?P<metric>\d+), +'
+              'traffic +share +count +is +(?P<share_count>\d+)$',
+
+        # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
+        p700=r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
+              '+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$',
+
+        # Reliability 255/255, minimum MTU 1500 bytes
+        p800=r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$',
+
+        # Loading 1/255, Hops 1
+        p900=r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$',
+    )
+
+    # Patterns tried for a line, in this order, per IP_VER
+    dispatch_ipv4 = LineDispatcher(patterns, [
+        'p1', 'p2', 'p3', 'p4', 'p5', 'p6', 'p100', 'p200', 'p300',
+        'p400', 'p500', 'p600', 'p700', 'p800', 'p900'])
+    dispatch_ipv6 = LineDispatcher(patterns, [
+        'p1', 'p2', 'p3_ipv6', 'p4', 'p5', 'p6', 'p100', 'p200', 'p300',
+        'p400', 'p500', 'p600', 'p700', 'p800', 'p900'])
+
     def cli(self, vrf=None, protocol=None, output=None):
 
         if output is None:
@@ -201,328 +327,128 @@ class ShowIpRoute(ShowIpRouteSchema):
         else:
             out = output
 
+        return self.records_to_dict(self._records(out.splitlines(), vrf=vrf))
+
+    def _records(self, lines, vrf=None):
+        '''yield a record per line of a route: vrf, address_family, route
+        and the fields of vrf/<vrf>/address_family/<af>/routes/<route> found
+        on the line, with the next hop of the line in next_hop.
+
+        A route is on several lines when it has several next hops, each line
+        adding its next hop to the route.
+        '''
         af = self.IP_VER
         route = ""
         if not vrf:
             vrf = 'default'
 
-        source_protocol_dict = {}
-        source_protocol_dict['ospf'] = ['O','IA','N1','N2','E1','E2']
-        source_protocol_dict['odr'] = ['o']
-        source_protocol_dict['isis'] = ['i','su','L1','L2','ia', 'I1', 'I2']
-        source_protocol_dict['eigrp'] = ['D','EX']
-        source_protocol_dict['static'] = ['S']
-        source_protocol_dict['mobile'] = ['M']
-        source_protocol_dict['rip'] = ['R']
-        source_protocol_dict['lisp'] = ['I', 'Ir','Ia','Id']
-        source_protocol_dict['nhrp'] = ['H']
-        source_protocol_dict['local'] = ['L']
-        source_protocol_dict['connected'] = ['C']
-        source_protocol_dict['local_connected'] = ['LC']
-        source_protocol_dict['bgp'] = ['B']
-
-        result_dict = {}
+        source_protocols = self.source_protocols
+        dispatch = getattr(self, 'dispatch_' + self.IP_VER)
 
-        # initial regexp pattern
-        p100 = re.compile(r'^Routing +entry +for +'
-                        '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
-                        '(, +(?P<net>[\w\s]+))?$')
-        p200 = re.compile(r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
-                        'distance +(?P<distance>\d+), +'
-                        'metric +(?P<metric>\d+)'
-                        '(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$')
-        p300 = re.compile(r'^Redistributing +via +(?P<redist_via>\w+) *'
-                        '(?P<redist_via_tag>\d+)?$')
-        p400 = re.compile(r'^Last +update +from +(?P<from>[\w\.]+) +'
-                        'on +(?P<interface>[\w\.\/\-]+), +'
-                        '(?P<age>[\w\.\:]+) +ago$')
-        p500 = re.compile(r'^\*? *(?P<nexthop>[\w\.]+)(, +'
-                        'from +(?P<from>[\w\.]+), +'
-                        '(?P<age>[\w\.\:]+) +ago, +'
-                        'via +(?P<interface>[\w\.\/\-]+))?$')
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                        'traffic +share +count +is +(?P<share_count>\d+)$')
-
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                          'traffic +share +count +is +(?P<share_count>\d+)$')
-        p700 = re.compile(r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
-                          '+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$')
-        p800 = re.compile(r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$')
-        p900 = re.compile(r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$')
+        # vrf and route of the detail lines, and of their next hop
+        route_key = path_key = None
 
         # initial variables
-        ret_dict = {}
         index = 0
+        source_protocol = source_protocol_codes = None
 
-        for line in out.splitlines():
-            if line:
-                line = line.strip()
-            else:
+        for line in lines:
+            line = line.strip()
+            if not line:
                 continue
 
+            # Single pass, only the patterns which can match the line are
+            # tried
+            name, m = dispatch.match(line)
+            if m is None:
+                continue
+
+            group = m.groupdict()
             next_hop = interface = updated = metrics = route_preference = ""
+
             # Routing Table: VRF1
-            # Routing Table: VRF-infra
-            p1 = re.compile(r'^Routing Table: +(?P<vrf>[\w?-]+)$')
-            m = p1.match(line)
-            if m:
-                vrf = m.groupdict()['vrf']
+            if name == 'p1':
+                vrf = group['vrf']
                 continue
 
-            # 10.1.0.0/32 is subnetted, 1 subnets
             # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
-            p2 = re.compile(r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
-                            r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
-            m = p2.match(line)
-            if m:
+            if name == 'p2':
                 # if you see the issue by "show ip route", it means that active is True.
                 # it means all routes in the output should be active=True
                 active = True
-                netmask = number_of_masks= ""
-                number_of_subnets = m.groupdict()['number_of_subnets']
-                if m.groupdict()['number_of_masks']:
-                    number_of_masks = m.groupdict()['number_of_masks']
-
-                if m.groupdict()['subnetted_ip']:
-                    subnetted_ip = m.groupdict()['subnetted_ip']
-                    if '/' in subnetted_ip:
-                        netmask = subnetted_ip.split('/')[1]
+                netmask = ""
+                subnetted_ip = group['subnetted_ip']
+                if subnetted_ip and '/' in subnetted_ip:
+                    netmask = subnetted_ip.split('/')[1]
                 continue
 
-            # C        10.4.1.1 is directly connected, Loopback0
-            # S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
-            # S*       10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
             # O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
-            # i L1     10.151.22.22 [115/20] via 10.186.2.2, 06:47:04, GigabitEthernet0/1
-            # D        192.168.205.1
-            # S*       0.0.0.0/0 [1/0] via 10.50.15.1
-            # L        FF00::/8 [0/0]
-            if self.IP_VER == 'ipv4':
-                p3 = re.compile(
-                    r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[0-9\.\:\/]+)?( '
-                    r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
-                    r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-            else:
-                p3 = re.compile(
-                    r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[\w\.\:\/]+)?( '
-                    r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
-                    r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-
-            m = p3.match(line)
-            if m:
-                active = True
-                if m.groupdict()['code']:
-                    source_protocol_codes = m.groupdict()['code'].strip()
-                    for key,val in source_protocol_dict.items():
-                        source_protocol_replaced = source_protocol_codes.split('*')[0]
-                        if source_protocol_replaced in val:
-                            source_protocol = key
-
-                if m.groupdict()['code1']:
-                    source_protocol_codes = '{} {}'.format(source_protocol_codes, m.groupdict()['code1'])
-
-                if m.groupdict()['network']:
-                    network = m.groupdict()['network']
-                    if '/' in network:
-                        route = network
-                    else:
-                        route = '{}/{}'.format(network,netmask)
-
-                if not m.groupdict()['network']:
-                    route = route
-
-                if m.groupdict()['route_preference']:
-                    routepreference = m.groupdict()['route_preference']
-                    if '/' in routepreference:
-                        route_preference = routepreference.split('/')[0]
-                        metrics = routepreference.split('/')[1]
-
-                if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
-                    index = 1
-                else:
-                    index = 0
-
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
-
-                if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
-
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
-
-                route_dict['route'] = route
-                route_dict['active'] = active
-
-                if metrics:
-                    route_dict['metric'] = int(metrics)
-                if route_preference:
-                    route_dict['route_preference'] = int(route_preference)
-                if source_protocol_codes:
-                    route_dict['source_protocol_codes'] = source_protocol_codes
-                    route_dict['source_protocol'] = source_protocol
-
-                next_hop_dict = route_dict.setdefault('next_hop', {})
-
-                if not next_hop and interface:
-                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
-
-                elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                    idx_dict['index'] = index
-                    idx_dict['next_hop'] = next_hop
-
-                    if updated:
-                        idx_dict['updated'] = updated
-                    if interface:
-                        idx_dict['outgoing_interface'] = interface
-
-                continue
-
-            #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
-            p4 = re.compile(r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
-                            r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$')
-            m = p4.match(line)
-            if m:
-                routepreference = m.groupdict()['route_preference']
-                if routepreference and '/' in routepreference:
-                    route_preference = routepreference.split('/')[0]
-                    metrics = routepreference.split('/')[1]
-
-                next_hop = m.groupdict()['next_hop']
-                index +=1
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
-
-                if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
-
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
-
-                route_dict['route'] = route
-                route_dict['active'] = active
-
-                if metrics:
-                    route_dict['metric'] = int(metrics)
-                if route_preference:
-                    route_dict['route_preference'] = int(route_preference)
-                if source_protocol_codes:
-                    route_dict['source_protocol_codes'] = source_protocol_codes
-                    route_dict['source_protocol'] = source_protocol
-
-                next_hop_dict = route_dict.setdefault('next_hop', {})
-
-                if not next_hop and interface:
-                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
-
-                elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                    idx_dict['index'] = index
-                    idx_dict['next_hop'] = next_hop
-
-                    if updated:
-                        idx_dict['updated'] = updated
-                    if interface:
-                        idx_dict['outgoing_interface'] = interface
-
-                continue
-
-            #       is directly connected, GigabitEthernet0/2
-            p5 = re.compile(r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
-                            r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
-                            r'( +(?P<interface>[\S]+))?$')
-            m = p5.match(line)
-            if m:
-
-                if m.groupdict()['route_preference']:
-                    routepreference = m.groupdict()['route_preference']
-                    if '/' in routepreference:
-                        route_preference = routepreference.split('/')[0]
-                        metrics = routepreference.split('/')[1]
-
-                index += 1
-                if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
-                if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
-
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
-
-                route_dict['route'] = route
-
-                if metrics:
-                    route_dict['metric'] = int(metrics)
-                if route_preference:
-                    route_dict['route_preference'] = int(route_preference)
-
-                next_hop_dict = route_dict.setdefault('next_hop', {})
-
-                if not next_hop and interface:
-                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
-
-                elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                    idx_dict['index'] = index
-                    idx_dict['next_hop'] = next_hop
-
-                    if updated:
-                        idx_dict['updated'] = updated
-                    if interface:
-                        idx_dict['outgoing_interface'] = interface
-
-                continue
-
-            #      via 2001:DB8:1:1::2
-            #      via 10.4.1.1%default, indirectly connected
-            #      via 2001:DB8:4:6::6
-            #      via 2001:DB8:20:4:6::6%VRF2
-            #      via Null0, receive
-            p6 = re.compile(r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
-                            r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
-                            r'( +directly connected)?( +indirectly connected)?$')
-            m = p6.match(line)
-            if m:
+            # [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
+            # is directly connected, GigabitEthernet0/2
+            # via 10.4.1.1%default, indirectly connected
+            if name in ('p3', 'p3_ipv6', 'p4', 'p5', 'p6'):
                 vrf_val = ''
-                tmp_next_hop = m.groupdict()['next_hop']
-                if tmp_next_hop:
-                    if '%' in  tmp_next_hop:
+                if name in ('p3', 'p3_ipv6'):
+                    active = True
+                    source_protocol_codes = group['code'].strip()
+                    # an unknown code keeps the protocol of the previous route
+                    source_protocol = source_protocols.get(
+                        source_protocol_codes.split('*')[0], source_protocol)
+
+                    if group['code1']:
+                        source_protocol_codes = '{} {}'.format(source_protocol_codes, group['code1'])
+
+                    network = group['network']
+                    if network:
+                        if '/' in network:
+                            route = network
+                        else:
+                            route = '{}/{}'.format(network,netmask)
+
+                    index = 1 if group['next_hop'] else 0
+                elif name == 'p6':
+                    tmp_next_hop = group['next_hop']
+                    if tmp_next_hop:
                         next_hop = tmp_next_hop.split('%')[0]
-                        vrf_val = tmp_next_hop.split('%')[1]
-                    else:
-                        next_hop = tmp_next_hop
+                        if '%' in tmp_next_hop:
+                            vrf_val = tmp_next_hop.split('%')[1]
+                    index += 1
+                else:
+                    index += 1
 
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                if name != 'p6':
+                    routepreference = group['route_preference']
+                    if routepreference and '/' in routepreference:
+                        route_preference, metrics = routepreference.split('/')[:2]
+                    if group['next_hop']:
+                        next_hop = group['next_hop']
+                    if group['date']:
+                        updated = group['date']
 
-                index += 1
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                if group['interface']:
+                    interface = group['interface']
 
-                route_dict['route'] = route
-                route_dict['active'] = active
+                route_key = (vrf, route)
+                record = {'vrf': vrf, 'address_family': af, 'route': route}
+                if name != 'p5':
+                    record['active'] = active
 
-                next_hop_dict = route_dict.setdefault('next_hop', {})
+                if name != 'p6':
+                    if metrics:
+                        record['metric'] = int(metrics)
+                    if route_preference:
+                        record['route_preference'] = int(route_preference)
+                    if name != 'p5' and source_protocol_codes:
+                        record['source_protocol_codes'] = source_protocol_codes
+                        if source_protocol:
+                            record['source_protocol'] = source_protocol
 
                 if not next_hop and interface:
-                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
+                    record['next_hop'] = {'outgoing_interface': {
+                        interface: {'outgoing_interface': interface}}}
 
                 elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                    idx_dict['index'] = index
-                    idx_dict['next_hop'] = next_hop
+                    idx_dict = {'index': index, 'next_hop': next_hop}
 
                     if updated:
                         idx_dict['updated'] = updated
@@ -530,93 +456,123 @@ class ShowIpRoute(ShowIpRouteSchema):
                         idx_dict['outgoing_interface'] = interface
                     if vrf_val:
                         idx_dict['vrf'] = vrf_val
+                    record['next_hop'] = {'next_hop_list': {index: idx_dict}}
+
+                else:
+                    record['next_hop'] = {}
 
+                yield record
                 continue
 
             # Routing entry for 10.151.0.0/24, 1 known subnets
             # Routing entry for 0.0.0.0/0, supernet
             # Routing entry for 192.168.154.0/24
-            m = p100.match(line)
-            if m:
-                group = m.groupdict()
-                entry_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}).setdefault('address_family',
-                                                                                              {}).setdefault(af, {})
-                route_dict = entry_dict.setdefault('routes', {}).setdefault(route, {})
-                route_dict.update({'route': group['ip']})
-                route_dict.update({'mask': group['mask']})
-                route_dict.update({'active': True})
+            if name == 'p100':
+                route_key = (vrf, group['ip'])
+                yield {'vrf': vrf,
+                       'address_family': af,
+                       'route': group['ip'],
+                       'mask': group['mask'],
+                       'active': True}
+                continue
+
+            # The next lines complete the route of the last entry
+            if route_key is None:
                 continue
+            record = {'vrf': route_key[0],
+                      'address_family': af,
+                      'route': route_key[1]}
 
             # Known via "eigrp 1", distance 130, metric 10880, type internal
             # Known via "rip", distance 120, metric 2
-            m = p200.match(line)
-            if m:
-                group = m.groupdict()
-                route_dict.update({'distance': int(group['distance'])})
-                route_dict.update({'metric': int(group['metric'])})
+            if name == 'p200':
+                record.update({'distance': int(group['distance'])})
+                record.update({'metric': int(group['metric'])})
                 if group['type']:
-                    route_dict.update({'type': group['type']})
+                    record.update({'type': group['type']})
+                yield record
                 continue
 
             # Redistributing via rip
             # Redistributing via eigrp 1
-            m = p300.match(line)
-            if m:
-                group = m.groupdict()
-                route_dict.update({k: v for k, v in group.items() if v})
+            if name == 'p300':
+                record.update({k: v for k, v in group.items() if v})
+                yield record
                 continue
 
             # Last update from 192.168.151.2 on Vlan101, 2w3d ago
             # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
-            m = p400.match(line)
-            if m:
-                group = m.groupdict()
-                update_dict = route_dict.setdefault('update', {})
-                update_dict.update({k: v for k, v in group.items() if v})
+            if name == 'p400':
+                record['update'] = {k: v for k, v in group.items() if v}
+                yield record
                 continue
 
             # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
             # * 10.69.1.2
-            m = p500.match(line)
-            if m:
-                group = m.groupdict()
+            if name == 'p500':
                 index += 1
-                path_dict = route_dict.setdefault('next_hop',{}).setdefault('next_hop_list', {}).setdefault(index, {})
-                path_dict.update({'index': index})
-                path_dict.update({'next_hop': group['nexthop']})
-                path_dict.update({'age': group['age']})
-                path_dict.update({'from': group['from']})
-                path_dict.update({'outgoing_interface': group['interface']})
+                path_key = route_key + (index,)
+                record['next_hop'] = {'next_hop_list': {index: {
+                    'index': index,
+                    'next_hop': group['nexthop'],
+                    'age': group['age'],
+                    'from': group['from'],
+                    'outgoing_interface': group['interface']}}}
+                yield record
                 continue
 
             # Route metric is 10880, traffic share count is 1
-            m = p600.match(line)
-            if m:
-                group = m.groupdict()
-                path_dict.update({k: v for k, v in group.items() if v})
-
             # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
-            m = p700.match(line)
-            if m:
-                group = m.groupdict()
-                path_dict.update({k: v for k, v in group.items() if v})
-                continue
-
             # Reliability 255/255, minimum MTU 1500 bytes
-            m = p800.match(line)
-            if m:
-                group = m.groupdict()
-                path_dict.update({k: v for k, v in group.items() if v})
-                continue
-
             # Loading 1/255, Hops 1
-            m = p900.match(line)
-            if m:
-                group = m.groupdict()
-                path_dict.update({k: v for k, v in group.items() if v})
-                continue
-
-        return result_dict
+            if path_key is None:
+                continue
+            yield {'vrf': path_key[0],
+                   'address_family': af,
+                   'route': path_key[1],
+                   'next_hop': {'next_hop_list': {path_key[2]: {
+                       k: v for k, v in group.items() if v}}}}
+
+    def _add_record(self, result_dict, record):
+        try:
+            routes_dict = result_dict['vrf'][record['vrf']]['address_family']\
+                                     [record['address_family']]['routes']
+        except KeyError:
+            routes_dict = result_dict.setdefault('vrf', {})\
+                                     .setdefault(record['vrf'], {})\
+                                     .setdefault('address_family', {})\
+                                     .setdefault(record['address_family'], {})\
+                                     .setdefault('routes', {})
+
+        route_dict = routes_dict.get(record['route'])
+        if route_dict is None:
+            # First line of the route
+            route_dict = routes_dict[record['route']] = dict(record)
+            del route_dict['vrf'], route_dict['address_family']
+            return
+
+        next_hop_dict = route_dict.get('next_hop')
+        update_dict = route_dict.get('update')
+
+        route_dict.update(record)
+        del route_dict['vrf'], route_dict['address_family']
+
+        next_hop = record.get('next_hop')
+        if next_hop is not None:
+            if next_hop_dict is None:
+                next_hop_dict = {}
+            route_dict['next_hop'] = next_hop_dict
+            for kind, entries in next_hop.items():
+                kind_dict = next_hop_dict.setdefault(kind, {})
+                for entry, entry_value in entries.items():
+                    kind_dict.setdefault(entry, {}).update(entry_value)
+
+        update = record.get('update')
+        if update is not None:
+            if update_dict is None:
+                update_dict = {}
+            route_dict['update'] = update_dict
+            update_dict.update(update)
 
 class ShowIpv6Route(ShowIpRoute):
     """Parser for:
@@ -697,7 +653,7 @@ class ShowIpv6RouteUpdatedSchema(MetaParser):
 # ====================================================
 #  parser for show ipv6 route updated
 # ====================================================
-class ShowIpv6RouteUpdated(ShowIpv6RouteUpdatedSchema):
+class ShowIpv6RouteUpdated(StreamParser, ShowIpv6RouteUpdatedSchema):
     """Parser for :
        show ipv6 route updated
        show ipv6 route vrf <vrf> updated"""
@@ -705,6 +661,55 @@ class ShowIpv6RouteUpdated(ShowIpv6RouteUpdatedSchema):
 
     cli_command = ['show ipv6 route vrf {vrf} updated', 'show ipv6 route updated']
 
+    # route code -> source protocol
+    source_protocols = _source_protocols({
+        'ospf': ['O','OI','ON1','ON2','OE1','OE2'],
+        'isis': ['IS','I1','I2','IA'],
+        'eigrp': ['D','EX'],
+        'static': ['S'],
+        'mobile': ['M'],
+        'rip': ['R'],
+        'lisp': ['Ir','Ia','Id'],
+        'nhrp': ['H'],
+        'local': ['L'],
+        'connected': ['C'],
+        'bgp': ['B'],
+        'static route': ['U'],
+        'home agent': ['HA'],
+        'mobile router': ['MR'],
+        'nemo': ['NM'],
+        'nd': ['ND','NDp'],
+        'destination': ['DCE'],
+        'redirect': ['NDr'],
+    })
+
+    patterns = PatternTable(
+        # IPv6 Routing Table - default - 23 entries
+        # IPv6 Routing Table - VRF1 - 104 entries
+        p1=r'^\s*IPv6 +Routing +Table +\- +(?P<vrf>[\w]+) +\- +(?P<entries>[\d]+) +entries$',
+
+        # LC  2001:1:1:1::1/128 [0/0]
+        p2=r'^\s*(?P<code>[\w]+) +(?P<route>[\w\/\:]+)?'
+            ' +\[(?P<route_preference>[\d\/]+)\]$',
+
+        #   via Loopback0, receive
+        #   via 2001:10:1:2::2, GigabitEthernet0/0
+        #   via GigabitEthernet0/2, directly connected
+        #   via 192.168.51.1%default, indirectly connected
+        p3=r'^\s*via( +(?P<next_hop>[0-9][\w\:\.\%]+),?)?'
+            '( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?( +directly connected)?( +indirectly connected)?$',
+
+        #   via FE80::211:1FF:FE00:1, GigabitEthernet0/0/2.100
+        p4=r'^\s*via +(?P<next_hop>[\w\:\.\%]+),'
+            ' +(?P<interface>[\S]+)$',
+
+        #      Last updated 14:15:23 06 December 2017
+        p5=r'^\s*Last +updated +(?P<last_updated>[\S\s]+)$',
+    )
+
+    # Patterns tried for a line, in this order
+    dispatch = LineDispatcher(patterns)
+
     def cli(self, vrf=None, output=None):
         if output is None:
             if vrf:
@@ -719,285 +724,114 @@ class ShowIpv6RouteUpdated(ShowIpv6RouteUpdatedSchema):
         af = 'ipv6'
         route = ""
         next_hop = interface = metrics = route_preference = ""
-        source_protocol_dict = {}
-        source_protocol_dict['ospf'] = ['O','OI','ON1','ON2','OE1','OE2']
-        source_protocol_dict['isis'] = ['IS','I1','I2','IA']
-        source_protocol_dict['eigrp'] = ['D','EX']
-        source_protocol_dict['static'] = ['S']
-        source_protocol_dict['mobile'] = ['M']
-        source_protocol_dict['rip'] = ['R']
-        source_protocol_dict['lisp'] = ['Ir','Ia','Id']
-        source_protocol_dict['nhrp'] = ['H']
-        source_protocol_dict['local'] = ['L']
-        source_protocol_dict['connected'] = ['C']
-        source_protocol_dict['bgp'] = ['B']
-        source_protocol_dict['static route'] = ['U']
-        source_protocol_dict['home agent'] = ['HA']
-        source_protocol_dict['mobile router'] = ['MR']
-        source_protocol_dict['nemo'] = ['NM']
-        source_protocol_dict['nd'] = ['ND','NDp']
-        source_protocol_dict['destination'] = ['DCE']
-        source_protocol_dict['redirect'] = ['NDr']
+        source_protocols = self.source_protocols
+        dispatch = self.dispatch
 
         result_dict = {}
+        # routes of the current vrf, created with its first route
+        routes_dict = None
+
         for line in out.splitlines():
-            if line:
-                line = line.rstrip()
-            else:
+            line = line.rstrip()
+
+            # Single pass, only the patterns which can match the line are
+            # tried
+            name, m = dispatch.match(line)
+            if m is None:
                 continue
 
-            # IPv6 Routing Table - default - 23 entries
+            group = m.groupdict()
+
             # IPv6 Routing Table - VRF1 - 104 entries
-            p1 = re.compile(r'^\s*IPv6 +Routing +Table +\- +(?P<vrf>[\w]+) +\- +(?P<entries>[\d]+) +entries$')
-            m = p1.match(line)
-            if m:
-                vrf = m.groupdict()['vrf']
+            if name == 'p1':
+                vrf = group['vrf']
+                routes_dict = result_dict.get('vrf', {}).get(vrf, {})\
+                                         .get('address_family', {}).get(af, {})\
+                                         .get('routes')
                 continue
 
             # LC  2001:1:1:1::1/128 [0/0]
-            p2 = re.compile(r'^\s*(?P<code>[\w]+) +(?P<route>[\w\/\:]+)?'
-                            ' +\[(?P<route_preference>[\d\/]+)\]$')
-            m = p2.match(line)
-            if m:
+            if name == 'p2':
                 active = True
                 next_hop = interface = ""
-                if m.groupdict()['code']:
-                    source_protocol_codes = m.groupdict()['code'].strip()
+                source_protocol_codes = group['code'].strip()
+                if source_protocol_codes in source_protocols:
+                    source_protocol = source_protocols[source_protocol_codes]
+                elif 'L' in source_protocol_codes:
+                    source_protocol = 'local'
 
-                    for key, val in source_protocol_dict.items():
-                        if source_protocol_codes in val:
-                            source_protocol = key
-                            break
-                        else:
-                            if 'L' in source_protocol_codes:
-                                source_protocol = 'local'
-                            # else:
-                            #    source_protocol = source_protocol_codes
-
-                if m.groupdict()['route']:
-                    route = m.groupdict()['route']
-
-                if m.groupdict()['route_preference']:
-                    routepreference = m.groupdict()['route_preference']
-                    if '/' in routepreference:
-                        route_preference = routepreference.split('/')[0]
-                        metrics = routepreference.split('/')[1]
+                if group['route']:
+                    route = group['route']
+
+                routepreference = group['route_preference']
+                if '/' in routepreference:
+                    route_preference = routepreference.split('/')[0]
+                    metrics = routepreference.split('/')[1]
                 index = 1
 
                 if vrf:
-                    if 'vrf' not in result_dict:
-                        result_dict['vrf'] = {}
-
-                    if vrf not in result_dict['vrf']:
-                        result_dict['vrf'][vrf] = {}
-
-                    if 'address_family' not in result_dict['vrf'][vrf]:
-                        result_dict['vrf'][vrf]['address_family'] = {}
-
-                    if af and af not in result_dict['vrf'][vrf]['address_family']:
-                        result_dict['vrf'][vrf]['address_family'][af] = {}
+                    if routes_dict is None:
+                        routes_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+                                                 .setdefault('address_family', {}).setdefault(af, {})\
+                                                 .setdefault('routes', {})
+                    route_dict = routes_dict.setdefault(route, {})
 
-                    if 'routes' not in result_dict['vrf'][vrf]['address_family'][af]:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'] = {}
-                    if route not in result_dict['vrf'][vrf]['address_family'][af]['routes']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] = {}
-
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['route'] = route
-
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                        ['active'] = active
+                    route_dict['route'] = route
+                    route_dict['active'] = active
 
                     if metrics:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['metric'] = int(metrics)
+                        route_dict['metric'] = int(metrics)
                     if route_preference:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['route_preference'] = int(route_preference)
+                        route_dict['route_preference'] = int(route_preference)
                     if source_protocol_codes:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['source_protocol_codes'] = source_protocol_codes
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['source_protocol'] = source_protocol
+                        route_dict['source_protocol_codes'] = source_protocol_codes
+                        route_dict['source_protocol'] = source_protocol
                 continue
 
-            #   via Loopback0, receive
-            #   via 2001:10:1:2::2, GigabitEthernet0/0
-            #   via GigabitEthernet0/2, directly connected
-            #   via 192.168.51.1%default, indirectly connected
-            p3 = re.compile(r'^\s*via( +(?P<next_hop>[0-9][\w\:\.\%]+),?)?'
-                            '( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?( +directly connected)?( +indirectly connected)?$')
-            m = p3.match(line)
-            if m:
-                if m.groupdict()['next_hop']:
-                    if '%' in  m.groupdict()['next_hop']:
-                        next_hop = m.groupdict()['next_hop'].split('%')[0]
-                    else:
-                        next_hop = m.groupdict()['next_hop']
-
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
-
-                if 'routes' not in result_dict['vrf'][vrf]['address_family'][af]:
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'] = {}
-                if route not in result_dict['vrf'][vrf]['address_family'][af]['routes']:
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route] = {}
-
-                result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['route'] = route
-
-
-                if 'next_hop' not in result_dict['vrf'][vrf]['address_family'][af]['routes'][route]:
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] = {}
-
-                if not next_hop:
-                    if 'outgoing_interface' not in result_dict['vrf'][vrf]['address_family'][af] \
-                            ['routes'][route]['next_hop']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['next_hop']['outgoing_interface'] = {}
-
-                    if m.groupdict()['interface'] and interface not in result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['next_hop']['outgoing_interface']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['next_hop']['outgoing_interface'][interface] = {}
-
-                    if interface:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['next_hop']['outgoing_interface'][interface]['outgoing_interface'] = interface
-
-                else:
-                    if 'next_hop_list' not in result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'][
-                            'next_hop_list'] = {}
-
-                    if index not in result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
-                            ['next_hop_list']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
-                            ['next_hop_list'][index] = {}
-
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
-                        ['next_hop_list'][index]['index'] = index
-
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
-                        ['next_hop_list'][index]['next_hop'] = next_hop
-
-                    if interface:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
-                            ['next_hop_list'][index]['outgoing_interface'] = interface
-
+            if routes_dict is None:
+                # next hop without a route
                 continue
 
-            #   via FE80::211:1FF:FE00:1, GigabitEthernet0/0/2.100
-            p4 = re.compile(r'^\s*via +(?P<next_hop>[\w\:\.\%]+),'
-                            ' +(?P<interface>[\S]+)$')
-            m = p4.match(line)
-            if m:
-                if m.groupdict()['next_hop']:
-                    if '%' in m.groupdict()['next_hop']:
-                        next_hop = m.groupdict()['next_hop'].split('%')[0]
-                    else:
-                        next_hop = m.groupdict()['next_hop']
-
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+            route_dict = routes_dict.setdefault(route, {})
+            route_dict['route'] = route
+            next_hop_dict = route_dict.setdefault('next_hop', {})
 
-                if 'routes' not in result_dict['vrf'][vrf]['address_family'][af]:
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'] = {}
-                if route not in result_dict['vrf'][vrf]['address_family'][af]['routes']:
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route] = {}
-
-                result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['route'] = route
+            #   via 2001:10:1:2::2, GigabitEthernet0/0
+            #   via FE80::211:1FF:FE00:1, GigabitEthernet0/0/2.100
+            if name in ('p3', 'p4'):
+                if group['next_hop']:
+                    next_hop = group['next_hop'].split('%')[0]
 
-                if 'next_hop' not in result_dict['vrf'][vrf]['address_family'][af]['routes'][route]:
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] = {}
+                if group['interface']:
+                    interface = group['interface']
 
                 if not next_hop:
-                    if 'outgoing_interface' not in result_dict['vrf'][vrf]['address_family'][af] \
-                            ['routes'][route]['next_hop']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['next_hop']['outgoing_interface'] = {}
-
-                    if m.groupdict()['interface'] and interface not in \
-                            result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                                    ['next_hop']['outgoing_interface']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['next_hop']['outgoing_interface'][interface] = {}
-
+                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
                     if interface:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['next_hop']['outgoing_interface'][interface]['outgoing_interface'] = interface
+                        intf_dict.setdefault(interface, {})['outgoing_interface'] = interface
 
                 else:
-                    if 'next_hop_list' not in result_dict['vrf'][vrf]['address_family'][af]['routes'][route][
-                        'next_hop']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'][
-                            'next_hop_list'] = {}
-
-                    if index not in result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
-                            ['next_hop_list']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
-                            ['next_hop_list'][index] = {}
-
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
-                        ['next_hop_list'][index]['index'] = index
-
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
-                        ['next_hop_list'][index]['next_hop'] = next_hop
+                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
+                    idx_dict['index'] = index
+                    idx_dict['next_hop'] = next_hop
 
                     if interface:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
-                            ['next_hop_list'][index]['outgoing_interface'] = interface
+                        idx_dict['outgoing_interface'] = interface
 
                 continue
-            #      Last updated 14:15:23 06 December 2017
-            p5 = re.compile(r'^\s*Last +updated +(?P<last_updated>[\S\s]+)$')
-            m = p5.match(line)
-            if m:
-
-                last_updated = m.groupdict()['last_updated']
-
-                if 'routes' not in result_dict['vrf'][vrf]['address_family'][af]:
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'] = {}
-                if route not in result_dict['vrf'][vrf]['address_family'][af]['routes']:
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route] = {}
-
-                result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['route'] = route
-
 
-                if 'next_hop' not in result_dict['vrf'][vrf]['address_family'][af]['routes'][route]:
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] = {}
-
-
-                if not next_hop:
-                    if 'outgoing_interface' not in result_dict['vrf'][vrf]['address_family'][af] \
-                            ['routes'][route]['next_hop']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['next_hop']['outgoing_interface'] = {}
-
-                    if interface and interface not in result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['next_hop']['outgoing_interface']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route] \
-                            ['next_hop']['outgoing_interface'][interface] = {}
-
-                    if interface:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route]\
-                        ['next_hop']['outgoing_interface'][interface]['updated'] = last_updated
-
-                else:
-
-                    if 'next_hop_list' not in result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'][
-                            'next_hop_list'] = {}
-
-                    if index not in result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
-                            ['next_hop_list']:
-                        result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop'] \
-                            ['next_hop_list'][index] = {}
-
-                    result_dict['vrf'][vrf]['address_family'][af]['routes'][route]['next_hop']\
-                        ['next_hop_list'][index]['updated'] = last_updated
+            #      Last updated 14:15:23 06 December 2017
+            last_updated = group['last_updated']
 
-                index += 1
+            if not next_hop:
+                intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
+                if interface:
+                    intf_dict.setdefault(interface, {})['updated'] = last_updated
+            else:
+                next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})\
+                    ['updated'] = last_updated
 
-                continue
+            index += 1
 
         if len(result_dict):
             result_dict['ipv6_unicast_routing_enabled'] = True
@@ -12,12 +12,10 @@ expected_output = {
                             "dynamic_slow_peer_recovered": "never",
                             "index": 1,
                             "last_detected_dynamic_slow_peer": "never",
-                            "last_read": "00:00:18",
                             "last_received_refresh_end_of_rib": "never",
                             "last_received_refresh_start_of_rib": "never",
                             "last_sent_refresh_end_of_rib": "never",
                             "last_sent_refresh_start_of_rib": "never",
-                            "last_write": "00:00:46",
                             "local_policy_denied_prefixes_counters": {
                                 "inbound": {
                                     "bestpath_from_this_peer": "n/a",
@@ -58,10 +56,8 @@ expected_output = {
                                 },
                             },
                             "refresh_epoch": 1,
-                            "session_state": "Established",
                             "slow_peer_detection": False,
                             "slow_peer_split_update_group_dynamic": False,
-                            "up_time": "4d22h",
                             "update_group_member": 1,
                         }
                     },
@@ -238,12 +234,10 @@ expected_output = {
                             "dynamic_slow_peer_recovered": "never",
                             "index": 2,
                             "last_detected_dynamic_slow_peer": "never",
-                            "last_read": "00:00:00",
                             "last_received_refresh_end_of_rib": "never",
                             "last_received_refresh_start_of_rib": "never",
                             "last_sent_refresh_end_of_rib": "never",
                             "last_sent_refresh_start_of_rib": "never",
-                            "last_write": "00:00:45",
                             "local_policy_denied_prefixes_counters": {
                                 "inbound": {
                                     "bestpath_from_this_peer": "n/a",
@@ -284,10 +278,8 @@ expected_output = {
                                 },
                             },
                             "refresh_epoch": 1,
-                            "session_state": "Established",
                             "slow_peer_detection": False,
                             "slow_peer_split_update_group_dynamic": False,
-                            "up_time": "4d22h",
                             "update_group_member": 2,
                         }
                     },
@@ -797,12 +789,10 @@ expected_output = {
                             "extended_community_attribute_sent": True,
                             "index": 3,
                             "last_detected_dynamic_slow_peer": "never",
-                            "last_read": "00:00:16",
                             "last_received_refresh_end_of_rib": "never",
                             "last_received_refresh_start_of_rib": "never",
                             "last_sent_refresh_end_of_rib": "never",
                             "last_sent_refresh_start_of_rib": "never",
-                            "last_write": "00:00:28",
                             "local_policy_denied_prefixes_counters": {
                                 "inbound": {
                                     "af_permit_check": "n/a",
@@ -852,10 +842,8 @@ expected_output = {
                                 },
                             },
                             "refresh_epoch": 1,
-                            "session_state": "Established",
                             "slow_peer_detection": False,
                             "slow_peer_split_update_group_dynamic": False,
-                            "up_time": "4d22h",
                             "update_group_member": 3,
                         },
                     },
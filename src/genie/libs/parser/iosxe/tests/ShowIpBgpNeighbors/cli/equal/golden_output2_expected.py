@@ -348,12 +348,10 @@ expected_output = {
                             "extended_community_attribute_sent": True,
                             "index": 3,
                             "last_detected_dynamic_slow_peer": "never",
-                            "last_read": "00:00:57",
                             "last_received_refresh_end_of_rib": "never",
                             "last_received_refresh_start_of_rib": "never",
                             "last_sent_refresh_end_of_rib": "never",
                             "last_sent_refresh_start_of_rib": "never",
-                            "last_write": "00:00:15",
                             "local_policy_denied_prefixes_counters": {
                                 "inbound": {
                                     "af_permit_check": "n/a",
@@ -403,10 +401,8 @@ expected_output = {
                                 },
                             },
                             "refresh_epoch": 1,
-                            "session_state": "Established",
                             "slow_peer_detection": False,
                             "slow_peer_split_update_group_dynamic": False,
-                            "up_time": "4d22h",
                             "update_group_member": 3,
                         },
                     },
@@ -23,6 +23,9 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema)
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListSchema
+
 
 class ShowOspf3InterfaceSchema(MetaParser):
     '''schema = {
@@ -40,22 +43,14 @@ class ShowOspf3InterfaceSchema(MetaParser):
     }'''
 
     # Sub Schema
-    def validate_ospf3_interface_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        ospf3_interface_schema = Schema({
-            "bdr-id": str,
-            "dr-id": str,
-            "interface-name": str,
-            "neighbor-count": str,
-            "ospf-area": str,
-            "ospf-interface-state": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_interface_schema.validate(item)
-        return value
+    validate_ospf3_interface_list = ListSchema('ospf3-interface', {
+        "bdr-id": str,
+        "dr-id": str,
+        "interface-name": str,
+        "neighbor-count": str,
+        "ospf-area": str,
+        "ospf-interface-state": str
+    })
 
     # Main Schema
     schema = {
@@ -137,34 +132,25 @@ class ShowOspf3NeighborExtensiveSchema(MetaParser):
         ]
     }
 }"""
-    def validate_ospf3_neighbor_extensive_list(value):
-        # Pass osp3_neighbor_extensive-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('ospf3-table-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "activity-timer": str,
-            "bdr-id": str,
-            "dr-id": str,
-            "interface-name": str,
-            "neighbor-address": str,
-            Optional("neighbor-adjacency-time"): {
-                "#text": str
-            },
-            "neighbor-id": str,
-            "neighbor-priority": str,
-            Optional("neighbor-up-time"): {
-                "#text": str
-            },
-            "options": str,
-            "ospf-area": str,
-            "ospf-neighbor-state": str,
-            "ospf3-interface-index": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_ospf3_neighbor_extensive_list = ListSchema('ospf3-neighbor', {
+        "activity-timer": str,
+        "bdr-id": str,
+        "dr-id": str,
+        "interface-name": str,
+        "neighbor-address": str,
+        Optional("neighbor-adjacency-time"): {
+            "#text": str
+        },
+        "neighbor-id": str,
+        "neighbor-priority": str,
+        Optional("neighbor-up-time"): {
+            "#text": str
+        },
+        "options": str,
+        "ospf-area": str,
+        "ospf-neighbor-state": str,
+        "ospf3-interface-index": str
+    })
 
     # Main Schema
     schema = {
@@ -292,23 +278,14 @@ class ShowOspf3NeighborSchema(MetaParser):
         ]
    }
 }"""
-    def validate_ospf3_neighbor_list(value):
-        # Pass osp3_neighbor_detail-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('ospf3-table-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "activity-timer": str,
-            "interface-name": str,
-            "neighbor-address": str,
-            "neighbor-id": str,
-            "neighbor-priority": str,
-            "ospf-neighbor-state": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_ospf3_neighbor_list = ListSchema('ospf3-neighbor', {
+        "activity-timer": str,
+        "interface-name": str,
+        "neighbor-address": str,
+        "neighbor-id": str,
+        "neighbor-priority": str,
+        "ospf-neighbor-state": str
+    })
 
     # Main Schema
     schema = {
@@ -438,52 +415,28 @@ class ShowOspf3DatabaseSchema(MetaParser):
         }
     }
     '''
-    def validate_ospf3_database_information(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf3-database-information')
-        ospf3_database_information_schema = Schema({
-            "ospf3-area-header": {
-                "ospf-area": str
-            },
-            "ospf3-database":
-            Use(ShowOspf3DatabaseSchema.validate_ospf3_database_list),
-            Optional("ospf3-intf-header"):
-            Use(ShowOspf3DatabaseSchema.validate_ospf3_intf_header_list),
-        })
-        for item in value:
-            ospf3_database_information_schema.validate(item)
-        return value
-
     # Sub Schema ospf3-database
-    def validate_ospf3_database_list(value):
-        # Pass ospf3-database list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        ospf3_database_schema = Schema({
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            "lsa-length": str,
-            "lsa-type": str,
-            "sequence-number": str,
-            Optional('our-entry'): bool
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_database_schema.validate(item)
-        return value
+    validate_ospf3_database_list = ListSchema('ospf3-database', {
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        "lsa-length": str,
+        "lsa-type": str,
+        "sequence-number": str,
+        Optional('our-entry'): bool
+    })
 
     # Sub Schema ospf3-intf-header
-    def validate_ospf3_intf_header_list(value):
-        # Pass ospf3-intf-header list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        ospf3_intf_header_schema = Schema({"ospf-area": str, "ospf-intf": str})
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_intf_header_schema.validate(item)
-        return value
+    validate_ospf3_intf_header_list = ListSchema('ospf3-intf-header', {"ospf-area": str, "ospf-intf": str})
+
+    validate_ospf3_database_information = ListSchema('ospf3-database-information', {
+        "ospf3-area-header": {
+            "ospf-area": str
+        },
+        "ospf3-database": Use(validate_ospf3_database_list),
+        Optional("ospf3-intf-header"): Use(validate_ospf3_intf_header_list),
+    })
 
     # Main Schema
     schema = {
@@ -591,37 +544,29 @@ class ShowOspf3InterfaceExtensiveSchema(MetaParser):
     """
 
     # Sub Schema ospf3-interface
-    def validate_ospf3_interface_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf3-interface is not a list')
-        ospf3_interface_schema = Schema({
-            "adj-count": str,
-            "bdr-id": str,
-            "dead-interval": str,
-            "dr-id": str,
-            "hello-interval": str,
-            "interface-address": str,
-            "interface-cost": str,
-            "interface-name": str,
-            "interface-type": str,
-            "mtu": str,
-            "neighbor-count": str,
-            "ospf-area": str,
-            "ospf-interface-protection-type": str,
-            "ospf-interface-state": str,
-            "ospf-stub-type": str,
-            "ospf3-interface-index": str,
-            Optional("ospf3-router-lsa-id"): str,
-            "prefix-length": str,
-            "retransmit-interval": str,
-            Optional("router-priority"): str,
-            Optional("dr-address"): str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_interface_schema.validate(item)
-        return value
+    validate_ospf3_interface_list = ListSchema('ospf3-interface', {
+        "adj-count": str,
+        "bdr-id": str,
+        "dead-interval": str,
+        "dr-id": str,
+        "hello-interval": str,
+        "interface-address": str,
+        "interface-cost": str,
+        "interface-name": str,
+        "interface-type": str,
+        "mtu": str,
+        "neighbor-count": str,
+        "ospf-area": str,
+        "ospf-interface-protection-type": str,
+        "ospf-interface-state": str,
+        "ospf-stub-type": str,
+        "ospf3-interface-index": str,
+        Optional("ospf3-router-lsa-id"): str,
+        "prefix-length": str,
+        "retransmit-interval": str,
+        Optional("router-priority"): str,
+        Optional("dr-address"): str
+    })
 
     schema = {
         "ospf3-interface-information": {
@@ -817,52 +762,44 @@ class ShowOspf3DatabaseExternalExtensiveSchema(MetaParser):
     """
 
     # Sub Schema
-    def validate_ospf3_database_list(value):
-        # Pass ospf3-database list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        ospf3_interface_schema = Schema({
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            "lsa-length": str,
-            "lsa-type": str,
-            Optional('our-entry'): bool,
-            "ospf-database-extensive": {
-                "aging-timer": {
-                    "#text": str
-                },
-                "expiration-time": {
-                    "#text": str
-                },
-                "installation-time": {
-                    "#text": str
-                },
-                Optional("generation-timer"): {
-                    "#text": str
-                },
-                "lsa-change-count": str,
-                "lsa-changed-time": {
-                    "#text": str
-                },
-                Optional("send-time"): {
-                    "#text": str
-                },
-                Optional("database-entry-state"): str
+    validate_ospf3_database_list = ListSchema('ospf3-database', {
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        "lsa-length": str,
+        "lsa-type": str,
+        Optional('our-entry'): bool,
+        "ospf-database-extensive": {
+            "aging-timer": {
+                "#text": str
             },
-            "ospf3-external-lsa": {
-                "metric": str,
-                "ospf3-prefix": str,
-                "ospf3-prefix-options": str,
-                "type-value": str
+            "expiration-time": {
+                "#text": str
             },
-            "sequence-number": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_interface_schema.validate(item)
-        return value
+            "installation-time": {
+                "#text": str
+            },
+            Optional("generation-timer"): {
+                "#text": str
+            },
+            "lsa-change-count": str,
+            "lsa-changed-time": {
+                "#text": str
+            },
+            Optional("send-time"): {
+                "#text": str
+            },
+            Optional("database-entry-state"): str
+        },
+        "ospf3-external-lsa": {
+            "metric": str,
+            "ospf3-prefix": str,
+            "ospf3-prefix-options": str,
+            "type-value": str
+        },
+        "sequence-number": str
+    })
 
     schema = {
         "ospf3-database-information": {
@@ -1436,93 +1373,43 @@ class ShowOspf3DatabaseExtensiveSchema(MetaParser):
     """
 
     # Sub Schema ospf3-link
-    def validate_ospf3_link_list(value):
-        if not isinstance(value, list):
-            raise SchemaError("ospf3-link is not a list")
-        ospf3_link_schema = Schema({
-            "link-intf-id": str,
-            "link-metric": str,
-            "link-type-name": str,
-            "link-type-value": str,
-            "nbr-intf-id": str,
-            "nbr-rtr-id": str,
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_link_schema.validate(item)
-        return value
+    validate_ospf3_link_list = ListSchema('ospf3-link', {
+        "link-intf-id": str,
+        "link-metric": str,
+        "link-type-name": str,
+        "link-type-value": str,
+        "nbr-intf-id": str,
+        "nbr-rtr-id": str,
+    })
 
     # Sub Schema ospf3-lsa-topology-link
-    def validate_ospf3_lsa_topology_link_list(value):
-        if not isinstance(value, list):
-            raise SchemaError("ospf3-lsa-topology-link is not a list")
-        ospf3_lsa_topology_link_schema = Schema({
-            "link-type-name":
-            str,
-            "ospf-lsa-topology-link-metric":
-            str,
-            "ospf-lsa-topology-link-node-id":
-            str,
-            "ospf-lsa-topology-link-state":
-            str,
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_lsa_topology_link_schema.validate(item)
-        return value
+    validate_ospf3_lsa_topology_link_list = ListSchema('ospf3-lsa-topology-link', {
+        "link-type-name":
+        str,
+        "ospf-lsa-topology-link-metric":
+        str,
+        "ospf-lsa-topology-link-node-id":
+        str,
+        "ospf-lsa-topology-link-state":
+        str,
+    })
 
     # Sub Schema ospf3-database
-    def validate_ospf3_database_list(value):
-        if not isinstance(value, list):
-            raise SchemaError("ospf3-database is not a list")
-        ospf3_database_schema = Schema({
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            Optional("our-entry"): bool,
-            "lsa-length": str,
-            "lsa-type": str,
-            "sequence-number": str,
-            Optional("ospf-database-extensive"): {
-                "aging-timer": {
-                    "#text": str
-                },
-                "expiration-time": {
-                    "#text": str
-                },
-                Optional("ospf3-intra-area-prefix-lsa"): {
-                    Optional("prefix-count"): str,
-                    Optional("reference-lsa-id"): str,
-                    Optional("reference-lsa-router-id"): str,
-                    Optional("reference-lsa-type"): str,
-                    "ospf3-prefix": list,
-                    "ospf3-prefix-metric": list,
-                    "ospf3-prefix-options": list,
-                },
-                Optional("ospf3-inter-area-prefix-lsa"): {
-                    Optional("prefix-count"): str,
-                    Optional("reference-lsa-id"): str,
-                    Optional("reference-lsa-router-id"): str,
-                    Optional("reference-lsa-type"): str,
-                    "ospf3-prefix": list,
-                    "ospf3-prefix-metric": list,
-                    "ospf3-prefix-options": list,
-                },
-                "installation-time": {
-                    "#text": str
-                },
-                Optional("generation-timer"): {
-                    "#text": str
-                },
-                "lsa-change-count": str,
-                "lsa-changed-time": {
-                    "#text": str
-                },
-                Optional("send-time"): {
-                    "#text": str
-                },
-                Optional("database-entry-state"): str,
+    validate_ospf3_database_list = ListSchema('ospf3-database', {
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        Optional("our-entry"): bool,
+        "lsa-length": str,
+        "lsa-type": str,
+        "sequence-number": str,
+        Optional("ospf-database-extensive"): {
+            "aging-timer": {
+                "#text": str
+            },
+            "expiration-time": {
+                "#text": str
             },
             Optional("ospf3-intra-area-prefix-lsa"): {
                 Optional("prefix-count"): str,
@@ -1542,52 +1429,73 @@ class ShowOspf3DatabaseExtensiveSchema(MetaParser):
                 "ospf3-prefix-metric": list,
                 "ospf3-prefix-options": list,
             },
-            Optional("ospf3-router-lsa"): {
-                Optional("bits"):
-                str,
-                Optional("ospf3-options"):
-                str,
-                Optional("ospf3-link"):
-                Use(ShowOspf3DatabaseExtensive.validate_ospf3_link_list),
-                Optional("ospf3-lsa-topology"): {
-                    "ospf-topology-id":
-                    str,
-                    "ospf-topology-name":
-                    str,
-                    "ospf3-lsa-topology-link":
-                    Use(ShowOspf3DatabaseExtensive.
-                        validate_ospf3_lsa_topology_link_list),
-                },
+            "installation-time": {
+                "#text": str
             },
-            Optional("ospf3-link-lsa"): {
-                "linklocal-address": str,
-                "ospf3-options": str,
-                Optional("ospf3-prefix"): str,
-                Optional("ospf3-prefix-options"): str,
-                "prefix-count": str,
-                "router-priority": str,
+            Optional("generation-timer"): {
+                "#text": str
             },
-            Optional("ospf3-external-lsa"): {
-                "metric": str,
-                "ospf3-prefix": str,
-                "ospf3-prefix-options": str,
-                "type-value": str,
+            "lsa-change-count": str,
+            "lsa-changed-time": {
+                "#text": str
             },
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_database_schema.validate(item)
-        return value
+            Optional("send-time"): {
+                "#text": str
+            },
+            Optional("database-entry-state"): str,
+        },
+        Optional("ospf3-intra-area-prefix-lsa"): {
+            Optional("prefix-count"): str,
+            Optional("reference-lsa-id"): str,
+            Optional("reference-lsa-router-id"): str,
+            Optional("reference-lsa-type"): str,
+            "ospf3-prefix": list,
+            "ospf3-prefix-metric": list,
+            "ospf3-prefix-options": list,
+        },
+        Optional("ospf3-inter-area-prefix-lsa"): {
+            Optional("prefix-count"): str,
+            Optional("reference-lsa-id"): str,
+            Optional("reference-lsa-router-id"): str,
+            Optional("reference-lsa-type"): str,
+            "ospf3-prefix": list,
+            "ospf3-prefix-metric": list,
+            "ospf3-prefix-options": list,
+        },
+        Optional("ospf3-router-lsa"): {
+            Optional("bits"):
+            str,
+            Optional("ospf3-options"):
+            str,
+            Optional("ospf3-link"):
+            Use(validate_ospf3_link_list),
+            Optional("ospf3-lsa-topology"): {
+                "ospf-topology-id":
+                str,
+                "ospf-topology-name":
+                str,
+                "ospf3-lsa-topology-link":
+                Use(validate_ospf3_lsa_topology_link_list),
+            },
+        },
+        Optional("ospf3-link-lsa"): {
+            "linklocal-address": str,
+            "ospf3-options": str,
+            Optional("ospf3-prefix"): str,
+            Optional("ospf3-prefix-options"): str,
+            "prefix-count": str,
+            "router-priority": str,
+        },
+        Optional("ospf3-external-lsa"): {
+            "metric": str,
+            "ospf3-prefix": str,
+            "ospf3-prefix-options": str,
+            "type-value": str,
+        },
+    })
 
     # Sub Schema ospf3-intf-header
-    def validate_ospf3_intf_header_list(value):
-        if not isinstance(value, list):
-            raise SchemaError("ospf3-intf-header is not a list")
-        ospf3_link_schema = Schema({"ospf-area": str, "ospf-intf": str})
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_link_schema.validate(item)
-        return value
+    validate_ospf3_intf_header_list = ListSchema('ospf3-intf-header', {"ospf-area": str, "ospf-intf": str})
 
     schema = {
         "ospf3-database-information": {
@@ -2154,49 +2062,36 @@ class ShowOspf3DatabaseNetworkDetailSchema(MetaParser):
             ]
         }
     } """
-    def validate_ospf_lsa_topology_innerlist(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf3 lsa is not a list')
-        ospf3_lsa_schema = Schema({
-            "link-type-name": str,
-            "ospf-lsa-topology-link-metric": str,
-            "ospf-lsa-topology-link-node-id": str,
-            "ospf-lsa-topology-link-state": str
-        })
-        for item in value:
-            ospf3_lsa_schema.validate(item)
-        return value
-
-    def validate_ospf3_database_topology_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-database is not a list')
-        ospf3_database_schema = Schema({
-            Optional("@heading"): str,
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            "lsa-length": str,
-            "lsa-type": str,
-            "ospf3-network-lsa": {
-                "attached-router": list,
-                "ospf3-lsa-topology": {
-                    Optional("ospf-topology-id"):
-                    str,
-                    Optional("ospf-topology-name"):
-                    str,
-                    "ospf3-lsa-topology-link":
-                    Use(ShowOspf3DatabaseNetworkDetail.
-                        validate_ospf_lsa_topology_innerlist)
-                },
-                "ospf3-options": str
+    validate_ospf_lsa_topology_innerlist = ListSchema('ospf-lsa-topology-innerlist', {
+        "link-type-name": str,
+        "ospf-lsa-topology-link-metric": str,
+        "ospf-lsa-topology-link-node-id": str,
+        "ospf-lsa-topology-link-state": str
+    })
+
+    validate_ospf3_database_topology_list = ListSchema('ospf3-database', {
+        Optional("@heading"): str,
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        "lsa-length": str,
+        "lsa-type": str,
+        "ospf3-network-lsa": {
+            "attached-router": list,
+            "ospf3-lsa-topology": {
+                Optional("ospf-topology-id"):
+                str,
+                Optional("ospf-topology-name"):
+                str,
+                "ospf3-lsa-topology-link":
+                Use(validate_ospf_lsa_topology_innerlist)
             },
-            Optional("our-entry"): bool,
-            "sequence-number": str
-        })
-        for item in value:
-            ospf3_database_schema.validate(item)
-        return value
+            "ospf3-options": str
+        },
+        Optional("our-entry"): bool,
+        "sequence-number": str
+    })
 
     schema = {
         Optional("@xmlns:junos"): str,
@@ -2354,39 +2249,27 @@ class ShowOspf3DatabaseLinkAdvertisingRouterSchema(MetaParser):
             ]
         }
     } """
-    def validate_ospf3_intf_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf3 intf is not a list')
-        ospf3_intf_schema = Schema({"ospf-area": str, "ospf-intf": str})
-        for item in value:
-            ospf3_intf_schema.validate(item)
-        return value
-
-    def validate_ospf3_database_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-database is not a list')
-        ospf3_database_schema = Schema({
-            Optional("@heading"): str,
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            "lsa-length": str,
-            "lsa-type": str,
-            "ospf3-link-lsa": {
-                "linklocal-address": str,
-                "ospf3-options": str,
-                Optional("ospf3-prefix"): str,
-                Optional("ospf3-prefix-options"): str,
-                "prefix-count": str,
-                "router-priority": str
-            },
-            Optional("our-entry"): bool,
-            "sequence-number": str
-        })
-        for item in value:
-            ospf3_database_schema.validate(item)
-        return value
+    validate_ospf3_intf_list = ListSchema('ospf3-intf-header', {"ospf-area": str, "ospf-intf": str})
+
+    validate_ospf3_database_list = ListSchema('ospf3-database', {
+        Optional("@heading"): str,
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        "lsa-length": str,
+        "lsa-type": str,
+        "ospf3-link-lsa": {
+            "linklocal-address": str,
+            "ospf3-options": str,
+            Optional("ospf3-prefix"): str,
+            Optional("ospf3-prefix-options"): str,
+            "prefix-count": str,
+            "router-priority": str
+        },
+        Optional("our-entry"): bool,
+        "sequence-number": str
+    })
 
     schema = {
         Optional("@xmlns:junos"): str,
@@ -2555,33 +2438,27 @@ class ShowOspf3RouteNetworkExtensiveSchema(MetaParser):
     }'''
 
 
-    def validate_ospf3_route_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-route is not a list')
-        ospf3_route_schema = Schema({
-            "ospf3-route-entry": {
-                "address-prefix": str,
-                Optional("forward"): str,
-                "interface-cost": str,
-                "next-hop-type": str,
-                "ospf-area": str,
-                Optional("ospf-next-hop"): {
-                    Optional("next-hop-address"): {
-                                "interface-address": str
-                    },
-                    "next-hop-name": {
-                        "interface-name": str
-                    }
+    validate_ospf3_route_list = ListSchema('ospf3-route', {
+        "ospf3-route-entry": {
+            "address-prefix": str,
+            Optional("forward"): str,
+            "interface-cost": str,
+            "next-hop-type": str,
+            "ospf-area": str,
+            Optional("ospf-next-hop"): {
+                Optional("next-hop-address"): {
+                            "interface-address": str
                 },
-                "route-origin": str,
-                "route-path-type": str,
-                "route-priority": str,
-                "route-type": str
+                "next-hop-name": {
+                    "interface-name": str
                 }
-        })
-        for item in value:
-            ospf3_route_schema.validate(item)
-        return value
+            },
+            "route-origin": str,
+            "route-path-type": str,
+            "route-priority": str,
+            "route-type": str
+            }
+    })
 
 
     
@@ -2691,23 +2568,14 @@ class ShowOspf3NeighborInstanceAllSchema(MetaParser):
         }
     }"""
 
-    def validate_ospf3_neighbor_list(value):
-        # Pass osp3_neighbor_detail-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('ospf3-table-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "activity-timer": str,
-            "interface-name": str,
-            "neighbor-address": str,
-            "neighbor-id": str,
-            "neighbor-priority": str,
-            "ospf-neighbor-state": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_ospf3_neighbor_list = ListSchema('ospf3-neighbor', {
+        "activity-timer": str,
+        "interface-name": str,
+        "neighbor-address": str,
+        "neighbor-id": str,
+        "neighbor-priority": str,
+        "ospf-neighbor-state": str
+    })
 
     # Main Schema
     schema = {
@@ -2826,23 +2694,14 @@ class ShowOspf3RouteRouteSchema(MetaParser):
     #         }
     #     }
 
-    def validate_ospf_next_hop_list(value):
-        ''' Validates each entry in ospf-next-hop '''
-        if not isinstance(value, list):
-            raise SchemaError('ospf-next-hop is not a list')
-        
-        ospf_next_hop_schema = Schema({
-            "next-hop-address": {
-                "interface-address": str,
-            },
-            "next-hop-name": {
-                "interface-name": str,
-            }
-        })
-
-        for entry in value:
-            ospf_next_hop_schema.validate(entry)    
-        return value
+    validate_ospf_next_hop_list = ListSchema('ospf-next-hop', {
+        "next-hop-address": {
+            "interface-address": str,
+        },
+        "next-hop-name": {
+            "interface-name": str,
+        }
+    })
 
     schema = {
       "ospf3-route-information": {
@@ -29,6 +29,9 @@ import re
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
+
+# import parser utils
+from genie.libs.parser.utils.schema import ListSchema
 '''
 Schema for:
     * show route table {table}
@@ -292,82 +295,48 @@ class ShowRouteSchema(MetaParser):
             }
         }
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt list is not a list')
-            
-            def validate_nh_list(value):
-                # Pass nh list of dict in value
-                if not isinstance(value, list):
-                    raise SchemaError('nh list is not a list')
-                # Create nh-list Entry Schema
-                nh_schema = Schema({
-                            Optional("mpls-label"): str,
-                            Optional("selected-next-hop"): str,
-                            Optional("nh-local-interface"): str,
-                            Optional("nh-table"): str,
-                            Optional("to"): str,
-                            Optional("via"): str
-                        })
-                # Validate each dictionary in list
-                for item in value:
-                    nh_schema.validate(item)
-                return value
-
-            # Create rt-list Entry Schema
-            rt_schema = Schema({
-                    Optional("@junos:style"): str,
-                    Optional("rt-destination"): str,
-                    "rt-entry": {
-                        Optional("active-tag"): str,
-                        "age": {
-                            "#text": str,
-                            Optional("@junos:seconds"): str
-                        },
-                        Optional('as-path'): str,
-                        Optional("current-active"): str,
-                        Optional("last-active"): str,
-                        Optional("learned-from"): str,
-                        Optional("local-preference"): str,
-                        Optional("peer-id"): str,
-                        Optional("med"): str,
-                        Optional("metric"): str,
-                        Optional("metric2"): str,
-                        Optional("nh"): Use(validate_nh_list),
-                        Optional('nh-type'): str,
-                        "preference": str,
-                        Optional("preference2"): str,
-                        "protocol-name": str,
-                        Optional('rt-tag'): str,
-                        Optional("validation-state"): str
-                    }
-                })
-            # Validate each dictionary in list
-            for item in value:
-                rt_schema.validate(item)
-            return value
-
-
-        # Create RouteEntry Schema
-        route_entry_schema = Schema({
-                "active-route-count": str,
-                "destination-count": str,
-                "hidden-route-count": str,
-                "holddown-route-count": str,
-                Optional("rt"): Use(validate_rt_list),
-                "table-name": str,
-                "total-route-count": str
-            })
-        # Validate each dictionary in list
-        for item in value:
-            route_entry_schema.validate(item)
-        return value
+    validate_route_table_list = ListSchema('route-table', {
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(ListSchema('rt', {
+            Optional("@junos:style"): str,
+            Optional("rt-destination"): str,
+            "rt-entry": {
+                Optional("active-tag"): str,
+                "age": {
+                    "#text": str,
+                    Optional("@junos:seconds"): str
+                },
+                Optional('as-path'): str,
+                Optional("current-active"): str,
+                Optional("last-active"): str,
+                Optional("learned-from"): str,
+                Optional("local-preference"): str,
+                Optional("peer-id"): str,
+                Optional("med"): str,
+                Optional("metric"): str,
+                Optional("metric2"): str,
+                Optional("nh"): Use(ListSchema('nh', {
+                    Optional("mpls-label"): str,
+                    Optional("selected-next-hop"): str,
+                    Optional("nh-local-interface"): str,
+                    Optional("nh-table"): str,
+                    Optional("to"): str,
+                    Optional("via"): str
+                })),
+                Optional('nh-type'): str,
+                "preference": str,
+                Optional("preference2"): str,
+                "protocol-name": str,
+                Optional('rt-tag'): str,
+                Optional("validation-state"): str
+            }
+        })),
+        "table-name": str,
+        "total-route-count": str
+    })
 
     # Main Schema
     schema = {
@@ -712,25 +681,76 @@ class ShowRouteProtocolExtensiveSchema(MetaParser):
             }
         }
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            def validate_rt_entry_list(value):
-                if isinstance(value, dict):
-                    value = [value]
-                if not isinstance(value, list):
-                    raise SchemaError('rt-entry is not a list')
-                def validate_nh_list(value):
-                    # Pass nh list of dict in value
-                    if not isinstance(value, list):
-                        raise SchemaError('nh is not a list')
-                    nh_schema = Schema({
+    validate_route_table_list = ListSchema('route-table', {
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(ListSchema('rt', {
+            Optional("@junos:style"): str,
+            "rt-announced-count": str,
+            "rt-destination": str,
+            Optional("rt-entry"): Use(ListSchema('rt-entry', {
+                Optional("accepted"): str,
+                Optional("active-tag"): str,
+                Optional("age"): {
+                    "#text": str,
+                    Optional("@junos:seconds"): str
+                },
+                Optional("announce-bits"): str,
+                Optional("announce-tasks"): str,
+                Optional("as-path"): str,
+                Optional("cluster-list"): str,
+                Optional("bgp-rt-flag"): str,
+                Optional("bgp-path-attributes"): {
+                    "attr-as-path-effective": {
+                        "aspath-effective-string": str,
+                        "attr-value": str
+                    }
+                },
+                Optional("current-active"): str,
+                Optional("inactive-reason"): str,
+                Optional("last-active"): str,
+                Optional("local-as"): str,
+                Optional("local-preference"): str,
+                Optional("peer-as"): str,
+                Optional("metric"): str,
+                Optional("metric2"): str,
+                Optional("nh"): Use(ListSchema('nh', {
+                    Optional("@junos:indent"): str,
+                    Optional("label-element"): str,
+                    Optional("label-element-childcount"): str,
+                    Optional("label-element-lspid"): str,
+                    Optional("label-element-parent"): str,
+                    Optional("label-element-refcount"): str,
+                    Optional("label-ttl-action"): str,
+                    Optional("load-balance-label"): str,
+                    Optional("mpls-label"): str,
+                    Optional("nh-string"): str,
+                    Optional("selected-next-hop"): str,
+                    Optional("session"): str,
+                    Optional("to"): str,
+                    Optional("via"): str,
+                    Optional("weight"): str
+                })),
+                Optional("nh-address"): str,
+                Optional("nh-index"): str,
+                Optional("nh-kernel-id"): str,
+                Optional("nh-reference-count"): str,
+                Optional("gateway"): str,
+                Optional("nh-type"): str,
+                Optional("preference"): str,
+                Optional("preference2"): str,
+                Optional("protocol-name"): str,
+                Optional("protocol-nh"): Use(ListSchema('protocol-nh', {
+                    Optional("@junos:indent"): str,
+                    Optional("forwarding-nh-count"): str,
+                    "indirect-nh": str,
+                    Optional("label-ttl-action"): str,
+                    Optional("load-balance-label"): str,
+                    Optional("metric"): str,
+                    Optional("mpls-label"): str,
+                    Optional("nh"): Use(ListSchema('nh', {
                         Optional("@junos:indent"): str,
                         Optional("label-element"): str,
                         Optional("label-element-childcount"): str,
@@ -746,147 +766,33 @@ class ShowRouteProtocolExtensiveSchema(MetaParser):
                         Optional("to"): str,
                         Optional("via"): str,
                         Optional("weight"): str
-                    })
-                    # Validate each dictionary in list
-                    for item in value:
-                        nh_schema.validate(item)
-                    return value
-                def validate_protocol_nh_list(value):
-                    # Pass nh list of dict in value
-                    if isinstance(value, dict):
-                        value = [value]
-                    if not isinstance(value, list):
-                        raise SchemaError('protocol-nh is not a list')
-                    def validate_nh_list(value):
-                        # Pass nh list of dict in value
-                        if isinstance(value, dict):
-                            value = [value]
-                        if not isinstance(value, list):
-                            raise SchemaError('nh is not a list')
-                        nh_schema = Schema({
-                            Optional("@junos:indent"): str,
-                            Optional("label-element"): str,
-                            Optional("label-element-childcount"): str,
-                            Optional("label-element-lspid"): str,
-                            Optional("label-element-parent"): str,
-                            Optional("label-element-refcount"): str,
-                            Optional("label-ttl-action"): str,
-                            Optional("load-balance-label"): str,
-                            Optional("mpls-label"): str,
-                            Optional("nh-string"): str,
-                            Optional("selected-next-hop"): str,
-                            Optional("session"): str,
-                            Optional("to"): str,
-                            Optional("via"): str,
-                            Optional("weight"): str
-                        })
-                        # Validate each dictionary in list
-                        for item in value:
-                            nh_schema.validate(item)
-                        return value
-                    protocol_nh_schema = Schema({
-                        Optional("@junos:indent"): str,
-                        Optional("forwarding-nh-count"): str,
-                        "indirect-nh": str,
-                        Optional("label-ttl-action"): str,
-                        Optional("load-balance-label"): str,
-                        Optional("metric"): str,
-                        Optional("mpls-label"): str,
-                        Optional("nh"): Use(validate_nh_list),
-                        Optional("nh-index"): str,
-                        Optional("nh-type"): str,
-                        Optional("output"): str,
-                        "to": str
-                    })
-                    # Validate each dictionary in list
-                    for item in value:
-                        protocol_nh_schema.validate(item)
-                    return value
-                rt_entry_schema = Schema({
-                    Optional("accepted"): str,
-                    Optional("active-tag"): str,
-                    Optional("age"): {
-                        "#text": str,
-                        Optional("@junos:seconds"): str
-                    },
-                    Optional("announce-bits"): str,
-                    Optional("announce-tasks"): str,
-                    Optional("as-path"): str,
-                    Optional("cluster-list"): str,
-                    Optional("bgp-rt-flag"): str,
-                    Optional("bgp-path-attributes"): {
-                        "attr-as-path-effective": {
-                            "aspath-effective-string": str,
-                            "attr-value": str
-                        }
-                    },
-                    Optional("current-active"): str,
-                    Optional("inactive-reason"): str,
-                    Optional("last-active"): str,
-                    Optional("local-as"): str,
-                    Optional("local-preference"): str,
-                    Optional("peer-as"): str,
-                    Optional("metric"): str,
-                    Optional("metric2"): str,
-                    Optional("nh"): Use(validate_nh_list),
-                    Optional("nh-address"): str,
+                    }, single=True)),
                     Optional("nh-index"): str,
-                    Optional("nh-kernel-id"): str,
-                    Optional("nh-reference-count"): str,
-                    Optional("gateway"): str,
                     Optional("nh-type"): str,
-                    Optional("preference"): str,
-                    Optional("preference2"): str,
-                    Optional("protocol-name"): str,
-                    Optional("protocol-nh"): Use(validate_protocol_nh_list),
-                    Optional("rt-entry-state"): str,
-                    Optional("rt-ospf-area"): str,
-                    Optional("rt-tag"): str,
-                    Optional("peer-id"): str,
-                    Optional("task-name"): str,
-                    Optional("validation-state"): str
-                })
-                # Validate each dictionary in list
-                for item in value:
-                    rt_entry_schema.validate(item)
-                return value
-
-            # Create rt Schema
-            rt_schema = Schema({
-                Optional("@junos:style"): str,
-                "rt-announced-count": str,
-                "rt-destination": str,
-                Optional("rt-entry"): Use(validate_rt_entry_list),
-                "rt-entry-count": {
-                    "#text": str,
-                    Optional("@junos:format"): str
-                },
-                Optional("rt-prefix-length"): str,
-                Optional("rt-state"): str,
-                Optional("tsi"): {
-                    "#text": str,
-                    Optional("@junos:indent"): str
-                }
-            })
-            # Validate each dictionary in list
-            for item in value:
-                rt_schema.validate(item)
-            return value
-
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+                    Optional("output"): str,
+                    "to": str
+                }, single=True)),
+                Optional("rt-entry-state"): str,
+                Optional("rt-ospf-area"): str,
+                Optional("rt-tag"): str,
+                Optional("peer-id"): str,
+                Optional("task-name"): str,
+                Optional("validation-state"): str
+            }, single=True)),
+            "rt-entry-count": {
+                "#text": str,
+                Optional("@junos:format"): str
+            },
+            Optional("rt-prefix-length"): str,
+            Optional("rt-state"): str,
+            Optional("tsi"): {
+                "#text": str,
+                Optional("@junos:indent"): str
+            }
+        })),
+        "table-name": str,
+        "total-route-count": str
+    })
 
     # Main Schema
     schema = {
@@ -1596,34 +1502,15 @@ class ShowRouteForwardingTableSummarySchema(MetaParser):
     #     }
     # }
 
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        def validate_route_table_summary_list(value):
-            # Pass route-table-summary list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('route-table-summary is not a list')
-            # Create route-table-summary Schema
-            route_table_summary_schema = Schema({
-                "route-count": str,
-                "route-table-type": str
-            })
-            # Validate each dictionary in list
-            for item in value:
-                route_table_summary_schema.validate(item)
-            return value
-        # Create route-table-summary Schema
-        route_table_schema = Schema({
-            "address-family": str,
-            Optional("enabled-protocols"): str,
-            "route-table-summary": Use(validate_route_table_summary_list),
-            "table-name": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_route_table_list = ListSchema('route-table', {
+        "address-family": str,
+        Optional("enabled-protocols"): str,
+        "route-table-summary": Use(ListSchema('route-table-summary', {
+            "route-count": str,
+            "route-table-type": str
+        })),
+        "table-name": str
+    })
     
     schema = {
         Optional("@xmlns:junos"): str,
@@ -1737,49 +1624,28 @@ class ShowRouteReceiveProtocolSchema(MetaParser):
         }
     """
 
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            # Create rt entry Schema
-            rt_entry_schema = Schema({
-                Optional("@junos:style"): str,
-                "rt-destination": str,
-                "rt-entry": {
-                    Optional("active-tag"): str,
-                    "as-path": str,
-                    Optional("local-preference"): str,
-                    Optional("med"): str,
-                    "nh": {
-                        "to": str
-                    },
-                    "protocol-name": str
-                }
-            })
-            # Validate each dictionary in list
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-
-        # Create route-table entry Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_route_table_list = ListSchema('route-table', {
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(ListSchema('rt', {
+            Optional("@junos:style"): str,
+            "rt-destination": str,
+            "rt-entry": {
+                Optional("active-tag"): str,
+                "as-path": str,
+                Optional("local-preference"): str,
+                Optional("med"): str,
+                "nh": {
+                    "to": str
+                },
+                "protocol-name": str
+            }
+        })),
+        "table-name": str,
+        "total-route-count": str
+    })
     
     # Main Schema
     schema = {
@@ -1935,30 +1801,21 @@ class ShowRouteAdvertisingProtocolSchema(MetaParser):
         }
     """
 
-    def validate_rt_list(value):
-        # Pass rt list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('rt is not a list')
-        # Create rt entry Schema
-        entry_schema = Schema({
-            Optional("@junos:style"): str,
-            "rt-destination": str,
-            "rt-entry": {
-                Optional("active-tag"): str,
-                "as-path": str,
-                "bgp-metric-flags": str,
-                Optional("local-preference"): str,
-                Optional("med"): str,
-                "nh": {
-                    "to": str
-                },
-                "protocol-name": str
-            }
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_rt_list = ListSchema('rt', {
+        Optional("@junos:style"): str,
+        "rt-destination": str,
+        "rt-entry": {
+            Optional("active-tag"): str,
+            "as-path": str,
+            "bgp-metric-flags": str,
+            Optional("local-preference"): str,
+            Optional("med"): str,
+            "nh": {
+                "to": str
+            },
+            "protocol-name": str
+        }
+    })
     
     # Main schema
     schema = {
@@ -2120,38 +1977,19 @@ class ShowRouteSummarySchema(MetaParser):
     #     }
     # }
 
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        def validate_protocols_list(value):
-            # Pass protocols list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('protocols is not a list')
-            # Create protocols Schema
-            protocols_schema = Schema({
-                "active-route-count": str,
-                "protocol-name": str,
-                "protocol-route-count": str
-            })
-            # Validate each dictionary in list
-            for item in value:
-                protocols_schema.validate(item)
-            return value
-        # Create route-table Schema
-        route_table_schema = Schema({
+    validate_route_table_list = ListSchema('route-table', {
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        "protocols": Use(ListSchema('protocols', {
             "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            "protocols": Use(validate_protocols_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+            "protocol-name": str,
+            "protocol-route-count": str
+        })),
+        "table-name": str,
+        "total-route-count": str
+    })
 
     # Main Schema
     schema = {
@@ -2270,45 +2108,22 @@ class ShowRouteInstanceDetailSchema(MetaParser):
     #     }
     # }
 
-    def validate_instance_core_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('instance-core is not a list')
-        def validate_instance_rib_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('instance-rib is not a list')
-            instance_rib_schema = Schema({
-                        "irib-active-count": str,
-                        "irib-hidden-count": str,
-                        "irib-holddown-count": str,
-                        "irib-name": str,
-                        "irib-route-count": str
-                    })
-            # Validate each dictionary in list
-            for item in value:
-                instance_rib_schema.validate(item)
-            return value
-        def validate_interface_name_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('interface-name is not a list')
-            instance_rib_schema = Schema({
-                    "interface-name": str
-                })
-            # Validate each dictionary in list
-            for item in value:
-                instance_rib_schema.validate(item)
-            return value
-        instance_core_schema = Schema({
-            Optional("instance-interface"): Use(validate_interface_name_list),
-            "instance-name": str,
-            Optional("instance-rib"): Use(validate_instance_rib_list),
-            Optional("instance-state"): str,
-            Optional("instance-type"): str,
-            Optional("router-id"): str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            instance_core_schema.validate(item)
-        return value
+    validate_instance_core_list = ListSchema('instance-core', {
+        Optional("instance-interface"): Use(ListSchema('instance-interface', {
+            "interface-name": str
+        })),
+        "instance-name": str,
+        Optional("instance-rib"): Use(ListSchema('instance-rib', {
+            "irib-active-count": str,
+            "irib-hidden-count": str,
+            "irib-holddown-count": str,
+            "irib-name": str,
+            "irib-route-count": str
+        })),
+        Optional("instance-state"): str,
+        Optional("instance-type"): str,
+        Optional("router-id"): str
+    })
     
     schema = {
         Optional("@xmlns:junos"): str,
@@ -2454,43 +2269,35 @@ class ShowRouteAdvertisingProtocolDetailSchema(MetaParser):
     #     },
     # }
 
-    def validate_rt_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('protocol information is not a list')
-
-        entry_schema = Schema({
-            Optional("@junos:style"): str,
-            "table-name": str,
-            "destination-count": str,
-            "total-route-count": str,
-            "active-route-count": str,
-            "holddown-route-count": str,
-            "hidden-route-count": str,
-            "rt-entry": {
-                Optional('active-tag'): str,
-                "rt-destination": str,
-                "rt-prefix-length": str,
-                "rt-entry-count": str,
-                "rt-announced-count": str,
-                Optional('route-label'): str,
-                Optional("bgp-group"): {
-                    "bgp-group-name": str,
-                    "bgp-group-type": str,
-                },
-                "nh": {
-                    "to": str,
-                },
-                Optional("med"): str,
-                Optional("local-preference"): str,
-                'as-path': str,
-                Optional("communities"): str,
-                Optional("flags"): str,
-            }
-        })
-
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_rt_list = ListSchema('route-table', {
+        Optional("@junos:style"): str,
+        "table-name": str,
+        "destination-count": str,
+        "total-route-count": str,
+        "active-route-count": str,
+        "holddown-route-count": str,
+        "hidden-route-count": str,
+        "rt-entry": {
+            Optional('active-tag'): str,
+            "rt-destination": str,
+            "rt-prefix-length": str,
+            "rt-entry-count": str,
+            "rt-announced-count": str,
+            Optional('route-label'): str,
+            Optional("bgp-group"): {
+                "bgp-group-name": str,
+                "bgp-group-type": str,
+            },
+            "nh": {
+                "to": str,
+            },
+            Optional("med"): str,
+            Optional("local-preference"): str,
+            'as-path': str,
+            Optional("communities"): str,
+            Optional("flags"): str,
+        }
+    })
 
     # Main schema
     schema = {
@@ -2647,43 +2454,24 @@ class ShowRouteForwardingTableLabelSchema(MetaParser):
     """
 
 
-    def validate_rt_table_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('Route table is not a list')
-
-        def validate_rt_entry_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('Route entry is not a list')
-
-            rt_entry = Schema({
-                                "rt-destination": str,
-                                "destination-type": str,
-                                "route-reference-count": str,
-                                "nh":{
-                                    Optional("to"): str,
-                                    "nh-type": str,
-                                    "nh-index": str,
-                                    "nh-reference-count": str,
-                                    Optional("nh-lb-label"): str,
-                                    Optional("via"): str,
-                                }
-                            })
-            
-            for item in value:
-                rt_entry.validate(item)
-            return value
-
-
-        rt_table = Schema({
-                        "table-name": str,
-                        "address-family": str,
-                        Optional("enabled-protocols"): str,
-                        "rt-entry": Use(validate_rt_entry_list)
-                    })
-
-        for item in value:
-            rt_table.validate(item)
-        return value
+    validate_rt_table_list = ListSchema('route-table', {
+        "table-name": str,
+        "address-family": str,
+        Optional("enabled-protocols"): str,
+        "rt-entry": Use(ListSchema('rt-entry', {
+            "rt-destination": str,
+            "destination-type": str,
+            "route-reference-count": str,
+            "nh":{
+                Optional("to"): str,
+                "nh-type": str,
+                "nh-index": str,
+                "nh-reference-count": str,
+                Optional("nh-lb-label"): str,
+                Optional("via"): str,
+            }
+        }))
+    })
 
     # Main schema
     schema = {
@@ -2782,56 +2570,28 @@ class ShowRouteTableLabelSwitchedNameSchema(MetaParser):
         * show route table {table} label-switched-path {name}
     """
 
-    def validate_rt_schema(value):
-        if not isinstance(value, list):
-            raise SchemaError('rt schema is not a list')
-
-        def validate_rt_entry_schema(value):
-            if not isinstance(value, list):
-                raise SchemaError('rt entry schema is not a list')
-
-            def validate_nh_schema(value):
-                if not isinstance(value, list):
-                    raise SchemaError('nh schema is not a list')
-            
-                nh_schema = Schema({
-                            Optional("selected-next-hop"): bool,
-                            "to": str,
-                            "via": str,
-                            "lsp-name": str,
-                        })
-            
-                for item in value:
-                    nh_schema.validate(item)
-                return value
-        
-            rt_entry_schema = Schema({
-                        Optional("active-tag"): str,
-                        Optional("current-active"): str,
-                        Optional("last-active"): str,
-                        "protocol-name": str,
-                        "preference": str,
-                        "preference2": str,
-                        "age": {
-                            '#text': str,
-                            Optional('@junos:seconds'): str,
-                        },
-                        "metric": str,
-                        "nh": Use(validate_nh_schema)
-                    })
-        
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-    
-        rt_schema = Schema({
-                    "rt-destination": str,
-                    "rt-entry": Use(validate_rt_entry_schema)
-                })
-    
-        for item in value:
-            rt_schema.validate(item)
-        return value
+    validate_rt_schema = ListSchema('rt', {
+        "rt-destination": str,
+        "rt-entry": Use(ListSchema('rt-entry', {
+            Optional("active-tag"): str,
+            Optional("current-active"): str,
+            Optional("last-active"): str,
+            "protocol-name": str,
+            "preference": str,
+            "preference2": str,
+            "age": {
+                '#text': str,
+                Optional('@junos:seconds'): str,
+            },
+            "metric": str,
+            "nh": Use(ListSchema('nh', {
+                Optional("selected-next-hop"): bool,
+                "to": str,
+                "via": str,
+                "lsp-name": str,
+            }))
+        }))
+    })
 
     schema = {
             "route-information": {
@@ -3323,49 +3083,39 @@ class ShowRouteReceiveProtocolExtensiveSchema(MetaParser):
     """ Schema for:
             * 'show route receive-protocol bgp {peer_address} {target_address} extensive'
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): {
-                    Optional("@junos:style"): str,
-                    "rt-announced-count": str,
-                    "rt-destination": str,
-                    Optional("active-tag"): str,
-                    Optional("rt-entry"): {
-                        Optional("as-path"): str,
-                        Optional("bgp-rt-flag"): str,
-                        Optional("bgp-path-attributes"): {
-                            "attr-as-path-effective": {
-                                "aspath-effective-string": str,
-                                "attr-value": str
-                            }
-                        },
-                        Optional("local-preference"): str,
-                        Optional("nh"): {
-                            'to': str,
+    validate_route_table_list = ListSchema('route-table', {
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): {
+                Optional("@junos:style"): str,
+                "rt-announced-count": str,
+                "rt-destination": str,
+                Optional("active-tag"): str,
+                Optional("rt-entry"): {
+                    Optional("as-path"): str,
+                    Optional("bgp-rt-flag"): str,
+                    Optional("bgp-path-attributes"): {
+                        "attr-as-path-effective": {
+                            "aspath-effective-string": str,
+                            "attr-value": str
                         }
                     },
-                    "rt-entry-count": {
-                        "#text": str,
-                    },
-                    Optional("rt-prefix-length"): str,
-                    Optional("rt-state"): str,
+                    Optional("local-preference"): str,
+                    Optional("nh"): {
+                        'to': str,
+                    }
+                },
+                "rt-entry-count": {
+                    "#text": str,
                 },
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+                Optional("rt-prefix-length"): str,
+                Optional("rt-state"): str,
+            },
+        "table-name": str,
+        "total-route-count": str
+    })
 
     # Main Schema
     schema = {
@@ -3499,59 +3249,37 @@ class ShowRouteReceiveProtocolPeerAddressExtensiveSchema(MetaParser):
     """ Schema for:
             * 'show route receive-protocol bgp {peer_address} extensive'
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value): 
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            # Create rt entry Schema
-            rt_entry_schema = Schema(
-                    {Optional("@junos:style"): str,
-                    Optional("active-tag"): str,
-                    "rt-announced-count": str,
-                    "rt-destination": str,
-                    Optional("rt-entry"): {
-                        Optional("as-path"): str,
-                        Optional("bgp-rt-flag"): str,
-                        Optional("bgp-path-attributes"): {
-                            "attr-as-path-effective": {
-                                "aspath-effective-string": str,
-                                "attr-value": str
-                            }
-                        },
-                        Optional("local-preference"): str,
-                        Optional("nh"): {
-                            'to': str,
-                        }
-                    },
-                    "rt-entry-count": {
-                        "#text": str,
-                    },
-                    Optional("rt-prefix-length"): str,
-                    Optional("rt-state"): str,}
-            )
-            # Validate each dictionary in list
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_route_table_list = ListSchema('route-table', {
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(ListSchema('rt', {Optional("@junos:style"): str,
+        Optional("active-tag"): str,
+        "rt-announced-count": str,
+        "rt-destination": str,
+        Optional("rt-entry"): {
+            Optional("as-path"): str,
+            Optional("bgp-rt-flag"): str,
+            Optional("bgp-path-attributes"): {
+                "attr-as-path-effective": {
+                    "aspath-effective-string": str,
+                    "attr-value": str
+                }
+            },
+            Optional("local-preference"): str,
+            Optional("nh"): {
+                'to': str,
+            }
+        },
+        "rt-entry-count": {
+            "#text": str,
+        },
+        Optional("rt-prefix-length"): str,
+        Optional("rt-state"): str,})),
+        "table-name": str,
+        "total-route-count": str
+    })
 
     # Main Schema
     schema = {
@@ -3688,20 +3416,12 @@ class ShowRouteInstanceNameSchema(MetaParser):
             * show route instance {name}
     """
     
-    def validate_instance_rib(value):
-        if not isinstance(value, list):
-            raise SchemaError('Instance rib is not a list')
-    
-        instance_rib = Schema({
-            "irib-name": str,
-            "irib-active-count": str,
-            "irib-holddown-count": str,
-            "irib-hidden-count": str,
-        })
-    
-        for item in value:
-            instance_rib.validate(item)
-        return value
+    validate_instance_rib = ListSchema('instance-ribs', {
+        "irib-name": str,
+        "irib-active-count": str,
+        "irib-holddown-count": str,
+        "irib-hidden-count": str,
+    })
 
     # Main Schema
     schema = {
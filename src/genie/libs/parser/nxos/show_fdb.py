@@ -28,6 +28,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.stream import StreamParser
 
 class ShowMacAddressTableBaseSchema(MetaParser):
     """Schema for:
@@ -128,7 +129,8 @@ class ShowMacAddressTableBase(ShowMacAddressTableBaseSchema):
         return ret_dict
 
 
-class ShowMacAddressTableVni(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema):
+class ShowMacAddressTableVni(StreamParser, ShowMacAddressTableBase,
+                             ShowMacAddressTableBaseSchema):
     """Parser for:
         'show mac address-table vni <WORD> | grep <WORD>'
         'show mac address-table local vni <WORD>'"""
@@ -157,7 +159,8 @@ class ShowMacAddressTableVni(ShowMacAddressTableBase, ShowMacAddressTableBaseSch
         return ret_dict
 
 
-class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema):
+class ShowMacAddressTable(StreamParser, ShowMacAddressTableBase,
+                          ShowMacAddressTableBaseSchema):
     """Parser for show mac address-table"""
 
     cli_command = [
@@ -345,7 +348,8 @@ class ShowMacAddressTableLimit(ShowMacAddressTableLimitSchema):
         return ret_dict
 
 
-class ShowSystemInternalL2fwderMac(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema):
+class ShowSystemInternalL2fwderMac(StreamParser, ShowMacAddressTableBase,
+                                   ShowMacAddressTableBaseSchema):
     """Parser for show system internal l2fwder mac"""
 
     cli_command = 'show system internal l2fwder mac'
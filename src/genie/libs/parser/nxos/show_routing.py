@@ -51,6 +51,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.stream import StreamParser
 
 # =================================
 # Parser for 'show routing vrf all'
@@ -547,7 +548,7 @@ class ShowIpRouteSchema(MetaParser):
 # show ip route vrf all
 # show ip route
 # ====================================================
-class ShowIpRoute(ShowIpRouteSchema):
+class ShowIpRoute(StreamParser, ShowIpRouteSchema):
     """Parser for :
         'show ip route {route} {protocol} interface {interface} vrf {vrf}',
         'show ip route {route} {protocol} interface {interface}',
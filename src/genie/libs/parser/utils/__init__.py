@@ -1,3 +1,12 @@
-from .common import get_parser, get_parser_exclude, get_parser_commands
+from .common import get_parser, get_parser_exclude, get_parser_commands, \
+                    clear_parser_cache, get_parser_cache_info, \
+                    warm_parser_cache, preload, resolve_many, \
+                    get_output_parser, parse_output
+from .batch import BatchParser, BatchResult, parse_batch
+from .result_cache import ParseResultCache
+from .validation import ValidationPolicy, get_validation_policy, \
+                        set_validation_policy
+from .metrics import ParserMetrics, get_metrics
+from .pattern_order import PatternProfile
+from .dispatch import get_pattern_profile, set_pattern_profile
 from . import entry_points
-
@@ -0,0 +1,331 @@
+'''Batch parse, the outputs of many devices parsed in a pool of worker
+processes'''
+
+# python
+import os
+import importlib
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from .common import get_output_parser, parse_with, preload, parser_data
+
+# Number of items sent to a worker at once
+BATCH_CHUNKSIZE = 16
+
+# Parser classes already imported by the current process,
+# (module, qualified name) -> class
+_classes = {}
+
+
+def _tokens(platform):
+    '''return the (platform, model) of the platform tokens of an item'''
+    if not platform:
+        return None, None
+    if isinstance(platform, str):
+        return platform, None
+    return platform.get('platform'), platform.get('model')
+
+
+def _load_class(module, name):
+    '''return a parser class from its module and qualified name'''
+    key = (module, name)
+    try:
+        return _classes[key]
+    except KeyError:
+        pass
+
+    parser_cls = importlib.import_module(module)
+    for attribute in name.split('.'):
+        parser_cls = getattr(parser_cls, attribute)
+    _classes[key] = parser_cls
+    return parser_cls
+
+
+def _parser_modules(os_name):
+    '''return the modules of the parsers of an os, token packages included'''
+    modules = set()
+
+    def add(entry, path):
+        if 'module_name' in entry:
+            modules.add('.'.join([entry['package']] + path +
+                                 [entry['module_name']]))
+        for token, value in entry.items():
+            if isinstance(value, dict):
+                add(value, path + [token])
+
+    for command, sources in parser_data.shard(os_name).items():
+        if isinstance(sources, dict) and isinstance(sources.get(os_name),
+                                                    dict):
+            add(sources[os_name], [os_name])
+    return sorted(modules)
+
+
+def _init_worker(os_names):
+    '''Import the parsers of os_names once, when a worker starts'''
+    for os_name in os_names:
+        preload([os_name])
+        for module in _parser_modules(os_name):
+            try:
+                importlib.import_module(module)
+            except Exception:
+                # Parsers whose dependencies are not installed
+                pass
+
+
+def _parse_tasks(tasks):
+    '''Parse a list of (index, module, class name, kwargs, output), return
+       the (index, parsed, error) of each'''
+    results = []
+    for index, module, name, kwargs, output in tasks:
+        try:
+            parsed = parse_with(_load_class(module, name), output, **kwargs)
+        except Exception as e:
+            results.append((index, None, _format_error(e)))
+        else:
+            results.append((index, parsed, None))
+    return results
+
+
+def _format_error(e):
+    return '{}: {}'.format(e.__class__.__name__, e)
+
+
+class BatchResult(object):
+    '''Result of the parse of one item of a batch
+
+        Attributes:
+            index (`int`): position of the item in the batch
+            os (`str`): os of the item
+            platform: platform tokens of the item, as given
+            command (`str`): the command
+            parsed (`dict`): the parsed output, None if it failed
+            error (`str`): '<exception class>: <message>' of the failure,
+                           None if the output was parsed
+    '''
+
+    __slots__ = ('index', 'os', 'platform', 'command', 'parsed', 'error')
+
+    def __init__(self, index, os_name, platform, command, parsed=None,
+                 error=None):
+        self.index = index
+        self.os = os_name
+        self.platform = platform
+        self.command = command
+        self.parsed = parsed
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return '<{} #{} {} {!r} {}>'.format(
+            self.__class__.__name__, self.index, self.os, self.command,
+            'ok' if self.ok else self.error)
+
+
+class BatchParser(object):
+    '''Parse the outputs of many devices in a pool of worker processes.
+
+    The parser class of each distinct (os, platform tokens, command) is
+    resolved once, in the current process, and the outputs are sent to the
+    workers with the location of their parser class. The workers are started
+    once and kept for every batch parsed until the parser is closed, each
+    of them importing the parser modules of `os_names` when it starts
+    instead of on the first output it parses.
+
+    Results are yielded as the workers return them, not in the order of the
+    items; their index gives the position of the item. The failure to
+    resolve or parse an item is reported in its result and does not stop the
+    batch. A chunk whose results are lost, its worker having died or its
+    results not being picklable, is reported as failed for each of its
+    items, and a pool left broken is replaced by a new one.
+
+        Args:
+            processes (`int`): number of worker processes, defaults to the
+                number of cpus. 1 parses in the current process.
+            os_names (`list`): os whose parsers the workers import when they
+                start
+            chunksize (`int`): number of items sent to a worker at once
+
+        example:
+
+            >>> items = [('iosxe', None, 'show version', output), ...]
+            >>> with BatchParser(os_names=['iosxe']) as batch:
+            ...     for result in batch.parse(items):
+            ...         if result.ok:
+            ...             store(result.index, result.parsed)
+    '''
+
+    def __init__(self, processes=None, os_names=None,
+                 chunksize=BATCH_CHUNKSIZE):
+        self.processes = processes or os.cpu_count() or 1
+        self.os_names = list(os_names or [])
+        self.chunksize = chunksize
+        self._pool = None
+        # (os, platform, model, command) -> (module, class name, kwargs)
+        # or error
+        self._resolved = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def pool(self):
+        '''the pool of worker processes, started on first use'''
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                self.processes, initializer=_init_worker,
+                initargs=(self.os_names,))
+        return self._pool
+
+    def close(self):
+        '''Stop the worker processes'''
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def resolve(self, os_name, platform, command):
+        '''return (module, class name, kwargs) of the parser of a command,
+           or the error message if it has none'''
+        platform, model = _tokens(platform)
+        key = (os_name, platform, model, ' '.join(command.split()))
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+
+        try:
+            parser_cls, kwargs = get_output_parser(os_name, command,
+                                                   platform, model)
+        except Exception as e:
+            resolved = _format_error(e)
+        else:
+            resolved = (parser_cls.__module__, parser_cls.__qualname__,
+                        kwargs)
+        self._resolved[key] = resolved
+        return resolved
+
+    def parse(self, items):
+        '''Parse a batch of outputs
+
+            Args:
+                items (`iterable`): (os, platform, command, output) of each
+                    output. platform is None, a platform name, or a dict
+                    with the platform and model.
+
+            Returns:
+                generator of BatchResult, in the order they are parsed
+        '''
+        tasks = self._tasks(items)
+
+        if self.processes == 1:
+            for task, keys in tasks:
+                for result in self._results(_parse_tasks(task), keys):
+                    yield result
+            return
+
+        # A bounded number of chunks is in flight, so that the outputs of a
+        # batch are not all held in memory at once
+        pending = {}
+        for task, keys in tasks:
+            if not task:
+                for result in self._results([], keys):
+                    yield result
+                continue
+
+            future = self._submit(task)
+            pending[future] = (self._pool, keys)
+            if len(pending) >= self.processes * 4:
+                for result in self._wait(pending):
+                    yield result
+
+        while pending:
+            for result in self._wait(pending):
+                yield result
+
+    def _wait(self, pending):
+        '''yield the results of the chunks parsed first'''
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pool, keys = pending.pop(future)
+            try:
+                parsed = future.result()
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool) and pool is self._pool:
+                    self._discard_pool()
+                error = _format_error(e)
+                parsed = [(index, None, error)
+                          for index, key in keys.items() if key[3] is None]
+            for result in self._results(parsed, keys):
+                yield result
+
+    def _submit(self, task):
+        '''return the future of a chunk, sent to a new pool if the pool broke
+           since the last chunk'''
+        try:
+            return self.pool.submit(_parse_tasks, task)
+        except BrokenProcessPool:
+            self._discard_pool()
+            return self.pool.submit(_parse_tasks, task)
+
+    def _discard_pool(self):
+        '''Drop a broken pool, the next chunk starts a new one'''
+        self._pool.shutdown(wait=False)
+        self._pool = None
+
+    def _tasks(self, items):
+        '''yield (task, keys) chunks of the items, keys holds the item of
+           every index, and the error of the ones which were not resolved'''
+        task = []
+        keys = {}
+        for index, (os_name, platform, command, output) in enumerate(items):
+            resolved = self.resolve(os_name, platform, command)
+            if isinstance(resolved, str):
+                keys[index] = (os_name, platform, command, resolved)
+            else:
+                module, name, kwargs = resolved
+                task.append((index, module, name, kwargs, output))
+                keys[index] = (os_name, platform, command, None)
+
+            if len(keys) >= self.chunksize:
+                yield task, keys
+                task = []
+                keys = {}
+
+        if keys:
+            yield task, keys
+
+    @staticmethod
+    def _results(parsed, keys):
+        for index, result, error in parsed:
+            os_name, platform, command, _ = keys.pop(index)
+            yield BatchResult(index, os_name, platform, command, result,
+                              error)
+
+        # Items which could not be resolved
+        for index, (os_name, platform, command, error) in keys.items():
+            yield BatchResult(index, os_name, platform, command, None, error)
+
+
+def parse_batch(items, processes=None, os_names=None,
+                chunksize=BATCH_CHUNKSIZE):
+    '''Parse a batch of outputs in a pool of worker processes started for
+       the batch, see BatchParser
+
+        Args:
+            items (`iterable`): (os, platform, command, output) of each output
+            processes (`int`): number of worker processes
+            os_names (`list`): os whose parsers the workers import when they
+                start
+            chunksize (`int`): number of items sent to a worker at once
+
+        Returns:
+            generator of BatchResult, in the order they are parsed
+    '''
+    with BatchParser(processes, os_names, chunksize) as batch:
+        for result in batch.parse(items):
+            yield result
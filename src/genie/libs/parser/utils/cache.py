@@ -0,0 +1,80 @@
+'''Bounded caches used by the parser lookup functions'''
+
+# python
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+# Sentinel returned by LRUCache.get when the key is not cached
+MISSING = object()
+
+
+class LRUCache(object):
+    '''Thread safe least recently used cache with hit and miss counters
+
+        Args:
+            maxsize (`int`): maximum number of entries kept, None for
+                             unbounded
+
+        example:
+
+            >>> cache = LRUCache(maxsize=2)
+            >>> cache.put('a', 1)
+            >>> cache.get('a')
+            1
+            >>> cache.info()
+            CacheInfo(hits=1, misses=0, maxsize=2, currsize=1)
+    '''
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=MISSING):
+        '''return the cached value of key and mark it as recently used'''
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        '''cache value under key, evict the least recently used entries'''
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        '''remove every entry, the counters are kept'''
+        with self._lock:
+            self._data.clear()
+
+    def reset(self):
+        '''remove every entry and reset the counters'''
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
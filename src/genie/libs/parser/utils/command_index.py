@@ -0,0 +1,157 @@
+'''Token trie index over the parser command templates'''
+
+# python
+import re
+import bisect
+
+# Arguments which can only span a single search token, every other
+# argument can span up to two tokens (see `common._matches_fuzzy`)
+SINGLE_TOKEN_ARGUMENTS = {'vrf', 'rd', 'instance', 'vrf_type', 'feature',
+                          'fileA', 'fileB'}
+
+
+class _Node(object):
+    '''A single command token position within the trie'''
+
+    __slots__ = ('literals', '_keys', 'arguments', 'partials', 'commands',
+                 'oses')
+
+    def __init__(self):
+        # literal token -> _Node
+        self.literals = {}
+        # sorted literal tokens, rebuilt lazily for prefix lookups
+        self._keys = None
+        # argument token ('{vrf}') -> (_Node, maximum tokens spanned)
+        self.arguments = {}
+        # token with an embedded argument ('v1/{interface}') -> _Node
+        self.partials = {}
+        # commands ending at this node
+        self.commands = set()
+        # all the os found within this subtree
+        self.oses = set()
+
+    def child(self, token):
+        '''return the child node for a command token, create it if needed'''
+        if token.startswith('{'):
+            if token not in self.arguments:
+                key = re.search('{(.*)}', token).groups()[0]
+                span = 1 if key in SINGLE_TOKEN_ARGUMENTS else 2
+                self.arguments[token] = (_Node(), span)
+            return self.arguments[token][0]
+
+        if '{' in token:
+            return self.partials.setdefault(token, _Node())
+
+        if token not in self.literals:
+            self.literals[token] = _Node()
+            self._keys = None
+        return self.literals[token]
+
+    def prefixed(self, token):
+        '''yield every literal child which starts with token'''
+        if self._keys is None:
+            self._keys = sorted(self.literals)
+
+        keys = self._keys
+        index = bisect.bisect_left(keys, token)
+        while index < len(keys) and keys[index].startswith(token):
+            yield self.literals[keys[index]]
+            index += 1
+
+
+class CommandIndex(object):
+    '''Token trie over the command templates of the parser data.
+
+    Literal command tokens are edges which can be reached by any prefix of
+    the token, arguments (`{vrf}`) are wildcard edges spanning one or two
+    search tokens. Every node knows which os are found below it, so a
+    search limited to one os never walks into another os' commands.
+
+    The index only narrows down the candidate commands, scoring and
+    argument extraction is still done by `common._matches_fuzzy` so the
+    results are identical to a full scan of the parser data.
+    '''
+
+    def __init__(self, data=None):
+        self._root = _Node()
+        # command -> insertion position, keeps the parser data ordering
+        self._position = {}
+
+        for command, source in (data or {}).items():
+            self.add(command, source)
+
+    def __len__(self):
+        return len(self._position)
+
+    def __contains__(self, command):
+        return command in self._position
+
+    def add(self, command, source):
+        '''Add a command, or the new os of an existing command, to the index
+
+            Args:
+                command (`str`): the command template
+                source (`dict`): the command data, keyed by os
+        '''
+        self._position.setdefault(command, len(self._position))
+        oses = set(source)
+
+        node = self._root
+        node.oses.update(oses)
+        for token in command.split():
+            node = node.child(token)
+            node.oses.update(oses)
+        node.commands.add(command)
+
+    def candidates(self, tokens, os=None, complete=True):
+        '''Find the commands which could match the search tokens
+
+            Args:
+                tokens (`list`): the regular search tokens
+                os (`str`): the os that the search space is limited to
+                complete (`bool`): True if tokens is the whole search, False
+                                   if it is only the regular prefix of it and
+                                   every command below should be returned
+
+            Returns:
+                list: candidate commands, in parser data order
+        '''
+        found = set()
+        self._walk(self._root, tokens, 0, os, complete, found)
+        return sorted(found, key=self._position.__getitem__)
+
+    def _walk(self, node, tokens, i, os, complete, found):
+        if os and os not in node.oses:
+            return
+
+        if i == len(tokens):
+            if complete:
+                found.update(node.commands)
+            else:
+                self._collect(node, os, found)
+            return
+
+        token = tokens[i]
+        for child in node.prefixed(token):
+            self._walk(child, tokens, i + 1, os, complete, found)
+
+        for child in node.partials.values():
+            self._walk(child, tokens, i + 1, os, complete, found)
+
+        for child, span in node.arguments.values():
+            for size in range(1, span + 1):
+                if i + size > len(tokens):
+                    break
+                self._walk(child, tokens, i + size, os, complete, found)
+
+    def _collect(self, node, os, found):
+        if os and os not in node.oses:
+            return
+
+        found.update(node.commands)
+        for child in node.literals.values():
+            self._collect(child, os, found)
+        for child in node.partials.values():
+            self._collect(child, os, found)
+        for child, _ in node.arguments.values():
+            self._collect(child, os, found)
@@ -6,9 +6,11 @@ import os
 import sys
 import json
 import math
+import time
 import logging
 import warnings
 import importlib
+import threading
 
 from genie.libs import parser
 from genie.abstract import Lookup
@@ -16,51 +18,338 @@ from genie.metaparser.util import merge_dict
 
 from pyats import configuration as cfg
 from .extension import ExtendParsers
+from .command_index import CommandIndex
+from .cache import LRUCache, MISSING
+from .registry import ParserRegistry, shard_parser_data
+from .validation import get_validation_policy
 
 PYATS_EXT_PARSER = 'pyats.libs.external.parser'
 
+# 'import' (default) or 'static', see ExtendParsers
+PYATS_EXT_PARSER_DISCOVERY = 'pyats.libs.external.parser_discovery'
+
+# Number of get_parser resolutions kept in the parser cache
+PARSER_CACHE_SIZE = 4096
+
+# Device attributes which the abstraction lookup can use as tokens
+DEVICE_TOKENS = ('os', 'platform', 'model')
+
 log = logging.getLogger(__name__)
 
-def _load_parser_json():
-    '''get all parser data in json file'''
+# Only these keys are needed to dispatch a command to its parser class
+RUNTIME_KEYS = ('module_name', 'package', 'class')
+
+def _parser_json_path(name='parsers.json'):
+    '''return the path of a json file shipped with genie.libs.parser'''
     try:
         mod = importlib.import_module('genie.libs.parser')
-        parsers = os.path.join(mod.__path__[0], 'parsers.json')
+        return os.path.join(mod.__path__[0], name)
     except Exception:
-        parsers = ''
-    if not os.path.isfile(parsers):
+        return ''
+
+def _strip_parser_data(data):
+    '''Recursively remove doc, schema, url and uid from the parser data,
+       keeping the token levels and the runtime keys only'''
+    if not isinstance(data, dict):
+        return data
+
+    stripped = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            stripped[key] = _strip_parser_data(value)
+        elif key in RUNTIME_KEYS or isinstance(value, list):
+            stripped[key] = value
+    return stripped
+
+def make_runtime_index(parsers=None, output=None):
+    '''Write the compact runtime index (command -> os -> module_name,
+       package and class) from the full parsers.json, along with one shard
+       per os in the parsers_index directory next to it
+
+        Args:
+            parsers (`str`): path of parsers.json, default the one shipped
+                             with genie.libs.parser
+            output (`str`): path of the index to write, default
+                            parsers_index.json next to parsers.json
+
+        Returns:
+            str: the path of the written index
+    '''
+    parsers = parsers or _parser_json_path()
+    output = output or os.path.join(os.path.dirname(parsers),
+                                    'parsers_index.json')
+
+    with open(parsers) as f:
+        data = _strip_parser_data(json.load(f))
+
+    with open(output, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+
+    shards = os.path.join(os.path.dirname(output), 'parsers_index')
+    os.makedirs(shards, exist_ok=True)
+
+    os_names = set()
+    for command, source in data.items():
+        if isinstance(source, dict):
+            os_names.update(source)
+
+    for os_name in os_names:
+        with open(os.path.join(shards, os_name + '.json'), 'w') as f:
+            json.dump(shard_parser_data(data, os_name), f,
+                      separators=(',', ':'))
+
+    return output
+
+def _is_up_to_date(path, parsers):
+    '''True if the generated file exists and is not older than parsers'''
+    return os.path.isfile(path) and (not os.path.isfile(parsers) or
+        os.path.getmtime(path) >= os.path.getmtime(parsers))
+
+def _load_runtime_index():
+    '''Load the compact runtime index, falling back on the full
+       parsers.json when the index was not built or is outdated'''
+    parsers = _parser_json_path()
+    index = _parser_json_path('parsers_index.json')
+
+    if _is_up_to_date(index, parsers):
+        with open(index) as f:
+            return json.load(f)
+
+    if os.path.isfile(parsers):
+        with open(parsers) as f:
+            return _strip_parser_data(json.load(f))
+
+    return None
+
+# External parser data, loaded once for the registry and all its shards
+_ext_parser_data = None
+
+def _load_ext_parser_data():
+    '''get the parser data of the external parser package, if configured'''
+    global _ext_parser_data
+    if _ext_parser_data is not None:
+        return _ext_parser_data
+
+    _ext_parser_data = {}
+
+    # check if provided external parser packages
+    ext_parser_package = cfg.get(PYATS_EXT_PARSER, None) or \
+        os.environ.get(PYATS_EXT_PARSER.upper().replace('.', '_'))
+    if ext_parser_package:
+        discovery = cfg.get(PYATS_EXT_PARSER_DISCOVERY, None) or \
+            os.environ.get(PYATS_EXT_PARSER_DISCOVERY.upper().replace('.', '_'),
+                           ExtendParsers.IMPORT)
+        ext = ExtendParsers(ext_parser_package, discovery=discovery)
+        ext.extend()
+
+        ext.output.pop('tokens', None)
+        summary = ext.output.pop('extend_info', None)
+
+        _ext_parser_data = ext.output
+        clear_parser_cache()
+        log.warning("External parser counts: {}\nSummary:\n{}"
+            .format(len(summary), json.dumps(summary, indent=2)))
+
+    return _ext_parser_data
+
+def _load_parser_json():
+    '''get all parser data in json file'''
+    parser_data = _load_runtime_index()
+    if parser_data is None:
         log.warning('parsers.json does not exist, make sure you '
                     'are running with latest version of '
                     'genie.libs.parsers')
         parser_data = {}
     else:
-        # Open all the parsers in json file
-        with open(parsers) as f:
-            parser_data = json.load(f)
+        merge_dict(parser_data, _load_ext_parser_data(), update=True)
 
-        # check if provided external parser packages
-        ext_parser_package = cfg.get(PYATS_EXT_PARSER, None) or \
-            os.environ.get(PYATS_EXT_PARSER.upper().replace('.', '_'))
-        if ext_parser_package:
-            ext = ExtendParsers(ext_parser_package)
-            ext.extend()
+    return parser_data
 
-            ext.output.pop('tokens', None)
-            summary = ext.output.pop('extend_info', None)
+def _load_parser_shard(os_name):
+    '''get the parser data of a single os from its runtime index shard,
+       None if the shards were not built'''
+    if not isinstance(os_name, str):
+        return None
 
-            merge_dict(parser_data, ext.output, update=True)
-            log.warning("External parser counts: {}\nSummary:\n{}"
-                .format(len(summary), json.dumps(summary, indent=2)))
+    parsers = _parser_json_path()
+    shard = _parser_json_path(os.path.join('parsers_index', os_name + '.json'))
 
+    if not _is_up_to_date(shard, parsers):
+        return None
+
+    with open(shard) as f:
+        parser_data = json.load(f)
+
+    merge_dict(parser_data,
+               shard_parser_data(_load_ext_parser_data(), os_name),
+               update=True)
     return parser_data
 
-# Parser within Genie
-parser_data = _load_parser_json()
+# Full parsers.json with doc, schema and url, only loaded for tooling
+_parser_details = None
+
+def get_parser_details(command, os_name=None):
+    '''return the parsers.json entry of a command, including the doc,
+       schema and url which are not part of parser_data
+
+        Args:
+            command (`str`): the exact command, as found in parser_data
+            os_name (`str`): only return the entry of this os
+
+        Returns:
+            dict: the entry of the command, empty if not found
+    '''
+    global _parser_details
+    if _parser_details is None:
+        parsers = _parser_json_path()
+        if os.path.isfile(parsers):
+            with open(parsers) as f:
+                _parser_details = json.load(f)
+        else:
+            _parser_details = {}
+
+    details = _parser_details.get(command, {})
+    if os_name:
+        return details.get(os_name, {})
+    return details
+
+# Resolved (parser class, kwargs) of get_parser, keyed on the normalized
+# command and the device abstraction (see _device_key)
+_parser_cache = LRUCache(maxsize=PARSER_CACHE_SIZE)
+
+# Version of parser_data when the parser cache was last invalidated
+_parser_cache_version = None
+
+# Resolved (parser class, kwargs) of parse_output, keyed on the os, platform,
+# model and normalized command
+_output_parser_cache = LRUCache(maxsize=PARSER_CACHE_SIZE)
+
+def clear_parser_cache():
+    '''Invalidate all cached get_parser resolutions.
+
+       Modifications done through parser_data, the command entries read from
+       it included, invalidate it automatically. This must be called when a
+       dictionary of the parser data is modified otherwise.'''
+    global _parser_cache_version
+    _parser_cache.clear()
+    _lookup_cache.clear()
+    _parser_cls_cache.clear()
+    _output_parser_cache.clear()
+    _parser_cache_version = None
+
+def _check_parser_cache():
+    '''Invalidate the parser cache if parser_data was modified'''
+    global _parser_cache_version
+    if _parser_cache_version != parser_data.version:
+        _parser_cache.clear()
+        _output_parser_cache.clear()
+        _parser_cache_version = parser_data.version
+
+def get_parser_cache_info():
+    '''return the hits, misses, maxsize and currsize of the parser cache'''
+    return _parser_cache.info()
+
+def warm_parser_cache(commands, device):
+    '''Resolve a list of commands for a device ahead of time
+
+        Args:
+            commands (`list`): show commands to resolve
+            device (`Device`): the device the commands are run on
+
+        Returns:
+            list: the commands which could not be resolved
+    '''
+    unresolved = []
+    for command in commands:
+        try:
+            get_parser(command, device)
+        except Exception:
+            unresolved.append(command)
+    return unresolved
+
+def _abstraction_order(device):
+    '''return the abstraction order of the device, None if not set'''
+    try:
+        return device.custom.get('abstraction').get('order', [])
+    except AttributeError:
+        return None
+
+def _device_key(device, order_list):
+    '''Build the key of the device abstraction, all the device attributes
+       which the abstraction lookup may use are part of it'''
+    order = tuple(order_list) if isinstance(order_list, (list, tuple)) else ()
+    attributes = DEVICE_TOKENS + tuple(a for a in order
+                                       if a not in DEVICE_TOKENS)
+    return (order, tuple(str(getattr(device, a, None)) for a in attributes))
+
+# Lookup per (package, device abstraction) and parser class per
+# (package, module, class, device abstraction), identical devices share them
+_lookup_cache = LRUCache(maxsize=PARSER_CACHE_SIZE)
+_parser_cls_cache = LRUCache(maxsize=PARSER_CACHE_SIZE)
+
+# (package, module name) -> seconds the first resolution of a parser of the
+# module took, which imports it when it was registered without importing it
+parser_import_times = {}
+
+def _get_lookup(device, package, device_key=None):
+    '''return the abstraction Lookup of a package for a device
+
+        Args:
+            device (`Device`): the device
+            package (`str`): the package name
+            device_key (`tuple`): the device abstraction key, if known
+
+        Returns:
+            Lookup: shared by all the devices with the same abstraction
+    '''
+    if device_key is None:
+        device_key = _device_key(device, _abstraction_order(device))
+
+    key = (package, device_key)
+    lookup = _lookup_cache.get(key)
+    if lookup is MISSING:
+        lookup = Lookup.from_device(device, packages={
+            'parser': importlib.import_module(package)})
+        _lookup_cache.put(key, lookup)
+    return lookup
+
+# Parser within Genie, loaded on first use
+parser_data = ParserRegistry(_load_parser_json, _load_parser_shard)
+
+# os (None for all) -> (parser_data version, token trie over its commands)
+_command_indexes = {}
+
+def _get_command_index(os_name=None):
+    '''return the command index of an os shard, or of the whole
+       parser_data, rebuild it if parser_data was modified'''
+    version, index = _command_indexes.get(os_name, (None, None))
+    if index is None or version != parser_data.version:
+        data = parser_data.shard(os_name) if os_name else parser_data
+        index = CommandIndex(data)
+        _command_indexes[os_name] = (parser_data.version, index)
+    return index
+
+def preload(os_names=None):
+    '''Load the parser data and build the command index now instead of on
+       the first lookup, for example before forking worker processes
+
+        Args:
+            os_names (`list`): only load the shards of these os
+    '''
+    parser_data.preload(os_names)
+    for os_name in os_names or [None]:
+        _get_command_index(os_name)
 
 def get_parser_commands(device, data=parser_data):
     '''Remove all commands which contain { as this requires
        extra kwargs which cannot be guessed dynamically
-       Remove the ones that arent related to this os'''
+       Remove the ones that arent related to this os
+
+       With the default parser data the commands are precomputed per os and
+       returned as an immutable tuple'''
+
+    if isinstance(data, ParserRegistry):
+        return data.commands(device.os)
 
     commands = []
     for command, values in data.items():
@@ -93,12 +382,34 @@ def get_parser_exclude(command, device):
 def get_parser(command, device, fuzzy=False):
     '''From a show command and device, return parser class and kwargs if any'''
 
-    try:
-        order_list = device.custom.get('abstraction').get('order', [])
-    except AttributeError:
-        order_list = None
+    order_list = _abstraction_order(device)
+    device_key = _device_key(device, order_list)
+
+    if not fuzzy:
+        key = (' '.join(command.split()), device_key)
+
+        _check_parser_cache()
+        cached = _parser_cache.get(key)
+        if cached is not MISSING:
+            return cached[0], dict(cached[1])
 
-    lookup = Lookup.from_device(device, packages={'parser': parser})
+    lookup = _get_lookup(device, parser.__name__, device_key)
+    valid_results = _resolve_command(command, device, fuzzy, lookup,
+                                     order_list, device_key)
+
+    if not valid_results:
+        raise Exception("Could not find parser for "
+                        "'{c}' under {l}".format(c=command, l=lookup._tokens))
+
+    if not fuzzy:
+        _parser_cache.put(key, (valid_results[0][1], valid_results[0][2]))
+        return valid_results[0][1], dict(valid_results[0][2])
+
+    return valid_results
+
+def _resolve_command(command, device, fuzzy, lookup, order_list, device_key):
+    '''Search a command and return (found command, parser class, kwargs) of
+       every result which has a parser for the device abstraction'''
     results = _fuzzy_search_command(command, fuzzy, device.os, order_list)
     valid_results = []
     
@@ -115,20 +426,272 @@ def get_parser(command, device, fuzzy=False):
 
         try:
             valid_results.append((found_command, 
-                                        _find_parser_cls(device, data), kwargs))
+                            _find_parser_cls(device, data, device_key), kwargs))
         except KeyError:
             # Case when the show command is only found under one of
             # the child level tokens
             continue
 
-    if not valid_results:
-        raise Exception("Could not find parser for "
-                        "'{c}' under {l}".format(c=command, l=lookup._tokens))
+    return valid_results
 
-    if not fuzzy:
-        return valid_results[0][1], valid_results[0][2]
+def resolve_many(commands, device):
+    '''Resolve the parser class and kwargs of a list of commands at once.
 
-    return valid_results
+       The device abstraction, its Lookup and the command index of its os are
+       computed once for the whole list, and the get_parser cache is shared.
+
+        Args:
+            commands (`list`): show commands to resolve
+            device (`Device`): the device the commands are run on
+
+        Returns:
+            ResolvedCommands: the parser class and kwargs of each resolved
+                              command, plus the unresolved and ambiguous ones
+
+        example:
+
+            >>> resolved = resolve_many(['show version', 'show vrf'], device)
+            >>> resolved.parsers['show version']
+            (<class 'genie.libs.parser.iosxe.show_platform.ShowVersion'>, {})
+    '''
+    order_list = _abstraction_order(device)
+    device_key = _device_key(device, order_list)
+    lookup = _get_lookup(device, parser.__name__, device_key)
+
+    _check_parser_cache()
+    resolved = ResolvedCommands()
+    for command in commands:
+        if command in resolved:
+            continue
+
+        key = (' '.join(command.split()), device_key)
+        cached = _parser_cache.get(key)
+        if cached is not MISSING:
+            resolved.parsers[command] = (cached[0], dict(cached[1]))
+            continue
+
+        try:
+            valid_results = _resolve_command(command, device, False, lookup,
+                                             order_list, device_key)
+        except AmbiguousCommandError as e:
+            resolved.ambiguous[command] = e.matches
+            continue
+
+        if not valid_results:
+            resolved.unresolved[command] = "Could not find parser for " \
+                "'{c}' under {l}".format(c=command, l=lookup._tokens)
+            continue
+
+        _, parser_cls, kwargs = valid_results[0]
+        _parser_cache.put(key, (parser_cls, kwargs))
+        resolved.parsers[command] = (parser_cls, dict(kwargs))
+
+    return resolved
+
+
+def get_output_parser(os_name, command, platform=None, model=None):
+    '''return the parser class and kwargs of a command, found from the os,
+       platform and model instead of a device
+
+        Args:
+            os_name (`str`): the os of the device the output is from
+            command (`str`): the show command
+            platform (`str`): the platform of the device, if known
+            model (`str`): the model of the device, if known
+
+        Returns:
+            tuple: (parser class, kwargs)
+
+    The parser class is found in parser_data and imported from the package
+    of the most specific token (os, platform, model) it is registered under,
+    the same class get_parser finds with the default abstraction order,
+    without building a device or an abstraction Lookup.
+    '''
+    key = (os_name, platform, model, ' '.join(command.split()))
+
+    _check_parser_cache()
+    cached = _output_parser_cache.get(key)
+    if cached is MISSING:
+        cached = _find_output_parser(os_name, key[3], platform, model)
+        _output_parser_cache.put(key, cached)
+    return cached[0], dict(cached[1])
+
+def _find_output_parser(os_name, command, platform, model):
+    tokens = [os_name] + [token for token in (platform, model) if token]
+    for found_command, data, kwargs in _fuzzy_search_command(command, False,
+                                                             os_name):
+        if found_command == 'tokens':
+            continue
+
+        # Take the farthest token the command is registered under, the
+        # parser class is within the package of that token
+        path = []
+        for token in tokens:
+            if token in data:
+                data = data[token]
+                path.append(token)
+
+        if 'module_name' not in data:
+            # Only found under other tokens
+            continue
+
+        module = importlib.import_module('.'.join(
+            [data['package']] + path + [data['module_name']]))
+        return getattr(module, data['class']), kwargs
+
+    raise Exception("Could not find parser for "
+                    "'{c}' under {l}".format(c=command, l=tokens))
+
+# Parser instances kept for reuse, per thread, parser class ->
+# (instance, attributes of the instance when it was built)
+_parser_instances = threading.local()
+
+# Attributes MetaParser.parse() sets on every call, left out when looking
+# for the attributes a parser modified
+_PARSE_ATTRIBUTES = frozenset(['parsed_output', 'schema_validated'])
+
+
+def _instance_state(instance):
+    return {name: value for name, value in vars(instance).items()
+            if name not in _PARSE_ATTRIBUTES}
+
+def parse_with(parser_cls, output=None, device=None, **kwargs):
+    '''Parse an output with a parser class, without a device unless the
+       command is to be executed
+
+        Args:
+            parser_cls (`class`): the parser class
+            output (`str`): the output of the command
+            device (`Device`): device the command is executed on when no
+                output is given
+            kwargs: the arguments of cli(), other than output
+
+        Returns:
+            dict: the parsed output, validated against the schema unless the
+                  validation policy skips it
+
+    An instance of the parser is reused for the outputs of a thread, as long
+    as parsing leaves its attributes untouched, other than the parsed output
+    MetaParser.parse() keeps. Parsers which keep anything else on the
+    instance get a new one for every output.
+    '''
+    if device is not None:
+        return get_validation_policy().parse(parser_cls(device=device),
+                                             output, **kwargs)
+
+    try:
+        instances = _parser_instances.instances
+    except AttributeError:
+        instances = _parser_instances.instances = {}
+
+    # Removed while in use, a parser may parse with its own class
+    instance, state = instances.pop(parser_cls, (None, None))
+    if instance is None:
+        instance = parser_cls(device=None)
+        state = _instance_state(instance)
+
+    try:
+        return get_validation_policy().parse(instance, output, **kwargs)
+    finally:
+        attributes = _instance_state(instance)
+        if len(attributes) == len(state) and \
+                all(attributes.get(name, MISSING) is value
+                    for name, value in state.items()):
+            instances[parser_cls] = (instance, state)
+
+def parse_output(os_name, command, output, platform=None, model=None,
+                 cache=None):
+    '''Parse the output of a command without a device
+
+        Args:
+            os_name (`str`): the os of the device the output is from
+            command (`str`): the show command
+            output (`str`): the output of the command
+            platform (`str`): the platform of the device, if known
+            model (`str`): the model of the device, if known
+            cache (`ParseResultCache`): cache the result is looked up in,
+                and kept in once parsed
+
+        Returns:
+            dict: the parsed output, validated against the schema
+
+        Raises:
+            Exception: no parser was found for the command
+            SchemaEmptyParserError: nothing was parsed from the output
+
+        example:
+
+            >>> parse_output('iosxe', 'show ip route', output)
+            {'vrf': {'default': ...}}
+    '''
+    parser_cls, kwargs = get_output_parser(os_name, command, platform, model)
+    if cache is not None:
+        return cache.parse(parser_cls, output, **kwargs)
+    return parse_with(parser_cls, output, **kwargs)
+
+
+class AmbiguousCommandError(Exception):
+    '''Raised when a search matches several commands with different
+       arguments'''
+
+    def __init__(self, message, matches):
+        super().__init__(message)
+        self.matches = matches
+
+
+class ResolvedCommands(object):
+    '''Result of resolve_many
+
+        Attributes:
+            parsers (`dict`): command -> (parser class, kwargs)
+            unresolved (`dict`): command -> reason no parser was found
+            ambiguous (`dict`): command -> list of the commands it matched
+
+    The result can be pickled, or converted to json compatible data with
+    to_dict and back with from_dict, to resolve once and ship the result to
+    worker processes.
+    '''
+
+    def __init__(self, parsers=None, unresolved=None, ambiguous=None):
+        self.parsers = parsers or {}
+        self.unresolved = unresolved or {}
+        self.ambiguous = ambiguous or {}
+
+    def __contains__(self, command):
+        return command in self.parsers or command in self.unresolved or \
+            command in self.ambiguous
+
+    def __repr__(self):
+        return '<{} resolved={} unresolved={} ambiguous={}>'.format(
+            self.__class__.__name__, len(self.parsers), len(self.unresolved),
+            len(self.ambiguous))
+
+    def to_dict(self):
+        '''return the result with the parser classes as module and class
+           names'''
+        return {
+            'parsers': {
+                command: {'module': parser_cls.__module__,
+                          'class': parser_cls.__qualname__,
+                          'kwargs': kwargs}
+                for command, (parser_cls, kwargs) in self.parsers.items()},
+            'unresolved': dict(self.unresolved),
+            'ambiguous': {command: list(matches)
+                          for command, matches in self.ambiguous.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        '''build the result from to_dict, importing the parser classes'''
+        parsers = {}
+        for command, location in data.get('parsers', {}).items():
+            parser_cls = importlib.import_module(location['module'])
+            for name in location['class'].split('.'):
+                parser_cls = getattr(parser_cls, name)
+            parsers[command] = (parser_cls, dict(location['kwargs']))
+
+        return cls(parsers, dict(data.get('unresolved', {})),
+                   dict(data.get('ambiguous', {})))
 
 def _fuzzy_search_command(search, fuzzy, os=None, order_list=None, 
                                                                 device=None):
@@ -144,9 +707,12 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
         Returns:
             list: the result of the search
     """
+    # Only search the commands of the os
+    data = parser_data.shard(os) if os else parser_data
+
     # Perfect match should return 
-    if search in parser_data:
-        return [(search, parser_data[search], {})]
+    if search in data:
+        return [(search, data[search], {})]
 
     # Preprocess if fuzzy
     if fuzzy:
@@ -161,7 +727,21 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
     best_score = -math.inf
     result = []
 
-    for command, source in parser_data.items():
+    # Only the commands reachable in the index with the regular tokens
+    # can match, regex tokens can span anything after those
+    regular = []
+    for token in tokens:
+        if fuzzy:
+            if token != '*' and not _is_regular_token(token):
+                break
+            token = token.replace(r'\|', '|').replace(r'\.', '.')
+        regular.append(token)
+
+    candidates = _get_command_index(os).candidates(
+        regular, os, complete=len(regular) == len(tokens))
+
+    for command in candidates:
+        source = data[command]
         # Tokens and kwargs parameter must be non reference
         match_result = _matches_fuzzy(0, 0, tokens.copy(),
                                                         command, {}, fuzzy)
@@ -204,10 +784,12 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
             return [result[0]]
         else:
             # Search is ambiguous
-            raise Exception("\nSearch for '" + search +  "' is ambiguous. " + 
+            raise AmbiguousCommandError(
+                            "\nSearch for '" + search +  "' is ambiguous. " + 
                             "Please be more specific in your keywords.\n\n" +
                             "Results matched:\n" + '\n'.join(
-                                                '> ' + i[0] for i in result))
+                                                '> ' + i[0] for i in result),
+                            [i[0] for i in result])
 
     return result
 
@@ -487,10 +1069,22 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
         return None
 
 
-def _find_parser_cls(device, data):
-    lookup = Lookup.from_device(device, packages={'parser':importlib.import_module(data['package'])})
+def _find_parser_cls(device, data, device_key=None):
+    if device_key is None:
+        device_key = _device_key(device, _abstraction_order(device))
+
+    key = (data['package'], data['module_name'], data['class'], device_key)
+    parser_cls = _parser_cls_cache.get(key)
+    if parser_cls is MISSING:
+        start = time.time()
+        lookup = _get_lookup(device, data['package'], device_key)
+        parser_cls = getattr(getattr(lookup.parser, data['module_name']),
+                             data['class'])
+        parser_import_times.setdefault((data['package'], data['module_name']),
+                                       time.time() - start)
+        _parser_cls_cache.put(key, parser_cls)
 
-    return getattr(getattr(lookup.parser, data['module_name']), data['class'])
+    return parser_cls
 
 
 class Common():
@@ -0,0 +1,391 @@
+'''Line dispatcher, which only tries the patterns of a parser that can match a
+line instead of every pattern in turn'''
+
+# python
+import os
+import re
+import weakref
+
+# pyats
+from pyats import configuration as cfg
+
+from .metrics import get_metrics
+from .pattern_order import PatternProfile
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:
+    # python < 3.11
+    import sre_parse
+    import sre_constants
+
+# Characters removed by str.lstrip and matched by \s
+_WHITESPACE = ''.join(chr(i) for i in range(0x3001) if chr(i).isspace())
+
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: r'\d',
+    sre_constants.CATEGORY_NOT_DIGIT: r'\D',
+    sre_constants.CATEGORY_SPACE: r'\s',
+    sre_constants.CATEGORY_NOT_SPACE: r'\S',
+    sre_constants.CATEGORY_WORD: r'\w',
+    sre_constants.CATEGORY_NOT_WORD: r'\W',
+}
+
+_REPEATS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+            getattr(sre_constants, 'POSSESSIVE_REPEAT', None)} - {None}
+
+_GROUPS = {sre_constants.SUBPATTERN,
+           getattr(sre_constants, 'ATOMIC_GROUP', None)} - {None}
+
+# Zero width items, which do not consume the first character
+_ZERO_WIDTH = {sre_constants.AT, sre_constants.ASSERT,
+               sre_constants.ASSERT_NOT}
+
+# Flags which change the characters an item matches
+_CHARSET_FLAGS = re.IGNORECASE | re.ASCII | re.LOCALE
+
+# Profile of the pattern hits ordering the patterns, a json file saved by
+# PatternProfile.save
+PATTERN_PROFILE = 'genie.libs.parser.pattern_profile'
+
+_metrics = get_metrics()
+
+# Every dispatcher, indexed again when the pattern profile changes
+_dispatchers = weakref.WeakSet()
+_profile = None
+
+
+class _Unknown(Exception):
+    '''The first characters of a pattern item cannot be found'''
+
+
+def _charset(items):
+    '''return the class source of an IN item'''
+    negate = ''
+    parts = []
+    for op, av in items:
+        if op == sre_constants.NEGATE:
+            negate = '^'
+        elif op == sre_constants.LITERAL:
+            parts.append(re.escape(chr(av)))
+        elif op == sre_constants.RANGE:
+            parts.append('{}-{}'.format(re.escape(chr(av[0])),
+                                        re.escape(chr(av[1]))))
+        elif op == sre_constants.CATEGORY and av in _CATEGORIES:
+            parts.append(_CATEGORIES[av])
+        else:
+            raise _Unknown(op)
+    return '[{}{}]'.format(negate, ''.join(parts))
+
+
+def _first(items):
+    '''return (character class sources, nullable) of a sequence of items.
+
+    The classes match every first character of the strings the items can
+    match, nullable is True if the items can match an empty string.
+    '''
+    classes = []
+    for op, av in items:
+        if op in _ZERO_WIDTH:
+            continue
+
+        if op == sre_constants.LITERAL:
+            classes.append(re.escape(chr(av)))
+            return classes, False
+        if op == sre_constants.NOT_LITERAL:
+            classes.append('[^{}]'.format(re.escape(chr(av))))
+            return classes, False
+        if op == sre_constants.IN:
+            classes.append(_charset(av))
+            return classes, False
+
+        if op in _GROUPS:
+            if op == sre_constants.SUBPATTERN:
+                _, add_flags, del_flags, sub = av
+                if (add_flags | del_flags) & _CHARSET_FLAGS:
+                    raise _Unknown(op)
+            else:
+                sub = av
+            first, nullable = _first(sub)
+        elif op in _REPEATS:
+            minimum, _, sub = av
+            first, nullable = _first(sub)
+            nullable = nullable or minimum == 0
+        elif op == sre_constants.BRANCH:
+            first, nullable = [], False
+            for branch in av[1]:
+                branch_first, branch_nullable = _first(branch)
+                first.extend(branch_first)
+                nullable = nullable or branch_nullable
+        else:
+            # ANY, GROUPREF, ...
+            raise _Unknown(op)
+
+        classes.extend(first)
+        if not nullable:
+            return classes, False
+
+    return classes, True
+
+
+def _literal_prefix(items):
+    '''return the literal characters the items always start with'''
+    prefix = []
+    for op, av in items:
+        if op == sre_constants.AT and not prefix:
+            continue
+        if op != sre_constants.LITERAL:
+            break
+        prefix.append(chr(av))
+    return ''.join(prefix)
+
+
+def _literals(items):
+    '''yield the runs of literal characters found in every string the items
+       match'''
+    run = []
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            yield ''.join(run)
+            run = []
+        if op == sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            if not (add_flags | del_flags) & _CHARSET_FLAGS:
+                yield from _literals(sub)
+        elif op in _REPEATS and av[0] > 0:
+            yield from _literals(av[2])
+    if run:
+        yield ''.join(run)
+
+
+def _is_indent(item):
+    r'''True if the item is \s*, the optional indentation of a line'''
+    op, av = item
+    if op not in _REPEATS or av[0] != 0:
+        return False
+    sub = list(av[2])
+    return len(sub) == 1 and sub[0] == (
+        sre_constants.IN, [(sre_constants.CATEGORY,
+                            sre_constants.CATEGORY_SPACE)])
+
+
+class _Entry(object):
+    '''How a pattern is indexed'''
+
+    __slots__ = ('name', 'pattern', 'prefix', 'literal', 'first', 'indented')
+
+    def __init__(self, name, pattern):
+        self.name = name
+        self.pattern = pattern
+        # literal prefix of the lines the pattern matches
+        self.prefix = ''
+        # longest literal found anywhere in the lines the pattern matches,
+        # apart from the prefix
+        self.literal = ''
+        # compiled class of their first character, None if any line may match
+        self.first = None
+        # True if the prefix and first character are found after the
+        # indentation of the line
+        self.indented = False
+
+        if not isinstance(pattern.pattern, str) or \
+                pattern.flags & re.IGNORECASE:
+            return
+
+        items = list(sre_parse.parse(pattern.pattern, pattern.flags))
+        literals = list(_literals(items))
+        self.literal = max(literals, key=len, default='')
+
+        while items and items[0][0] == sre_constants.AT:
+            items.pop(0)
+        if items and _is_indent(items[0]):
+            items.pop(0)
+            self.indented = True
+
+        try:
+            classes, nullable = _first(items)
+        except _Unknown:
+            classes, nullable = None, True
+
+        if nullable:
+            self.indented = False
+            return
+
+        first = re.compile('|'.join(classes), pattern.flags & re.ASCII)
+        if self.indented and any(first.match(c) for c in _WHITESPACE):
+            # The indentation may not be all consumed by \s*
+            self.indented = False
+            return
+
+        self.first = first
+        self.prefix = _literal_prefix(items)
+        self.literal = max((literal for literal in literals
+                            if literal not in self.prefix),
+                           key=len, default='')
+
+    def accepts(self, char):
+        return self.first is None or bool(char and self.first.match(char))
+
+
+class LineDispatcher(object):
+    '''Find the first pattern matching a line, trying only the patterns which
+    can match it.
+
+    Each pattern is indexed by the first character and literal prefix of the
+    lines it can match ('MTU', 'Hardware', a digit, ...), found from the
+    pattern itself. A line is only tried against the patterns indexed under
+    its first character, which are checked for their literal prefix before
+    the regular expression is run. Patterns that can start with anything are
+    tried for every line. The patterns are always tried in the given order,
+    so the first pattern matching a line is the same as trying every pattern
+    in turn. A pattern is also skipped when the longest literal it contains,
+    apart from its prefix, is not in the line.
+
+    A dispatcher declared on a parser class tries the patterns in the order
+    given by the pattern profile (see set_pattern_profile), the patterns
+    matching the most lines first, when the profile has hits for the class.
+    A pattern is only moved ahead of the patterns no line can match along
+    with it, so the first pattern matching a line is the same.
+
+    Patterns starting with an optional indentation (r'^\\s*via') are indexed
+    on what follows the indentation.
+
+        Args:
+            patterns (`PatternTable`, `dict` or `list`): the patterns, a
+                table or mapping of name -> compiled pattern, or a list of
+                (name, compiled pattern)
+            names (`list`): only dispatch to these patterns, in this order
+
+        example:
+
+            >>> dispatch = LineDispatcher(patterns, ['p1', 'p2', 'p3'])
+            >>> for line in out.splitlines():
+            ...     line = line.strip()
+            ...     name, m = dispatch.match(line)
+            ...     if name == 'p1':
+            ...         ...
+    '''
+
+    def __init__(self, patterns, names=None):
+        self._patterns = patterns
+        self._names = names
+        # parser class the dispatcher is declared on
+        self._owner = None
+        self._entries = None
+        self._indented = False
+        # (first character, first character after the indentation)
+        #     -> candidate entries
+        self._candidates = {}
+        _dispatchers.add(self)
+
+    def __set_name__(self, owner, name):
+        if self._owner is None:
+            self._owner = owner
+
+    def __get__(self, instance, owner):
+        # Read from a parser, the patterns are counted while the metrics are
+        # enabled
+        if instance is None or not _metrics.enabled:
+            return self
+        return _metrics.dispatcher(self, owner)
+
+    def _index(self):
+        patterns = self._patterns
+        if self._names is not None:
+            items = [(name, patterns[name]) for name in self._names]
+        elif hasattr(patterns, 'items'):
+            items = list(patterns.items())
+        else:
+            items = list(patterns)
+
+        entries = []
+        for name, pattern in items:
+            if isinstance(pattern, str):
+                pattern = re.compile(pattern)
+            entries.append(_Entry(name, pattern))
+
+        if self._owner is not None and \
+                len({entry.name for entry in entries}) == len(entries):
+            order = get_pattern_profile().order(
+                self._owner, [(entry.name, entry.pattern)
+                              for entry in entries])
+            if order:
+                by_name = {entry.name: entry for entry in entries}
+                entries = [by_name[name] for name in order]
+
+        self._indented = any(entry.indented for entry in entries)
+        self._entries = entries
+
+    def _reset(self):
+        self._entries = None
+        self._candidates = {}
+
+    @property
+    def names(self):
+        '''the names of the patterns, in the order they are tried'''
+        if self._entries is None:
+            self._index()
+        return [entry.name for entry in self._entries]
+
+    def candidates(self, line):
+        '''return the entries of the patterns which can match line'''
+        if self._entries is None:
+            self._index()
+
+        key = (line[:1], line.lstrip()[:1] if self._indented else '')
+        try:
+            return self._candidates[key]
+        except KeyError:
+            pass
+
+        candidates = tuple(
+            entry for entry in self._entries
+            if entry.accepts(key[1] if entry.indented else key[0]))
+        self._candidates[key] = candidates
+        return candidates
+
+    def match(self, line):
+        '''return (name, match) of the first pattern matching line, or
+           (None, None) if none does'''
+        stripped = None
+        for entry in self.candidates(line):
+            if entry.prefix:
+                if entry.indented:
+                    if stripped is None:
+                        stripped = line.lstrip()
+                    if not stripped.startswith(entry.prefix):
+                        continue
+                elif not line.startswith(entry.prefix):
+                    continue
+            if entry.literal and entry.literal not in line:
+                continue
+
+            m = entry.pattern.match(line)
+            if m:
+                return entry.name, m
+        return None, None
+
+
+def get_pattern_profile():
+    '''return the pattern profile ordering the patterns of the dispatchers,
+       the one configured by default'''
+    global _profile
+    if _profile is None:
+        path = cfg.get(PATTERN_PROFILE, None) or \
+            os.environ.get(PATTERN_PROFILE.upper().replace('.', '_'))
+        _profile = PatternProfile.load(path) if path else PatternProfile()
+    return _profile
+
+
+def set_pattern_profile(profile):
+    '''set the pattern profile ordering the patterns of the dispatchers,
+       None for the configured one, and return the previous one. The
+       dispatchers are indexed again on their next match.'''
+    global _profile
+    previous, _profile = _profile, profile
+    for dispatcher in list(_dispatchers):
+        dispatcher._reset()
+    return previous
@@ -31,18 +31,72 @@ example 'nxos', and the value is a list of MetaParser class definitions.
             ]
         }
 
+Entry points are discovered through the package metadata without importing
+them. The first time an entry point is seen its function is called and the
+commands, modules and classes it returns are saved in a cache file. Later
+processes register those as strings only, so the plugin modules are imported
+once one of their commands is resolved by `get_parser`. The cache entry is
+invalidated when the distribution version, the entry point module or one of
+the parser modules it registered changes.
+
+`entry_point_info` returns what was registered, how long it took, and how
+long importing the plugin took, for every entry point.
 """
 
+import os
 import sys
-import pkg_resources
+import json
+import time
 import logging
+import importlib
+
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:
+    try:
+        import importlib_metadata
+    except ImportError:
+        importlib_metadata = None
 
-from .common import parser_data
+from .common import parser_data, clear_parser_cache, parser_import_times
+from .extension import CACHE_DIR
 
 log = logging.getLogger(__name__)
 
 ENTRY_POINT_NAME = 'genie.libs.parser'
 
+# Commands, modules and classes returned by each entry point function
+ENTRY_POINT_CACHE = os.path.join(CACHE_DIR, 'entry_points.json')
+
+# Entry point name -> details of how it was registered
+_entry_point_info = {}
+
+# Entry point name -> (package, module name) of the parsers it registered
+_entry_point_modules = {}
+
+
+def _parser_entries(parser):
+    """
+    Return the commands of a parser class and where to find it
+    """
+    mod = sys.modules[parser.__module__]
+
+    cli_commands = parser.cli_command
+    if isinstance(cli_commands, str):
+        cli_commands = [cli_commands]
+
+    return list(cli_commands), {
+        'module_name': mod.__name__.rsplit('.', 1)[-1],
+        'package': mod.__package__,
+        'class': parser.__name__
+    }
+
+
+def _add_entries(cli_commands, os_name, entry):
+    for cmd in cli_commands:
+        # Do not load the parser data only to register the parser
+        parser_data.add(cmd, os_name, dict(entry))
+
 
 def add_parser(parser, os_name):
     """
@@ -62,36 +116,185 @@ def add_parser(parser, os_name):
     os_name : str
         The NOS name for which the parser is supported, for example "nxos"
     """
-    mod = sys.modules[parser.__module__]
-    package = mod.__package__
+    cli_commands, entry = _parser_entries(parser)
+    _add_entries(cli_commands, os_name, entry)
+    clear_parser_cache()
 
-    cli_commands = parser.cli_command
-    if isinstance(cli_commands, str):
-        cli_commands = [cli_commands]
 
-    for cmd in cli_commands:
-        if cmd not in parser_data:
-            parser_data[cmd] = {}
+def _iter_entry_points():
+    """
+    Yield (name, value, version, load) of every parser entry point, read from
+    the package metadata without importing anything
+    """
+    if importlib_metadata is None:
+        import pkg_resources
+        for ep in pkg_resources.iter_entry_points(ENTRY_POINT_NAME):
+            yield ep.name, str(ep).split('=', 1)[1].strip(), \
+                ep.dist.version if ep.dist else None, ep.load
+        return
 
-        parser_data[cmd][os_name] = {
-            'module_name': mod.__name__.rsplit('.', 1)[-1],
-            'package': package,
-            'class': parser.__name__
+    eps = importlib_metadata.entry_points()
+    if hasattr(eps, 'select'):
+        eps = eps.select(group=ENTRY_POINT_NAME)
+    else:
+        eps = eps.get(ENTRY_POINT_NAME, [])
+
+    for ep in eps:
+        dist = getattr(ep, 'dist', None)
+        yield ep.name, ep.value, dist.version if dist else None, ep.load
+
+
+def _module_mtime(module):
+    """
+    Return the modification time of a module, None if it cannot be found
+    """
+    try:
+        return os.path.getmtime(importlib.util.find_spec(module).origin)
+    except Exception:
+        return None
+
+
+def _entry_point_key(name, value, version):
+    """
+    Cache key of an entry point, changes with the distribution version and
+    the modification time of the entry point module
+    """
+    mtime = _module_mtime(value.split(':')[0].strip())
+    return '{}={} ({}, {})'.format(name, value, version, mtime)
+
+
+def _registered_modules(registrations):
+    """
+    Return the sorted (package, module name) of the parsers registered
+    """
+    return sorted({(entry['package'], entry['module_name'])
+                   for entries in registrations.values()
+                   for _, entry in entries})
+
+
+def _cached_registrations(cache, name, key):
+    """
+    Return the registrations cached for an entry point, None if there are
+    none or if the entry point or one of its parser modules changed since
+    """
+    cached = cache.get(name)
+    if not isinstance(cached, dict) or cached.get('key') != key:
+        return None
+    for module, mtime in cached['modules'].items():
+        if _module_mtime(module) != mtime:
+            return None
+    return cached['registrations']
+
+
+def _read_cache():
+    try:
+        with open(ENTRY_POINT_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache):
+    try:
+        os.makedirs(os.path.dirname(ENTRY_POINT_CACHE), exist_ok=True)
+        with open(ENTRY_POINT_CACHE, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        log.debug('Could not write entry point cache {}: {}'
+                  .format(ENTRY_POINT_CACHE, e))
+
+
+def _load_entry_point(name, load):
+    """
+    Call the entry point function and return its registrations as
+    {os_name: [[cli_commands, entry], ...]}, None if it is not callable
+    """
+    loader_function = load()
+    if not callable(loader_function):
+        log.warning('unable to load parsers from entry point '
+                    '{name} as it is not callable.'.format(name=name))
+        return None
+
+    parser_dict = loader_function()
+    return {os_name: [list(_parser_entries(parser))
+                      for parser in parser_list]
+            for os_name, parser_list in parser_dict.items()}
+
+
+def load_entry_points(use_cache=True):
+    """
+    Register the parsers of every entry point, from the cache when possible
+
+    Parameters
+    ----------
+    use_cache : bool
+        False to call every entry point function, ignoring the cache
+    """
+    cache = _read_cache() if use_cache else {}
+    modified = False
+
+    for name, value, version, load in _iter_entry_points():
+        start = time.time()
+        key = _entry_point_key(name, value, version)
+
+        registrations = _cached_registrations(cache, name, key)
+        cached = registrations is not None
+        load_time = 0
+        if not cached:
+            registrations = _load_entry_point(name, load)
+            load_time = time.time() - start
+            if registrations is None:
+                continue
+            modules = _registered_modules(registrations)
+            cache[name] = {
+                'key': key,
+                'modules': {'.'.join(module): _module_mtime('.'.join(module))
+                            for module in modules},
+                'registrations': registrations,
+            }
+            modified = True
+
+        for os_name, entries in registrations.items():
+            for cli_commands, entry in entries:
+                _add_entries(cli_commands, os_name, entry)
+
+        _entry_point_modules[name] = _registered_modules(registrations)
+        _entry_point_info[name] = {
+            'value': value,
+            'version': version,
+            'cached': cached,
+            'parsers': sum(len(e) for e in registrations.values()),
+            'register_time': time.time() - start,
+            'load_time': load_time,
         }
+        log.debug('Registered parsers of entry point {} in {:.3f}s{}'.format(
+            name, _entry_point_info[name]['register_time'],
+            ' (cached)' if cached else ''))
+
+    if _entry_point_info:
+        clear_parser_cache()
+    if modified:
+        _write_cache(cache)
 
 
-def load_entry_points():
-    for ep in pkg_resources.iter_entry_points(ENTRY_POINT_NAME):
-        loader_function = ep.load()
-        if not callable(loader_function):
-            log.warning('unable to load parsers from entry point '
-                        '{name} as it is not callable.'.format(name=ep.name))
-            continue
+def entry_point_info():
+    """
+    Return, per entry point name, its value, distribution version, whether it
+    was registered from the cache, the number of parsers, the time registering
+    them took and the time importing the plugin took.
 
-        parser_dict = loader_function()
-        for os_name, parser_list in parser_dict.items():
-            for parser in parser_list:
-                add_parser(parser=parser, os_name=os_name)
+    The load time of an entry point registered from the cache is the time
+    `get_parser` took so far to import its parser modules, as their commands
+    are resolved; otherwise it is the time calling the entry point took.
+    """
+    info = {}
+    for name, details in _entry_point_info.items():
+        info[name] = dict(details)
+        if details['cached']:
+            info[name]['load_time'] = sum(
+                parser_import_times.get(module, 0)
+                for module in _entry_point_modules[name])
+    return info
 
 
 load_entry_points()
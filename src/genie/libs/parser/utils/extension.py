@@ -1,3 +1,8 @@
+import os
+import ast
+import builtins
+import json
+import hashlib
 import logging
 import pathlib
 import inspect
@@ -7,17 +12,48 @@ from genie.metaparser import MetaParser
 
 log = logging.getLogger(__name__)
 
+# Cache of the statically discovered parsers, one file per package
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'genie')
+
+# Dotted names a parser class of a module may import MetaParser as
+METAPARSER_CLASSES = ('genie.metaparser.MetaParser',
+                      'genie.metaparser._metaparser.MetaParser')
+
+
+class _NotStatic(Exception):
+    '''Raised when the parsers of a module cannot be found without
+       importing it, for example a cli_command which is not a literal or a
+       class inheriting from a class of another module'''
+
+
 class ExtendParsers(object):
     # Files and directories to ignore while walking package
     IGNORE_DIR = ['.git', '__pycache__', 'template', 'tests']
     IGNORE_FILE = ['__init__.py', 'base.py', 'utils.py']
 
-    def __init__(self, package):
+    # Discovery modes
+    #   import: import every module and inspect its classes
+    #   static: read the classes from the module source, without importing
+    #           it. The parser modules are only imported once used.
+    IMPORT = 'import'
+    STATIC = 'static'
+
+    def __init__(self, package, discovery=IMPORT, cache_file=None):
         self.output = {'tokens': [], 'extend_info': []}
         self.package = package
+        self.discovery = discovery
         # Figure out location of package so you can walk it
         self.module_loc = importlib.import_module(package).__path__[0]
 
+        # Static discovery results per file, reused while the file
+        # modification time and size do not change
+        if cache_file is None:
+            cache_file = os.path.join(CACHE_DIR, 'ext_parsers_{}.json'.format(
+                hashlib.md5(self.module_loc.encode()).hexdigest()[:12]))
+        self.cache_file = cache_file
+        self._cache = {}
+        self._cache_modified = False
+
     @staticmethod
     def _find_parsers(mod):
         parsers = []
@@ -41,13 +77,127 @@ class ExtendParsers(object):
 
         return parsers
 
-    def _add_parser(self, parser, cli, tokens, mod):
+    @staticmethod
+    def _find_static_parsers(source, filename='<unknown>'):
+        '''Find the parsers of a module from its source.
+
+        A class is a parser if it inherits from MetaParser, imported from
+        genie.metaparser or through a class of the same module, and assigns
+        a literal `cli_command` or inherits it from a class of the same
+        module. A public class which may be a parser through a base class
+        defined elsewhere cannot be told apart without importing the module.
+
+            Args:
+                source (`str`): the module source code
+                filename (`str`): the module file, for syntax errors
+
+            Returns:
+                list: (class name, docstring, cli_command) sorted by class
+                      name, like `_find_parsers`
+
+            Raises:
+                _NotStatic: the module must be imported to find its parsers
+        '''
+        tree = ast.parse(source, filename=filename)
+
+        # name -> dotted name it was imported as
+        imported = {}
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        imported[alias.asname] = alias.name
+                    else:
+                        name = alias.name.split('.')[0]
+                        imported[name] = name
+            elif isinstance(node, ast.ImportFrom) and node.module and \
+                    not node.level:
+                for alias in node.names:
+                    imported[alias.asname or alias.name] = \
+                        '{}.{}'.format(node.module, alias.name)
+
+        # local class name -> (inherits from MetaParser: True, False or
+        # None when unknown, cli_command, whether cli_command is known)
+        local = {}
+
+        def resolve(base):
+            names = []
+            while isinstance(base, ast.Attribute):
+                names.insert(0, base.attr)
+                base = base.value
+            if not isinstance(base, ast.Name):
+                return None, None, False
+            if not names and base.id in local:
+                return local[base.id]
+            if base.id in imported:
+                dotted = '.'.join([imported[base.id]] + names)
+                if dotted in METAPARSER_CLASSES:
+                    return True, None, True
+            elif not names and isinstance(getattr(builtins, base.id, None),
+                                          type):
+                return False, None, True
+            return None, None, False
+
+        # A class defined twice is the last one defined
+        parsers = {}
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            parsers.pop(node.name, None)
+            bases = [resolve(base) for base in node.bases]
+
+            if any(meta for meta, _, _ in bases):
+                meta = True
+            elif all(meta is False for meta, _, _ in bases):
+                meta = False
+            else:
+                meta = None
+
+            cli_command = None
+            known = False
+            for statement in node.body:
+                if isinstance(statement, ast.Assign):
+                    targets = statement.targets
+                elif isinstance(statement, ast.AnnAssign):
+                    targets = [statement.target]
+                else:
+                    continue
+
+                if any(isinstance(t, ast.Name) and t.id == 'cli_command'
+                       for t in targets):
+                    try:
+                        cli_command = ast.literal_eval(statement.value)
+                    except (ValueError, TypeError, SyntaxError):
+                        raise _NotStatic(node.name)
+                    known = True
+
+            if not known:
+                # Inherited, known if it is known for every base
+                known = all(base_known for _, _, base_known in bases)
+                for _, base_command, _ in bases:
+                    if base_command:
+                        cli_command = base_command
+                        break
+
+            local[node.name] = (meta, cli_command, known)
+            if node.name.startswith('_') or meta is False or \
+                    (known and not cli_command):
+                continue
+            if not meta or not known:
+                raise _NotStatic(node.name)
+            parsers[node.name] = (node.name,
+                                  ast.get_docstring(node, clean=False),
+                                  cli_command)
+
+        return sorted(parsers.values())
+
+    def _add_parser(self, name, doc, cli, tokens, module_name):
         if cli not in self.output:
             self.output[cli] = {}
 
         extend_info = self.output['extend_info']
         extend_info.append("cli: '{}', tokens {}, class: {}"
-                    .format(cli, tokens, parser.__name__))
+                    .format(cli, tokens, name))
 
         output = self.output[cli]
         for token in tokens:
@@ -57,26 +207,56 @@ class ExtendParsers(object):
             if token not in self.output['tokens']:
                 self.output['tokens'].append(token)
 
-        output['module_name'] = mod.__name__.rsplit('.', 1)[-1]
+        output['module_name'] = module_name
         output['package'] = self.package
-        output['class'] = parser.__name__
-        output['doc'] = parser.__doc__
+        output['class'] = name
+        output['doc'] = doc
         output['uid'] = cli.replace(' ', '_').replace('{', '').replace('}', '').replace('|', '_')
 
-    def _add_parsers(self, item, tokens):
+    def _import_parsers(self, item, tokens):
         # Find all classes which has a function named parse
         # Will give module path
         path_list = [self.package] + tokens + [item.name.replace(item.suffix, '')]
         module_path = '.'.join(path_list)
         mod = importlib.import_module(module_path)
-        parsers = self._find_parsers(mod)
 
-        for parser in parsers:
-            if isinstance(parser.cli_command, list):
-                for cli in parser.cli_command:
-                    self._add_parser(parser, cli, tokens, mod)
+        return [(parser.__name__, parser.__doc__, parser.cli_command)
+                for parser in self._find_parsers(mod)]
+
+    def _static_parsers(self, item, tokens):
+        stat = item.stat()
+        key = str(item.relative_to(self.module_loc))
+
+        cached = self._cache.get(key)
+        if cached and cached['mtime'] == stat.st_mtime and \
+                cached['size'] == stat.st_size:
+            return [tuple(parser) for parser in cached['parsers']]
+
+        try:
+            parsers = self._find_static_parsers(item.read_text(), str(item))
+        except _NotStatic:
+            log.debug('Importing {} to find its parsers'.format(item))
+            return self._import_parsers(item, tokens)
+
+        self._cache[key] = {'mtime': stat.st_mtime,
+                            'size': stat.st_size,
+                            'parsers': parsers}
+        self._cache_modified = True
+        return parsers
+
+    def _add_parsers(self, item, tokens):
+        if self.discovery == self.STATIC:
+            parsers = self._static_parsers(item, tokens)
+        else:
+            parsers = self._import_parsers(item, tokens)
+
+        module_name = item.name.replace(item.suffix, '')
+        for name, doc, cli_command in parsers:
+            if isinstance(cli_command, list):
+                for cli in cli_command:
+                    self._add_parser(name, doc, cli, tokens, module_name)
             else:
-                self._add_parser(parser, parser.cli_command, tokens, mod)
+                self._add_parser(name, doc, cli_command, tokens, module_name)
 
     def _recursive_find(self, item, token):
         for item in item.iterdir():
@@ -94,6 +274,31 @@ class ExtendParsers(object):
                 # item is a python file. Find all parsers in file.
                 self._add_parsers(item, token)
 
+    def _load_cache(self):
+        try:
+            with open(self.cache_file) as f:
+                self._cache = json.load(f)
+        except (OSError, ValueError):
+            self._cache = {}
+
+    def _save_cache(self):
+        if not self._cache_modified:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'w') as f:
+                json.dump(self._cache, f)
+        except OSError as e:
+            log.debug('Could not write parser cache {}: {}'
+                      .format(self.cache_file, e))
+
     def extend(self):
+        if self.discovery == self.STATIC:
+            self._load_cache()
+
         # Walk all file in there and go through the parsers
         self._recursive_find(pathlib.Path(self.module_loc), [])
+
+        if self.discovery == self.STATIC:
+            self._save_cache()
+
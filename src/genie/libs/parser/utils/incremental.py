@@ -0,0 +1,137 @@
+'''Incremental parse, the records of an output which did not change since the
+previous poll are not parsed again'''
+
+# python
+import pickle
+
+from .parallel import ChunkedParser, split_records
+from .metrics import get_metrics, PARSE, POST
+from .validation import get_validation_policy
+
+
+class IncrementalResult(object):
+    '''Result of an incremental parse, passed back as the previous result of
+       the next one
+
+        Attributes:
+            parser (`class`): the parser class the output was parsed by
+            parsed (`dict`): the parsed output, validated against the schema
+                unless the validation policy skips it. It is built anew on
+                every parse and may be modified.
+            blocks (`dict`): text of each block of the output, its record and
+                the context lines before it -> its pickled partial result
+            kwargs (`dict`): the arguments of cli() the output was parsed with
+            parsed_blocks (`int`): number of blocks parsed
+            reused_blocks (`int`): number of blocks taken from the previous
+                result
+    '''
+
+    __slots__ = ('parser', 'parsed', 'blocks', 'kwargs', 'parsed_blocks',
+                 'reused_blocks')
+
+    def __init__(self, parser, parsed, blocks, kwargs, parsed_blocks=0,
+                 reused_blocks=0):
+        self.parser = parser
+        self.parsed = parsed
+        self.blocks = blocks
+        self.kwargs = kwargs
+        self.parsed_blocks = parsed_blocks
+        self.reused_blocks = reused_blocks
+
+    def __repr__(self):
+        return '{}({}, blocks={}, parsed={}, reused={})'.format(
+            self.__class__.__name__, self.parser.__name__, len(self.blocks),
+            self.parsed_blocks, self.reused_blocks)
+
+
+class IncrementalParser(ChunkedParser):
+    '''Mixin of the record parsers which can parse an output incrementally.
+
+    The output is split into blocks of one record each, with the context lines
+    read before it, the way parse_parallel() splits it into chunks. Each block
+    is parsed on its own by _parse_chunk() and its partial result is kept,
+    pickled, under the text of the block. The next output polled is split the
+    same way: the blocks whose text is found in the previous result are not
+    parsed again, their partial result is unpickled, and only the new or
+    changed blocks are parsed. The partial results are then merged by
+    _merge_chunks() in the order of the output, so that references between
+    records are resolved as parse() resolves them, and the result is
+    validated against the schema.
+
+    A record which changed, was added or removed only costs its own block. A
+    block holds the current context lines only (address family, area, ...),
+    so a context line which changed only costs the blocks under it.
+
+        example:
+
+            >>> parser = ShowInterfaces(device=device)
+            >>> result = parser.parse_incremental(output=output)
+            >>> result.parsed
+            {'GigabitEthernet1': {...}, ...}
+            >>> result = parser.parse_incremental(output=next_output,
+            ...                                   previous=result)
+            >>> result.parsed_blocks, result.reused_blocks
+            (12, 1988)
+    '''
+
+    def parse_incremental(self, output, previous=None, **kwargs):
+        '''Parse the output, reusing what the previous result parsed
+
+            Args:
+                output (`str`): the output of the command
+                previous (`IncrementalResult`): the result of the previous
+                    output of the same command, None for the first one
+                kwargs: the arguments of cli(), other than output
+
+            Returns:
+                IncrementalResult: the parsed output and its blocks, to be
+                                   passed as previous with the next output
+
+            Raises:
+                SchemaEmptyParserError: nothing was parsed from the output
+
+        The previous result is only used when it was parsed by the same parser
+        class with the same arguments.
+        '''
+        cls = self.__class__
+        if self.record_start is None:
+            parsed = get_validation_policy().parse(self, output, **kwargs)
+            return IncrementalResult(cls, parsed, {}, kwargs, parsed_blocks=1)
+
+        known = {}
+        if previous is not None and previous.parser is cls and \
+                previous.kwargs == kwargs:
+            known = previous.blocks
+
+        metrics = get_metrics()
+        if metrics.enabled:
+            metrics.count(cls)
+
+        blocks = {}
+        partials = []
+        parsed_blocks = reused_blocks = 0
+        for block in split_records(output.splitlines(), self._record_start(),
+                                   self.record_context, chunk_lines=1,
+                                   lead=self.record_lead,
+                                   outer_context=self.record_context_outer):
+            text = '\n'.join(block)
+            if not text.strip():
+                continue
+            data = known.get(text)
+            if data is None:
+                data = blocks.get(text)
+            if data is None:
+                partial = metrics.timed(cls, PARSE, self._parse_chunk, text,
+                                        **kwargs)
+                data = pickle.dumps(partial, pickle.HIGHEST_PROTOCOL)
+                parsed_blocks += 1
+            else:
+                reused_blocks += 1
+            blocks[text] = data
+            # A partial of its own, merge_dict shares the nested dictionaries
+            partials.append(pickle.loads(data))
+
+        merged = metrics.timed(cls, POST, self._merge_chunks, partials)
+        parsed = self._validate(merged)
+        return IncrementalResult(cls, parsed, blocks, kwargs, parsed_blocks,
+                                 reused_blocks)
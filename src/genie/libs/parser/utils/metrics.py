@@ -0,0 +1,429 @@
+'''Metrics of the parsers: where the time of a parse goes, per parser class
+and per pattern, recorded when enabled'''
+
+# python
+import os
+import json
+import time
+import functools
+import threading
+from collections import OrderedDict
+
+# pyats
+from pyats import configuration as cfg
+
+# 'true' to record the metrics from the start
+PARSER_METRICS = 'genie.libs.parser.metrics'
+
+PARSER_PACKAGE = 'genie.libs.parser.'
+
+# Phases of a parse, in their order
+EXECUTE = 'execute'
+PARSE = 'parse'
+POST = 'post'
+VALIDATE = 'validate'
+PHASES = (EXECUTE, PARSE, POST, VALIDATE)
+
+perf_counter = time.perf_counter
+
+
+def parser_name(parser_cls):
+    '''return '<os>.<module>.<class>' of a parser class of this package, the
+       full path of the class otherwise'''
+    path = '{}.{}'.format(parser_cls.__module__, parser_cls.__name__)
+    if path.startswith(PARSER_PACKAGE):
+        return path[len(PARSER_PACKAGE):]
+    return path
+
+
+class ParserStats(object):
+    '''Metrics of a parser class
+
+        Attributes:
+            parses (`int`): number of outputs parsed
+            phases (`dict`): phase -> [count, seconds]
+            patterns (`dict`): pattern name -> [attempts, hits, seconds]
+    '''
+
+    __slots__ = ('parses', 'phases', 'patterns')
+
+    def __init__(self):
+        self.parses = 0
+        self.phases = {}
+        self.patterns = OrderedDict()
+
+    def pattern(self, name):
+        counters = self.patterns.get(name)
+        if counters is None:
+            counters = self.patterns[name] = [0, 0, 0.0]
+        return counters
+
+
+class _MeteredPattern(object):
+    '''Compiled pattern counting its attempts, hits and match time'''
+
+    __slots__ = ('_pattern', '_counters', '_lock')
+
+    def __init__(self, pattern, counters, lock):
+        self._pattern = pattern
+        self._counters = counters
+        self._lock = lock
+
+    def __getattr__(self, name):
+        return getattr(self._pattern, name)
+
+    def _record(self, m, seconds):
+        counters = self._counters
+        with self._lock:
+            counters[0] += 1
+            if m is not None:
+                counters[1] += 1
+            counters[2] += seconds
+        return m
+
+    def match(self, *args, **kwargs):
+        start = perf_counter()
+        m = self._pattern.match(*args, **kwargs)
+        return self._record(m, perf_counter() - start)
+
+    def fullmatch(self, *args, **kwargs):
+        start = perf_counter()
+        m = self._pattern.fullmatch(*args, **kwargs)
+        return self._record(m, perf_counter() - start)
+
+    def search(self, *args, **kwargs):
+        start = perf_counter()
+        m = self._pattern.search(*args, **kwargs)
+        return self._record(m, perf_counter() - start)
+
+
+class _MeteredPatterns(object):
+    '''View of a PatternTable of a parser class, its patterns counted'''
+
+    def __init__(self, table, stats, lock):
+        self._table = table
+        self._stats = stats
+        self._lock = lock
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name not in self._table:
+            return getattr(self._table, name)
+        with self._lock:
+            counters = self._stats.pattern(name)
+        pattern = _MeteredPattern(getattr(self._table, name), counters,
+                                  self._lock)
+        self.__dict__[name] = pattern
+        return pattern
+
+    def __getitem__(self, name):
+        if name not in self._table:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __contains__(self, name):
+        return name in self._table
+
+    def __iter__(self):
+        return iter(self._table)
+
+    def __len__(self):
+        return len(self._table)
+
+
+class _MeteredDispatcher(object):
+    '''View of a LineDispatcher of a parser class, the patterns it runs
+       counted'''
+
+    def __init__(self, dispatcher, stats, lock):
+        self._dispatcher = dispatcher
+        self._stats = stats
+        self._lock = lock
+
+    def __getattr__(self, name):
+        return getattr(self._dispatcher, name)
+
+    def match(self, line):
+        stats = self._stats
+        stripped = None
+        for entry in self._dispatcher.candidates(line):
+            if entry.prefix:
+                if entry.indented:
+                    if stripped is None:
+                        stripped = line.lstrip()
+                    if not stripped.startswith(entry.prefix):
+                        continue
+                elif not line.startswith(entry.prefix):
+                    continue
+            if entry.literal and entry.literal not in line:
+                continue
+
+            start = perf_counter()
+            m = entry.pattern.match(line)
+            seconds = perf_counter() - start
+            with self._lock:
+                counters = stats.pattern(entry.name)
+                counters[0] += 1
+                counters[2] += seconds
+                if m:
+                    counters[1] += 1
+            if m:
+                return entry.name, m
+        return None, None
+
+
+class _TimedDevice(object):
+    '''Device of a parser, the time of its execute() recorded'''
+
+    def __init__(self, device, metrics, parser_cls):
+        self._device = device
+        self._metrics = metrics
+        self._parser_cls = parser_cls
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    def execute(self, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return self._device.execute(*args, **kwargs)
+        finally:
+            self._metrics.record(self._parser_cls, EXECUTE,
+                                 perf_counter() - start)
+
+
+class ParserMetrics(object):
+    '''Registry of the metrics of the parsers, recorded while enabled.
+
+    For each parser class: the number of outputs parsed and the time of the
+    phases of their parse, the execution of the command on the device, the
+    line loop of cli(), the post processing (the merge of the chunks of a
+    chunked parse, the methods decorated with post_processing) and the
+    schema validation. For the parsers using a PatternTable or a
+    LineDispatcher declared on their class: the attempts, hits and match time
+    of each pattern.
+
+    The phases are recorded for the outputs parsed through parse_with,
+    parse_output, BatchParser (in its own process), ParseResultCache,
+    parse_parallel and parse_incremental. Disabled, the only cost left is
+    the check of the enabled attribute when a parser gets its patterns.
+
+        Args:
+            enabled (`bool`): record from the start
+
+        example:
+
+            >>> metrics = get_metrics()
+            >>> metrics.enable()
+            >>> parse_output('iosxe', 'show interfaces', output)
+            >>> print(metrics.to_prometheus())
+            # HELP genie_parser_parses_total Outputs parsed
+            # TYPE genie_parser_parses_total counter
+            genie_parser_parses_total{parser="iosxe.show_interface.ShowInterfaces"} 1
+            ...
+    '''
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._stats = {}
+        self._views = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        '''remove the metrics recorded so far'''
+        with self._lock:
+            self._stats.clear()
+            self._views.clear()
+
+    def stats(self, parser_cls):
+        '''return the ParserStats of a parser class'''
+        stats = self._stats.get(parser_cls)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(parser_cls, ParserStats())
+        return stats
+
+    def record(self, parser_cls, phase, seconds, elapsed=None):
+        '''add the time of a phase of a parse of a parser class
+
+            Args:
+                parser_cls (`class`): the parser class
+                phase (`str`): execute, parse, post or validate
+                seconds (`float`): time of the phase
+                elapsed (`float`): wall time of the phase, phases measured
+                    within it included, seconds by default
+        '''
+        stats = self.stats(parser_cls)
+        with self._lock:
+            counters = stats.phases.get(phase)
+            if counters is None:
+                counters = stats.phases[phase] = [0, 0.0]
+            counters[0] += 1
+            counters[1] += seconds
+
+        # Not part of the phase measured around it
+        frames = getattr(self._local, 'frames', None)
+        if frames:
+            frames[-1][2] += seconds if elapsed is None else elapsed
+
+    def timed(self, parser_cls, phase, func, *args, **kwargs):
+        '''return func(*args, **kwargs), its time recorded as a phase of
+           the parser class when enabled. The other phases measured within
+           func are not part of its time, the same phase is.'''
+        if not self.enabled:
+            return func(*args, **kwargs)
+
+        frames = getattr(self._local, 'frames', None)
+        if frames is None:
+            frames = self._local.frames = []
+        if frames and frames[-1][:2] == [parser_cls, phase]:
+            return func(*args, **kwargs)
+
+        frames.append([parser_cls, phase, 0.0])
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            nested = frames.pop()[2]
+            self.record(parser_cls, phase, elapsed - nested, elapsed)
+
+    def count(self, parser_cls):
+        '''count an output parsed by the parser class'''
+        stats = self.stats(parser_cls)
+        with self._lock:
+            stats.parses += 1
+
+    def cli(self, parser, output=None, **kwargs):
+        '''return parser.cli(output=output, **kwargs), the output counted and
+           the time of cli() recorded: the execution of the command on the
+           device, the post processing, and the line loop for the rest'''
+        parser_cls = parser.__class__
+        self.count(parser_cls)
+
+        device = getattr(parser, 'device', None)
+        if output is None and device is not None:
+            parser.device = _TimedDevice(device, self, parser_cls)
+        try:
+            return self.timed(parser_cls, PARSE, parser.cli, output=output,
+                              **kwargs)
+        finally:
+            if device is not None:
+                parser.device = device
+
+    def patterns(self, table, parser_cls):
+        '''return the view of a PatternTable counting the patterns of the
+           parser class'''
+        return self._view(_MeteredPatterns, table, parser_cls)
+
+    def dispatcher(self, dispatcher, parser_cls):
+        '''return the view of a LineDispatcher counting the patterns of the
+           parser class'''
+        return self._view(_MeteredDispatcher, dispatcher, parser_cls)
+
+    def _view(self, view_cls, obj, parser_cls):
+        key = (id(obj), parser_cls)
+        view = self._views.get(key)
+        if view is None or view[0] is not obj:
+            view = (obj, view_cls(obj, self.stats(parser_cls), self._lock))
+            with self._lock:
+                self._views[key] = view
+        return view[1]
+
+    def as_dict(self):
+        '''return the metrics as a dictionary:
+
+            {'<os>.<module>.<class>': {
+                'parses': 3,
+                'phases': {'parse': {'count': 3, 'seconds': 0.02}, ...},
+                'patterns': {'p1': {'attempts': 120, 'hits': 3,
+                                    'seconds': 0.0001}, ...}}}
+        '''
+        result = OrderedDict()
+        with self._lock:
+            items = sorted((parser_name(cls), stats)
+                           for cls, stats in self._stats.items())
+            for name, stats in items:
+                phases = OrderedDict(
+                    (phase, {'count': stats.phases[phase][0],
+                             'seconds': stats.phases[phase][1]})
+                    for phase in PHASES if phase in stats.phases)
+                patterns = OrderedDict(
+                    (pattern, {'attempts': attempts, 'hits': hits,
+                               'seconds': seconds})
+                    for pattern, (attempts, hits, seconds)
+                    in stats.patterns.items())
+                result[name] = {'parses': stats.parses, 'phases': phases,
+                                'patterns': patterns}
+        return result
+
+    def to_json(self, **kwargs):
+        '''return the metrics as JSON, kwargs given to json.dumps'''
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def to_prometheus(self):
+        '''return the metrics in the Prometheus text format'''
+        metrics = self.as_dict()
+        lines = []
+
+        def add(name, help_text, samples):
+            lines.append('# HELP {} {}'.format(name, help_text))
+            lines.append('# TYPE {} counter'.format(name))
+            for labels, value in samples:
+                lines.append('{}{{{}}} {}'.format(
+                    name, ','.join('{}="{}"'.format(label, _escape(text))
+                                   for label, text in labels), value))
+
+        add('genie_parser_parses_total', 'Outputs parsed',
+            ((([('parser', parser)]), stats['parses'])
+             for parser, stats in metrics.items()))
+        add('genie_parser_phase_seconds_total', 'Time of the phases of the '
+            'parses', (([('parser', parser), ('phase', phase)],
+                        values['seconds'])
+                       for parser, stats in metrics.items()
+                       for phase, values in stats['phases'].items()))
+        for key, help_text in (('attempts', 'Lines tried against a pattern'),
+                               ('hits', 'Lines matched by a pattern'),
+                               ('seconds', 'Match time of a pattern')):
+            add('genie_parser_pattern_{}_total'.format(key), help_text,
+                (([('parser', parser), ('pattern', pattern)], values[key])
+                 for parser, stats in metrics.items()
+                 for pattern, values in stats['patterns'].items()))
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(text):
+    return text.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def post_processing(func):
+    '''Decorator of the methods of a parser which process what its line loop
+       parsed, timed as the post processing of the parse when the metrics
+       are enabled'''
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not _metrics.enabled:
+            return func(self, *args, **kwargs)
+        return _metrics.timed(self.__class__, POST, func, self, *args,
+                              **kwargs)
+    return wrapper
+
+
+def _configured():
+    value = cfg.get(PARSER_METRICS, None) or \
+        os.environ.get(PARSER_METRICS.upper().replace('.', '_'), '')
+    return str(value).lower() in ('true', 'yes', '1')
+
+
+_metrics = ParserMetrics(enabled=_configured())
+
+
+def get_metrics():
+    '''return the metrics registry of the parsers'''
+    return _metrics
@@ -0,0 +1,229 @@
+'''Chunked parse, the output of a large command split at its record
+boundaries and the chunks parsed in a pool of processes'''
+
+# python
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+# metaparser
+from genie.metaparser.util import merge_dict
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from .metrics import get_metrics, PARSE, POST
+from .validation import get_validation_policy
+
+# Smallest chunk, in lines, an output is split into
+MIN_CHUNK_LINES = 2000
+
+
+def _compile(pattern):
+    return re.compile(pattern) if isinstance(pattern, str) else pattern
+
+
+def split_records(lines, record_start, context=(),
+                  chunk_lines=MIN_CHUNK_LINES, lead=(), outer_context=False):
+    '''Split the lines of an output into chunks of whole records
+
+        Args:
+            lines (`iterable`): the output lines
+            record_start (`re.Pattern`): matches the first line of a record,
+                once the line is stripped
+            context (`tuple`): patterns of the lines which apply to the
+                records following them, ordered from the outer level to the
+                inner one (address family, then route distinguisher). The
+                current line of every level is repeated at the start of each
+                chunk, so that the chunk is parsed in the state the whole
+                output would be parsed in.
+            chunk_lines (`int`): a chunk is cut at the first record starting
+                after it holds this many lines
+            lead (`tuple`): patterns of the lines which may come right before
+                the first line of a record and belong to it ('Routing Bit Set
+                on this LSA' before 'LS age: ...')
+            outer_context (`bool`): a context line indented deeper than the
+                first line of the current record belongs to that record
+                ('For address family: ...' within a BGP neighbor), and is not
+                repeated at the start of the chunks
+
+        Returns:
+            generator of chunks, each a list of lines
+
+    A chunk is only ever cut right before a record start, so that the lines of
+    a record are all parsed together. The lines before the first record stay
+    in the first chunk. A context line replaces the current line of its level
+    and drops the ones of the inner levels, as a new address family ends the
+    route distinguisher of the previous one.
+    '''
+    context = [_compile(pattern) for pattern in context]
+    lead = [_compile(pattern) for pattern in lead]
+    # (level, line) of the current context, outer level first
+    context_lines = []
+    match = record_start.match
+    # Indentation of the first line of the current record
+    record_indent = None
+
+    chunk = []
+    size = 0
+    after_lead = False
+    for line in lines:
+        stripped = line.strip()
+        indent = len(line) - len(line.lstrip())
+        is_lead = bool(lead) and any(pattern.match(stripped)
+                                     for pattern in lead)
+        start = is_lead or (not after_lead and match(stripped))
+        after_lead = is_lead
+        if start:
+            record_indent = indent
+            if size >= chunk_lines:
+                yield chunk
+                chunk = [context_line for _, context_line in context_lines]
+                size = 0
+
+        in_record = outer_context and record_indent is not None and \
+            indent > record_indent
+        for level, pattern in enumerate(context):
+            if not in_record and pattern.match(stripped):
+                context_lines = [item for item in context_lines
+                                 if item[0] < level]
+                context_lines.append((level, line))
+                break
+
+        chunk.append(line)
+        size += 1
+
+    if size:
+        yield chunk
+
+
+def _parse_chunk(task):
+    '''Parse a chunk within a worker process'''
+    cls, chunk, kwargs = task
+    return cls(device=None)._parse_chunk('\n'.join(chunk), **kwargs)
+
+
+class ChunkedParser(object):
+    '''Mixin of the parsers whose output is a list of independent records, so
+    that a large output can be split and parsed by several processes.
+
+    The parser declares the pattern of the first line of its records. The
+    output is split right before some of those lines into chunks, each chunk
+    is parsed by cli() in a pool of processes, and the partial results are
+    merged in the order of the chunks, so that the result does not depend on
+    the order the chunks were parsed in. The merged result is then validated
+    against the schema, as parse() does.
+
+    Outputs shorter than `parallel_threshold` lines are parsed by parse(), as
+    starting the processes would cost more than it saves.
+
+    Class attributes:
+
+        record_start: pattern of the first line of a record, stripped
+        record_context: patterns of the lines holding the context of the
+                        records which follow them, outer level first (address
+                        family, then route distinguisher), the current line
+                        of each level is repeated at the start of every chunk
+        record_context_outer: when True, the context lines indented deeper
+                              than the record start belong to the record
+        record_lead: patterns of the lines which may come right before the
+                     record start and belong to its record
+        parallel_threshold: number of lines below which the output is parsed
+                            in the current process
+
+    Parsers which keep state across records (references between records
+    resolved once every record is read) override _parse_chunk() to return
+    that state along with the parsed records, and _merge_chunks() to resolve
+    it once the chunks are merged.
+
+        example:
+
+            >>> parsed = ShowInterfaces(device=device).parse_parallel(
+            ...     output=output, processes=4)
+    '''
+
+    record_start = None
+    record_context = ()
+    record_context_outer = False
+    record_lead = ()
+    parallel_threshold = 20000
+
+    @classmethod
+    def _record_start(cls):
+        # Compiled once per class, kept on the class which declares it
+        pattern = cls.__dict__.get('_record_start_re')
+        if pattern is None:
+            pattern = _compile(cls.record_start)
+            cls._record_start_re = pattern
+        return pattern
+
+    def parse_parallel(self, output, processes=None, executor=None,
+                       chunk_lines=None, **kwargs):
+        '''Parse a large output in a pool of processes
+
+            Args:
+                output (`str`): the output of the command
+                processes (`int`): number of processes, defaults to the
+                    number of cpus. 1 parses the output in the current
+                    process.
+                executor (`concurrent.futures.Executor`): pool the chunks
+                    are parsed in, instead of a pool started for this output
+                chunk_lines (`int`): lines per chunk, defaults to the output
+                    split in four chunks per process
+                kwargs: the arguments of cli(), other than output
+
+            Returns:
+                dict: the parsed output, validated against the schema
+                      like the output of parse(), unless the validation
+                      policy skips it
+
+            Raises:
+                SchemaEmptyParserError: nothing was parsed from the output
+        '''
+        if processes is None:
+            processes = os.cpu_count() or 1
+
+        lines = output.splitlines()
+        if self.record_start is None or \
+                len(lines) < self.parallel_threshold or \
+                (executor is None and processes < 2):
+            return get_validation_policy().parse(self, output, **kwargs)
+
+        if chunk_lines is None:
+            chunk_lines = max(MIN_CHUNK_LINES, len(lines) // (processes * 4))
+
+        cls = self.__class__
+        tasks = ((cls, chunk, kwargs) for chunk in split_records(
+            lines, self._record_start(), self.record_context, chunk_lines,
+            self.record_lead, self.record_context_outer))
+
+        metrics = get_metrics()
+        if metrics.enabled:
+            metrics.count(cls)
+        if executor is None:
+            with ProcessPoolExecutor(processes) as pool:
+                partials = metrics.timed(cls, PARSE, list,
+                                         pool.map(_parse_chunk, tasks))
+        else:
+            partials = metrics.timed(cls, PARSE, list,
+                                     executor.map(_parse_chunk, tasks))
+
+        merged = metrics.timed(cls, POST, self._merge_chunks, partials)
+        return self._validate(merged)
+
+    def _validate(self, parsed):
+        '''return the merged output once validated, as parse() does, unless
+           the validation policy skips it'''
+        if not parsed:
+            raise SchemaEmptyParserError(parsed)
+        return get_validation_policy().validate(self.__class__, parsed,
+                                                self.schema)
+
+    def _parse_chunk(self, output, **kwargs):
+        '''return what is parsed from a chunk of the output'''
+        return self.cli(output=output, **kwargs)
+
+    def _merge_chunks(self, partials):
+        '''return the parsed output, merged from what each chunk parsed'''
+        parsed = {}
+        for partial in partials:
+            merge_dict(parsed, partial, update=True)
+        return parsed
@@ -0,0 +1,374 @@
+'''Evaluation order of the patterns of a LineDispatcher, from the number of
+lines each pattern matched over a corpus of outputs.
+
+A pattern is only moved ahead of another one when no line can match both,
+which is proven from the two regular expressions, so the first pattern
+matching a line is the same in either order.
+'''
+
+# python
+import re
+import json
+import functools
+import threading
+
+from .metrics import parser_name
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:
+    # python < 3.11
+    import sre_parse
+    import sre_constants
+
+_MAX = 0x10FFFF
+_ALL = ((0, _MAX),)
+
+_REPEATS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+            getattr(sre_constants, 'POSSESSIVE_REPEAT', None)} - {None}
+
+# Zero width items, left out: the language of the pattern only gets larger
+_ZERO_WIDTH = {sre_constants.AT, sre_constants.ASSERT,
+               sre_constants.ASSERT_NOT}
+
+
+def _union(*sets):
+    '''return the union of sets of (low, high) code point ranges'''
+    ranges = sorted(r for s in sets for r in s)
+    merged = []
+    for low, high in ranges:
+        if merged and low <= merged[-1][1] + 1:
+            if high > merged[-1][1]:
+                merged[-1] = (merged[-1][0], high)
+        else:
+            merged.append((low, high))
+    return tuple(merged)
+
+
+def _complement(ranges):
+    result = []
+    start = 0
+    for low, high in ranges:
+        if low > start:
+            result.append((start, low - 1))
+        start = high + 1
+    if start <= _MAX:
+        result.append((start, _MAX))
+    return tuple(result)
+
+
+def _intersects(a, b):
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i][1] < b[j][0]:
+            i += 1
+        elif b[j][1] < a[i][0]:
+            j += 1
+        else:
+            return True
+    return False
+
+
+def _chars(chars):
+    return _union(*(((ord(c), ord(c)),) for c in chars))
+
+
+def _ascii(ranges):
+    return tuple((low, min(high, 0x7F)) for low, high in ranges
+                 if low <= 0x7F)
+
+
+_NON_ASCII = ((0x80, _MAX),)
+_DIGIT = _chars('0123456789')
+_WORD = _union(_DIGIT, ((ord('A'), ord('Z')), (ord('a'), ord('z'))),
+               _chars('_'))
+_SPACE = _chars(' \t\n\r\f\v')
+_ALL_SPACE = _union(_SPACE, ((0x1C, 0x1F),))
+
+# category -> (ranges it may match, ranges it always matches), whatever the
+# flags: what is outside ascii is only known to be in or out of a category
+# by unicode tables, taken as possibly in
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: (_union(_DIGIT, _NON_ASCII), _DIGIT),
+    sre_constants.CATEGORY_NOT_DIGIT: (_complement(_DIGIT),
+                                       _ascii(_complement(_DIGIT))),
+    sre_constants.CATEGORY_WORD: (_union(_WORD, _NON_ASCII), _WORD),
+    sre_constants.CATEGORY_NOT_WORD: (_complement(_WORD),
+                                      _ascii(_complement(_WORD))),
+    sre_constants.CATEGORY_SPACE: (_union(_ALL_SPACE, _NON_ASCII), _SPACE),
+    sre_constants.CATEGORY_NOT_SPACE: (_complement(_SPACE),
+                                       _ascii(_complement(_ALL_SPACE))),
+}
+
+
+class _Unsupported(Exception):
+    '''The language of a pattern item cannot be bounded'''
+
+
+def _charset(items):
+    '''return the ranges of characters an IN item may match'''
+    negate = False
+    may, must = [], []
+    for op, av in items:
+        if op == sre_constants.NEGATE:
+            negate = True
+        elif op == sre_constants.LITERAL:
+            may.append(((av, av),))
+            must.append(((av, av),))
+        elif op == sre_constants.RANGE:
+            may.append((av,))
+            must.append((av,))
+        elif op == sre_constants.CATEGORY:
+            may.append(_CATEGORIES.get(av, (_ALL, ()))[0])
+            must.append(_CATEGORIES.get(av, (_ALL, ()))[1])
+        else:
+            raise _Unsupported(op)
+    if negate:
+        return _complement(_union(*must))
+    return _union(*may)
+
+
+class _Automaton(object):
+    '''Automaton accepting every line a pattern may match with match(), or
+    more, the zero width assertions being ignored. A pattern matching the
+    start of a line, the state reached at the end of the pattern accepts
+    every following character.'''
+
+    def __init__(self, pattern):
+        if not isinstance(pattern.pattern, str) or \
+                pattern.flags & re.IGNORECASE:
+            raise _Unsupported('flags')
+        # state -> [(ranges, state)], state -> [state]
+        self.edges = []
+        self.empty = []
+        start = self._state()
+        end = self._build(sre_parse.parse(pattern.pattern, pattern.flags),
+                          start)
+        self.accept = self._state()
+        self.empty[end].append(self.accept)
+        self.edges[self.accept].append((_ALL, self.accept))
+        self.start = start
+        self._closures = {}
+
+    def _state(self):
+        self.edges.append([])
+        self.empty.append([])
+        return len(self.edges) - 1
+
+    def _edge(self, state, ranges):
+        target = self._state()
+        self.edges[state].append((ranges, target))
+        return target
+
+    def _build(self, items, state):
+        for op, av in items:
+            if op in _ZERO_WIDTH:
+                continue
+            if op == sre_constants.LITERAL:
+                state = self._edge(state, ((av, av),))
+            elif op == sre_constants.NOT_LITERAL:
+                state = self._edge(state, _complement(((av, av),)))
+            elif op == sre_constants.IN:
+                state = self._edge(state, _charset(av))
+            elif op == sre_constants.ANY:
+                state = self._edge(state, _ALL)
+            elif op == sre_constants.SUBPATTERN:
+                _, add_flags, _, sub = av
+                if add_flags & re.IGNORECASE:
+                    raise _Unsupported(op)
+                state = self._build(sub, state)
+            elif op == getattr(sre_constants, 'ATOMIC_GROUP', None):
+                state = self._build(av, state)
+            elif op == sre_constants.BRANCH:
+                end = self._state()
+                for branch in av[1]:
+                    self.empty[self._build(branch, state)].append(end)
+                state = end
+            elif op in _REPEATS:
+                minimum, maximum, sub = av
+                for _ in range(minimum):
+                    state = self._build(sub, state)
+                if maximum != minimum:
+                    # Any number of repetitions beyond the minimum
+                    loop = self._state()
+                    self.empty[state].append(loop)
+                    self.empty[self._build(sub, loop)].append(loop)
+                    state = loop
+            else:
+                # Back references, conditional groups
+                raise _Unsupported(op)
+        return state
+
+    def closure(self, state):
+        '''return (accepts, edges) of the states reached from state without
+           consuming a character'''
+        try:
+            return self._closures[state]
+        except KeyError:
+            pass
+        seen = {state}
+        stack = [state]
+        while stack:
+            for target in self.empty[stack.pop()]:
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        result = (self.accept in seen,
+                  [edge for s in sorted(seen) for edge in self.edges[s]])
+        self._closures[state] = result
+        return result
+
+
+@functools.lru_cache(maxsize=1024)
+def _automaton(pattern):
+    '''return the automaton of a compiled pattern, None if it cannot be
+       built'''
+    try:
+        return _Automaton(pattern)
+    except (_Unsupported, re.error):
+        return None
+
+
+def exclusive(first, second):
+    '''True if no string can be matched by both patterns with match(),
+    False if it may be or if the patterns cannot be compared (back
+    references, case insensitive patterns).
+
+        Args:
+            first (`re.Pattern`): a compiled pattern
+            second (`re.Pattern`): a compiled pattern
+    '''
+    a = _automaton(first)
+    b = _automaton(second)
+    if a is None or b is None:
+        return False
+
+    seen = {(a.start, b.start)}
+    stack = [(a.start, b.start)]
+    while stack:
+        state_a, state_b = stack.pop()
+        accepts_a, edges_a = a.closure(state_a)
+        accepts_b, edges_b = b.closure(state_b)
+        if accepts_a and accepts_b:
+            return False
+        for ranges_a, target_a in edges_a:
+            for ranges_b, target_b in edges_b:
+                pair = (target_a, target_b)
+                if pair not in seen and _intersects(ranges_a, ranges_b):
+                    seen.add(pair)
+                    stack.append(pair)
+    return True
+
+
+def evaluation_order(patterns, hits):
+    '''return the names of the patterns, the patterns matching the most lines
+    first, a pattern being only moved ahead of the ones it is exclusive
+    with.
+
+        Args:
+            patterns (`list`): (name, compiled pattern), in the order they
+                are tried
+            hits (`dict`): name -> number of lines matched
+
+        The patterns without hits keep their order, after the patterns
+        moved ahead of them.
+    '''
+    remaining = list(patterns)
+    proven = {}
+
+    def can_precede(entry, others):
+        for other in others:
+            key = (other[0], entry[0])
+            if key not in proven:
+                proven[key] = exclusive(other[1], entry[1])
+            if not proven[key]:
+                return False
+        return True
+
+    order = []
+    while remaining:
+        chosen = 0
+        by_hits = sorted(range(1, len(remaining)),
+                         key=lambda i: -hits.get(remaining[i][0], 0))
+        for index in by_hits:
+            if hits.get(remaining[index][0], 0) <= \
+                    hits.get(remaining[0][0], 0):
+                break
+            if can_precede(remaining[index], remaining[:index]):
+                chosen = index
+                break
+        order.append(remaining.pop(chosen)[0])
+    return order
+
+
+class PatternProfile(object):
+    '''Number of lines each pattern of a parser matched over a corpus of
+    outputs, per parser class.
+
+        Args:
+            hits (`dict`): '<os>.<module>.<class>' -> {name: lines matched}
+
+        example:
+
+            >>> metrics = get_metrics()
+            >>> metrics.enable()
+            >>> ...  # parse the corpus
+            >>> PatternProfile.from_metrics(metrics).save('profile.json')
+    '''
+
+    def __init__(self, hits=None):
+        self._hits = {name: dict(counts)
+                      for name, counts in (hits or {}).items()}
+        self._lock = threading.Lock()
+        # (parser, names) -> evaluation order
+        self._orders = {}
+
+    @classmethod
+    def from_metrics(cls, metrics):
+        '''return the profile of the pattern hits recorded by a
+           ParserMetrics'''
+        hits = {}
+        for name, stats in metrics.as_dict().items():
+            counts = {pattern: counters['hits'] for pattern, counters in
+                      stats['patterns'].items() if counters['hits']}
+            if counts:
+                hits[name] = counts
+        return cls(hits)
+
+    @classmethod
+    def load(cls, path):
+        '''return the profile saved in a json file'''
+        with open(path) as f:
+            return cls(json.load(f)['parsers'])
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump({'parsers': self._hits}, f, indent=2, sort_keys=True)
+
+    def hits(self, parser_cls):
+        '''return {name: lines matched} of the patterns of a parser class,
+           or of '<os>.<module>.<class>' '''
+        if not isinstance(parser_cls, str):
+            parser_cls = parser_name(parser_cls)
+        return dict(self._hits.get(parser_cls, {}))
+
+    def order(self, parser_cls, patterns):
+        '''return the evaluation order of patterns of a parser class, None if
+           the profile has no hits for it
+
+            Args:
+                parser_cls (`class`): the parser class
+                patterns (`list`): (name, compiled pattern), in the order
+                    they are tried
+        '''
+        hits = self.hits(parser_cls)
+        if not hits:
+            return None
+        key = (parser_name(parser_cls), tuple(name for name, _ in patterns))
+        with self._lock:
+            order = self._orders.get(key)
+        if order is None:
+            order = evaluation_order(patterns, hits)
+            with self._lock:
+                self._orders[key] = order
+        return list(order)
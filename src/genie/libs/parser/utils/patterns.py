@@ -0,0 +1,138 @@
+'''Pattern tables, the regular expressions of a parser declared once per
+class instead of being compiled on every call of cli()'''
+
+# python
+import re
+import threading
+
+from .metrics import get_metrics
+
+_metrics = get_metrics()
+
+
+class PatternTable(object):
+    '''Named regular expressions of a parser, each compiled on first use and
+    kept for the lifetime of the class.
+
+    Compiling the patterns within cli() costs a lookup in the `re` module
+    cache on every call, and a full compilation each time that cache (512
+    entries) has evicted them, which happens as soon as more than a few
+    parsers are used. A table is declared as a class attribute and its
+    patterns are then plain attributes once compiled.
+
+        Args:
+            patterns (`dict`): name -> pattern, applied before kwargs
+            flags (`int`): re flags used for every pattern given as a string
+            kwargs: name -> pattern
+
+        A pattern is a string, a (string, flags) tuple or an already
+        compiled pattern.
+
+        example:
+
+            >>> class ShowClock(ShowClockSchema):
+            ...     patterns = PatternTable(
+            ...         # *10:46:51.123 UTC Mon Jan 1 2021
+            ...         p1=r'^\\*?(?P<time>[\\d:\\.]+) +(?P<timezone>\\w+)$',
+            ...     )
+            ...
+            ...     def cli(self, output=None):
+            ...         p = self.patterns
+            ...         for line in output.splitlines():
+            ...             m = p.p1.match(line.strip())
+    '''
+
+    def __init__(self, patterns=None, flags=0, **kwargs):
+        sources = dict(patterns or {})
+        sources.update(kwargs)
+
+        for name in sources:
+            if name.startswith('_') or hasattr(PatternTable, name):
+                raise ValueError("'{}' can not be used as a pattern name"
+                                 .format(name))
+
+        object.__setattr__(self, '_sources', sources)
+        object.__setattr__(self, '_flags', flags)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def __get__(self, instance, owner):
+        # Read from a parser, the patterns are counted while the metrics are
+        # enabled
+        if instance is None or not _metrics.enabled:
+            return self
+        return _metrics.patterns(self, owner)
+
+    def __getattr__(self, name):
+        # Only called for the patterns which are not compiled yet
+        try:
+            source = self._sources[name]
+        except KeyError:
+            raise AttributeError("{} has no pattern '{}'"
+                                 .format(self.__class__.__name__, name))
+
+        with self._lock:
+            compiled = self.__dict__.get(name)
+            if compiled is None:
+                compiled = self._compile(source)
+                object.__setattr__(self, name, compiled)
+        return compiled
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} is read only, use extend to add patterns'
+                             .format(self.__class__.__name__))
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name)
+
+    def __contains__(self, name):
+        return name in self._sources
+
+    def __iter__(self):
+        return iter(self._sources)
+
+    def __len__(self):
+        return len(self._sources)
+
+    def __repr__(self):
+        return '<{} ({} patterns, {} compiled)>'.format(
+            self.__class__.__name__, len(self._sources), len(self.compiled))
+
+    def _compile(self, source):
+        if isinstance(source, tuple):
+            return re.compile(*source)
+        if isinstance(source, str):
+            return re.compile(source, self._flags)
+        # Already compiled
+        return source
+
+    @property
+    def compiled(self):
+        '''names of the patterns compiled so far'''
+        return [name for name in self._sources if name in self.__dict__]
+
+    def compile_all(self):
+        '''Compile every pattern now, for example before forking workers'''
+        for name in self._sources:
+            getattr(self, name)
+        return self
+
+    def extend(self, patterns=None, **kwargs):
+        '''return a new table with the patterns of this one, added or
+           replaced by the given ones, for subclasses of a parser
+
+            Args:
+                patterns (`dict`): name -> pattern
+                kwargs: name -> pattern
+        '''
+        sources = dict(self._sources)
+        sources.update(patterns or {})
+        sources.update(kwargs)
+        return self.__class__(sources, flags=self._flags)
+
+    def items(self):
+        '''yield (name, compiled pattern), in declaration order'''
+        for name in self._sources:
+            yield name, getattr(self, name)
@@ -0,0 +1,342 @@
+'''Lazily loaded registry of the parser commands'''
+
+# python
+import threading
+from collections.abc import MutableMapping
+
+
+def shard_parser_data(data, os_name):
+    '''Restrict the parser data to the commands of a single os.
+
+        Args:
+            data (`dict`): command -> os -> parser class location
+            os_name (`str`): the os of the shard
+
+        Returns:
+            dict: command -> {os_name: parser class location}, in the order
+                  of data
+    '''
+    shard = {}
+    for command, source in data.items():
+        if os_name not in source:
+            continue
+
+        if isinstance(source, dict):
+            shard[command] = {os_name: source[os_name]}
+        else:
+            # 'tokens' list
+            shard[command] = source
+    return shard
+
+
+class _TrackedDict(dict):
+    '''Dictionary of the parser data, within a ParserRegistry, whose
+    modifications invalidate what was computed from the registry like the
+    modifications of the registry itself.
+
+    Its dictionaries are tracked as well once read through indexing or get.
+    Copies and pickles of it are plain dictionaries.
+    '''
+
+    __slots__ = ('_registry',)
+
+    def __init__(self, data, registry):
+        super().__init__(data)
+        self._registry = registry
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def __getitem__(self, key):
+        return _tracked(self, key, self._registry)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def _modify(self, method, *args):
+        with self._registry._lock:
+            try:
+                return method(self, *args)
+            finally:
+                self._registry._modified()
+
+    def __setitem__(self, key, value):
+        self._modify(dict.__setitem__, key, value)
+
+    def __delitem__(self, key):
+        self._modify(dict.__delitem__, key)
+
+    def __ior__(self, other):
+        self._modify(dict.update, other)
+        return self
+
+    def clear(self):
+        self._modify(dict.clear)
+
+    def pop(self, *args):
+        return self._modify(dict.pop, *args)
+
+    def popitem(self):
+        return self._modify(dict.popitem)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        self._modify(dict.update, dict(*args, **kwargs))
+
+
+def _tracked(data, key, registry):
+    '''return data[key], a dictionary being replaced with a _TrackedDict'''
+    value = dict.__getitem__(data, key)
+    if type(value) is not dict:
+        return value
+
+    with registry._lock:
+        value = dict.__getitem__(data, key)
+        if type(value) is dict:
+            value = _TrackedDict(value, registry)
+            dict.__setitem__(data, key, value)
+    return value
+
+
+class ParserRegistry(MutableMapping):
+    '''Dictionary of command -> os -> parser class location which is only
+    loaded the first time it is used.
+
+    Importing `genie.libs.parser.utils` does not pay for loading the parser
+    index anymore, the loader is called by the first lookup instead. Call
+    `preload` to load it ahead of time, for example before forking workers.
+
+    Lookups limited to one os should use `shard`, which only loads the
+    commands of that os (with shard_loader) instead of the whole registry.
+
+    The shards, the commands and `version` follow the modifications of the
+    registry and of the dictionaries read from it
+    (parser_data[command][os_name] = {...}).
+
+        Args:
+            loader (`callable`): returns the parser data dictionary
+            shard_loader (`callable`): returns the parser data of one os,
+                                       or None if it is not available
+
+        example:
+
+            >>> parser_data = ParserRegistry(_load_parser_json)
+            >>> parser_data.loaded
+            False
+            >>> 'show version' in parser_data.shard('iosxe')
+            True
+            >>> parser_data.loaded
+            False
+            >>> 'show version' in parser_data
+            True
+            >>> parser_data.loaded
+            True
+    '''
+
+    def __init__(self, loader, shard_loader=None):
+        self._loader = loader
+        self._shard_loader = shard_loader
+        self._data = None
+        self._ready = False
+        self._shards = {}
+        # os -> (tuple, frozenset) of the commands without arguments
+        self._commands = {}
+        # (command, os_name, entry) registered through add, applied again
+        # to whatever is loaded later on
+        self._additions = []
+        self._lock = threading.RLock()
+
+        # Incremented on every modification, used to invalidate what was
+        # computed from the registry
+        self.version = 0
+
+    @property
+    def loaded(self):
+        return self._ready
+
+    @property
+    def data(self):
+        '''the underlying dictionary, loaded on first access'''
+        if self._ready:
+            return self._data
+
+        with self._lock:
+            # Loaded by another thread, or accessed again while loading
+            if self._data is not None:
+                return self._data
+
+            self._data = self._loader()
+            for addition in self._additions:
+                self._apply(self._data, *addition)
+
+            # Shards are now derived from the whole data
+            self._shards.clear()
+            self._commands.clear()
+            self._ready = True
+
+        return self._data
+
+    def preload(self, os_names=None):
+        '''Load the parser data now
+
+            Args:
+                os_names (`list`): only load the shards of these os
+        '''
+        if os_names is None:
+            self.data
+        else:
+            for os_name in os_names:
+                self.shard(os_name)
+        return self
+
+    def shard(self, os_name):
+        '''return the parser data of a single os, loading only that os'''
+        try:
+            return self._shards[os_name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if os_name in self._shards:
+                return self._shards[os_name]
+
+            shard = None
+            if not self._ready and self._shard_loader:
+                shard = self._shard_loader(os_name)
+
+            if shard is None:
+                shard = shard_parser_data(self.data, os_name)
+            else:
+                for addition in self._additions:
+                    if addition[1] == os_name:
+                        self._apply(shard, *addition)
+
+            self._shards[os_name] = shard
+        return shard
+
+    def commands(self, os_name):
+        '''return the commands of an os which take no argument
+
+            Args:
+                os_name (`str`): the os of the commands
+
+            Returns:
+                tuple: the commands, in parser data order
+        '''
+        try:
+            return self._commands[os_name][0]
+        except KeyError:
+            return self._build_commands(os_name)[0]
+
+    def command_set(self, os_name):
+        '''return the commands of an os which take no argument, as a
+           frozenset for membership tests'''
+        try:
+            return self._commands[os_name][1]
+        except KeyError:
+            return self._build_commands(os_name)[1]
+
+    def _build_commands(self, os_name):
+        with self._lock:
+            if os_name in self._commands:
+                return self._commands[os_name]
+
+            commands = tuple(command
+                             for command, values in self.shard(os_name).items()
+                             if '{' not in command and command != 'tokens'
+                             and os_name in values)
+            self._commands[os_name] = (commands, frozenset(commands))
+            return self._commands[os_name]
+
+    @property
+    def shards(self):
+        '''the os of the shards currently loaded'''
+        return list(self._shards)
+
+    def add(self, command, os_name, entry):
+        '''Register the parser class location of a command for an os,
+           without loading the parser data
+
+            Args:
+                command (`str`): the command
+                os_name (`str`): the os of the parser
+                entry (`dict`): module_name, package and class of the parser
+        '''
+        with self._lock:
+            self._additions.append((command, os_name, entry))
+            if self._data is not None:
+                self._apply(self._data, command, os_name, entry)
+            if os_name in self._shards:
+                self._apply(self._shards[os_name], command, os_name, entry)
+            if os_name in self._commands and '{' not in command:
+                commands, command_set = self._commands[os_name]
+                if command not in command_set:
+                    self._commands[os_name] = (commands + (command,),
+                                               command_set | {command})
+            self.version += 1
+
+    @staticmethod
+    def _apply(data, command, os_name, entry):
+        # Applied to the shards and commands by add itself
+        if command not in data:
+            dict.__setitem__(data, command, {})
+        dict.__setitem__(dict.__getitem__(data, command), os_name, entry)
+
+    def _modified(self):
+        # Shards can not follow arbitrary modifications, derive them again
+        if self._ready:
+            self._shards.clear()
+        self._commands.clear()
+        self.version += 1
+
+    def __getitem__(self, key):
+        return _tracked(self.data, key, self)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self.data[key] = value
+            self._modified()
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self.data[key]
+            self._modified()
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        if not self._ready:
+            return '<{} (not loaded, shards {})>'.format(
+                self.__class__.__name__, self.shards)
+        return '<{} ({} commands)>'.format(self.__class__.__name__,
+                                           len(self._data))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.data.keys()
+
+    def values(self):
+        return self.data.values()
+
+    def items(self):
+        return self.data.items()
@@ -0,0 +1,351 @@
+'''Cache of parsed outputs, keyed on the content of the output so that an
+output which did not change since the last poll is not parsed again'''
+
+# python
+import os
+import sys
+import json
+import pickle
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+
+from genie.libs import parser
+
+from .common import parse_with
+
+ResultCacheInfo = namedtuple('ResultCacheInfo', [
+    'hits', 'misses', 'disk_hits', 'evictions', 'maxsize', 'currsize',
+    'nbytes'])
+
+# Module -> (path, mtime, size, version) of the source the version was
+# computed from
+_module_versions = {}
+
+
+def module_version(module_name):
+    '''return the version of a parser module, the digest of its source.
+
+    A parser fixed or modified in place gets another version, the results it
+    parsed before are then not found anymore. Modules without a source file
+    use the version of the package.
+    '''
+    module = sys.modules.get(module_name)
+    path = getattr(module, '__file__', None)
+    try:
+        stat = os.stat(path)
+    except (TypeError, OSError):
+        return parser.__version__
+
+    known = _module_versions.get(module_name)
+    if known and known[:3] == (path, stat.st_mtime, stat.st_size):
+        return known[3]
+
+    with open(path, 'rb') as f:
+        version = hashlib.sha1(f.read()).hexdigest()
+    _module_versions[module_name] = (path, stat.st_mtime, stat.st_size,
+                                     version)
+    return version
+
+
+def parser_version(parser_cls):
+    '''return the version of a parser class, the digest of the version of
+    the package and of the modules of the classes it inherits from.
+
+    A result is then not found anymore once the parser, one of its base
+    classes (a schema or parser of another module, MetaParser) or the
+    package is modified.
+    '''
+    digest = hashlib.sha1(parser.__version__.encode('utf-8'))
+    modules = []
+    for cls in parser_cls.__mro__:
+        if cls.__module__ not in modules and cls.__module__ != 'builtins':
+            modules.append(cls.__module__)
+    for module_name in modules:
+        digest.update(module_version(module_name).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ReadOnlyDict(Mapping):
+    '''Read only view of a parsed output, the nested dictionaries are views
+       as well and the lists are tuples'''
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return _read_only(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, ReadOnlyDict):
+            other = other._data
+        return self._data == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def copy(self):
+        '''return a deep copy of the output, which can be modified'''
+        return pickle.loads(pickle.dumps(self._data, pickle.HIGHEST_PROTOCOL))
+
+
+def _encode_keys(value):
+    '''return a parsed output whose keys are json encoded, to be written as
+       json without turning the keys which are not strings into strings'''
+    if isinstance(value, dict):
+        return {json.dumps(key): _encode_keys(item)
+                for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encode_keys(item) for item in value]
+    return value
+
+
+def _decode_keys(pairs):
+    return {json.loads(key): value for key, value in pairs}
+
+
+def _loads(data):
+    '''return the parsed output of its json, None if it is not valid'''
+    try:
+        return json.loads(data.decode('utf-8'), object_pairs_hook=_decode_keys)
+    except (ValueError, TypeError):
+        return None
+
+
+def _dumps(parsed):
+    '''return the json of a parsed output, None if it would not be read back
+       as the same output (tuples, keys json cannot hold)'''
+    try:
+        data = json.dumps(_encode_keys(parsed),
+                          separators=(',', ':')).encode('utf-8')
+    except (ValueError, TypeError):
+        return None
+    if _loads(data) != parsed:
+        return None
+    return data
+
+
+def _read_only(value):
+    if isinstance(value, dict):
+        return ReadOnlyDict(value)
+    if isinstance(value, list):
+        return tuple(_read_only(item) for item in value)
+    return value
+
+
+class ParseResultCache(object):
+    '''Least recently used cache of parsed outputs.
+
+    A result is keyed on the parser class, the version of its modules, the
+    kwargs of cli() and the sha256 digest of the output, so a result is only
+    returned for the exact same output parsed by the same code. Results are
+    kept pickled: a hit returns a new copy of the structure, which the caller
+    may modify, or a read only view of it.
+
+    The memory used is bounded by the number of results and the size of the
+    pickled results, the least recently used ones are evicted first. With a
+    directory, results are also written to disk, and results which are not
+    in memory (evicted, or cached by a previous process) are read from it.
+    They are written as json, never unpickled: a file of the directory which
+    is not a valid result is a miss. Results json cannot hold as they are
+    (tuples, keys which are not strings, numbers, booleans or None) are
+    only kept in memory.
+
+        Args:
+            maxsize (`int`): maximum number of results kept in memory
+            max_bytes (`int`): maximum size of the pickled results kept in
+                memory, None for unbounded
+            directory (`str`): directory the results are written to, None to
+                only keep them in memory
+            read_only (`bool`): return read only views of the results instead
+                of copies
+
+        example:
+
+            >>> cache = ParseResultCache(maxsize=10000,
+            ...                          directory='/var/cache/parsed')
+            >>> parsed = cache.parse(ShowVersion, output)
+            >>> parsed = parse_output('iosxe', 'show version', output,
+            ...                       cache=cache)
+            >>> cache.info()
+            ResultCacheInfo(hits=1, misses=1, disk_hits=0, evictions=0, ...)
+    '''
+
+    def __init__(self, maxsize=1024, max_bytes=64 * 2 ** 20, directory=None,
+                 read_only=False):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.read_only = read_only
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.nbytes = 0
+
+        # key -> pickled result
+        self._data = OrderedDict()
+        # key -> unpickled result, for the read only views
+        self._views = {}
+        self._lock = threading.RLock()
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._data)
+
+    def key(self, parser_cls, output, kwargs=None):
+        '''return the key of the result of an output'''
+        digest = hashlib.sha256(output.encode('utf-8', 'surrogateescape'))
+        return '{}:{}:{}:{}:{}'.format(
+            parser_cls.__module__, parser_cls.__qualname__,
+            parser_version(parser_cls),
+            repr(sorted((kwargs or {}).items())), digest.hexdigest())
+
+    def parse(self, parser_cls, output, **kwargs):
+        '''return the parsed output, from the cache or parsed and cached
+
+            Args:
+                parser_cls (`class`): the parser class
+                output (`str`): the output of the command
+                kwargs: the arguments of cli(), other than output
+
+            Returns:
+                dict: the parsed output, validated against the schema, or
+                      its read only view
+
+        Outputs which fail to parse are not cached, the exception is raised
+        on every call.
+        '''
+        key = self.key(parser_cls, output, kwargs)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        parsed = parse_with(parser_cls, output, **kwargs)
+        self._put(key, parsed)
+        if self.read_only:
+            return ReadOnlyDict(parsed)
+        return parsed
+
+    def _get(self, key):
+        with self._lock:
+            data = self._data.get(key)
+            if data is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._view(key) if self.read_only \
+                    else pickle.loads(data)
+
+        parsed = self._read(key)
+        if parsed is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.disk_hits += 1
+            self._store(key, pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL))
+            return self._view(key) if self.read_only else parsed
+
+    def _put(self, key, parsed):
+        with self._lock:
+            self._store(key, pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL))
+        self._write(key, parsed)
+
+    def _store(self, key, data):
+        previous = self._data.pop(key, None)
+        if previous is not None:
+            self.nbytes -= len(previous)
+        self._data[key] = data
+        self.nbytes += len(data)
+
+        while len(self._data) > 1 and (
+                len(self._data) > self.maxsize or
+                (self.max_bytes is not None and
+                 self.nbytes > self.max_bytes)):
+            evicted, data = self._data.popitem(last=False)
+            self._views.pop(evicted, None)
+            self.nbytes -= len(data)
+            self.evictions += 1
+
+    def _view(self, key):
+        view = self._views.get(key)
+        if view is None:
+            view = self._views[key] = ReadOnlyDict(
+                pickle.loads(self._data[key]))
+        return view
+
+    def _path(self, key):
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + '.json')
+
+    def _read(self, key):
+        '''return the parsed output written to disk, None if there is none'''
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        parsed = _loads(data)
+        return parsed if isinstance(parsed, dict) else None
+
+    def _write(self, key, parsed):
+        if not self.directory:
+            return
+        data = _dumps(parsed)
+        if data is None:
+            return
+        # Written aside and renamed, a reader never sees a partial result
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def clear(self, disk=False):
+        '''remove every result kept in memory, and on disk if disk is True.
+           The counters are kept.'''
+        with self._lock:
+            self._data.clear()
+            self._views.clear()
+            self.nbytes = 0
+
+        if disk and self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
+
+    def info(self):
+        '''return the counters and size of the cache'''
+        with self._lock:
+            return ResultCacheInfo(self.hits, self.misses, self.disk_hits,
+                                   self.evictions, self.maxsize,
+                                   len(self._data), self.nbytes)
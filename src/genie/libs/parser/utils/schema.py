@@ -0,0 +1,218 @@
+'''Helpers of the parser schemas'''
+
+# python
+import threading
+
+# metaparser
+from genie.metaparser.util.exceptions import SchemaError
+from genie.metaparser.util.schemaengine import Schema, Any, Optional
+
+# Types of the keys matched by equality
+LITERAL_KEYS = (str, int)
+
+# parser class -> (schema, validator) of the compiled schemas
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+
+class _Invalid(Exception):
+    '''Raised by a compiled schema, the data is validated again by Schema to
+       raise its error'''
+
+
+def _compile_value(schema):
+    '''return the (type, validator) of a value of a dictionary, the type its
+       value is an instance of, and the validator called with the value'''
+    if isinstance(schema, Any):
+        return None, None
+    if isinstance(schema, type) and schema is not type:
+        return schema, None
+    if type(schema) is dict:
+        return dict, _compile_dict(schema)
+    # Use, Or, And, literals, ... are left to Schema
+    return None, _schema_validator(schema)
+
+
+def _schema_validator(schema):
+    validate = Schema(schema).validate
+
+    def validate_schema(data):
+        try:
+            validate(data)
+        except Exception:
+            raise _Invalid()
+    return validate_schema
+
+
+def _compile_dict(schema):
+    '''return the validator of a dictionary of the schema'''
+    exact = {}
+    required = []
+    wildcard = None
+    for key, value in schema.items():
+        optional = isinstance(key, Optional)
+        name = key.schema if optional else key
+        if isinstance(name, Any):
+            if wildcard is not None:
+                break
+            wildcard = _compile_value(value)
+        elif type(name) in LITERAL_KEYS:
+            if optional and wildcard is not None:
+                # Schema may match it with the wildcard before it
+                break
+            exact[name] = _compile_value(value)
+            if not optional:
+                required.append(name)
+        else:
+            # types, functions, Or, ... matched by Schema
+            break
+    else:
+        return _dict_validator(exact, frozenset(required), wildcard)
+    return _schema_validator(schema)
+
+
+def _dict_validator(exact, required, wildcard):
+    if not exact and wildcard is not None:
+        # A level keyed on the names of its entries, {Any(): {...}}
+        value_type, validator = wildcard
+
+        def validate_any(data):
+            if not isinstance(data, dict):
+                raise _Invalid()
+            if value_type is not None:
+                for value in data.values():
+                    if not isinstance(value, value_type):
+                        raise _Invalid()
+            if validator is not None:
+                for value in data.values():
+                    validator(value)
+        return validate_any
+
+    get = exact.get
+
+    def validate_dict(data):
+        if not isinstance(data, dict) or not required <= data.keys():
+            raise _Invalid()
+        for key, value in data.items():
+            checks = get(key, wildcard)
+            if checks is None:
+                raise _Invalid()
+            value_type, validator = checks
+            if value_type is not None and not isinstance(value, value_type):
+                raise _Invalid()
+            if validator is not None:
+                validator(value)
+    return validate_dict
+
+
+def compile_schema(schema):
+    '''Compile a schema into a function validating data against it
+
+        Args:
+            schema (`dict`): the schema
+
+        Returns:
+            function: validates the data it is called with, returns it or
+                      raises the error Schema(schema).validate raises
+
+    The keys of each dictionary of the schema are sorted once: the literal
+    and Optional keys are looked up in a dictionary, the values whose schema
+    is a type are checked with isinstance() and a level whose only key is
+    Any() is a loop over its values. The other nodes (Use, Or, keys which
+    are types or functions, ...) are validated by Schema, built once. Data
+    which does not validate is validated again by Schema, for its error.
+
+        example:
+
+            >>> validate = compile_schema({'vrf': {Any(): {'index': int}}})
+            >>> validate({'vrf': {'default': {'index': 1}}})
+            {'vrf': {'default': {'index': 1}}}
+    '''
+    value_type, validator = _compile_value(schema)
+    generic = Schema(schema).validate
+
+    def validate(data):
+        try:
+            if value_type is not None and not isinstance(data, value_type):
+                raise _Invalid()
+            if validator is not None:
+                validator(data)
+        except _Invalid:
+            generic(data)
+        return data
+    return validate
+
+
+def compiled_validator(parser_cls):
+    '''return the compiled schema of a parser class, compiled on the first
+       call and kept for the class'''
+    schema = parser_cls.schema
+    compiled = _compiled.get(parser_cls)
+    if compiled is None or compiled[0] is not schema:
+        with _compiled_lock:
+            compiled = (schema, compile_schema(schema))
+            _compiled[parser_cls] = compiled
+    return compiled[1]
+
+
+class ListSchema(object):
+    '''Validator of a list of dictionaries, each validated against the same
+    schema, to be used with Use() in the schema of a parser.
+
+    The schema of the entries is compiled on the first validation and kept, so
+    it is built once for the class instead of once per list validated. Nested
+    lists are declared with another ListSchema within the entry schema.
+
+        Args:
+            name (`str`): name of the list, for the error raised when the value
+                is not a list
+            schema (`dict`): schema of each entry of the list, or a function
+                returning it when it uses the validators of classes defined
+                after this one
+            single (`bool`): accept a dictionary as a list of one entry
+
+        example:
+
+            >>> class ShowRouteSchema(MetaParser):
+            ...     validate_route_table_list = ListSchema('route-table', {
+            ...         'table-name': str,
+            ...         Optional('rt'): Use(ListSchema('rt', {
+            ...             'rt-destination': str,
+            ...         })),
+            ...     })
+            ...
+            ...     schema = {
+            ...         'route-information': {
+            ...             'route-table': Use(validate_route_table_list),
+            ...         }
+            ...     }
+    '''
+
+    __slots__ = ('name', 'schema', 'single', '_validate', '__name__')
+
+    def __init__(self, name, schema, single=False):
+        self.name = name
+        # Use() names the callable in the error it raises
+        self.__name__ = name
+        self.schema = schema
+        self.single = single
+        self._validate = None
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.name)
+
+    def __call__(self, value):
+        if self.single and isinstance(value, dict):
+            value = [value]
+        if not isinstance(value, list):
+            raise SchemaError('{} is not a list'.format(self.name))
+
+        validate = self._validate
+        if validate is None:
+            schema = self.schema
+            if not isinstance(schema, dict):
+                schema = schema()
+            validate = self._validate = compile_schema(schema)
+        for item in value:
+            validate(item)
+        return value
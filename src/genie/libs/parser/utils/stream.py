@@ -0,0 +1,131 @@
+'''Streaming parse, the output of a command read from an iterable of lines
+instead of a string holding the whole output'''
+
+
+class LineStream(object):
+    '''Output of a command read from an iterable of lines, given to cli() in
+    place of the output string.
+
+    cli() only calls splitlines() on it, which returns an iterator over the
+    lines as they are read, without their end of line. The lines can only be
+    read once.
+
+        Args:
+            lines (`iterable`): the output lines, for example a file object,
+                a generator or a list. A string is split into its lines.
+    '''
+
+    def __init__(self, lines):
+        if isinstance(lines, str):
+            lines = lines.splitlines()
+        self._lines = lines
+        self._consumed = False
+
+    def __bool__(self):
+        # The output is only known to be empty once it is read
+        return True
+
+    def __repr__(self):
+        return '<{} ({})>'.format(self.__class__.__name__,
+                                  'consumed' if self._consumed else 'unread')
+
+    def splitlines(self):
+        '''return an iterator over the lines, without their end of line'''
+        if self._consumed:
+            raise ValueError('The lines of the output were already read')
+        self._consumed = True
+        return (line.rstrip('\r\n') for line in self._lines)
+
+
+class StreamParser(object):
+    '''Mixin of the parsers which read their output once, line by line, and
+    can therefore parse an output which is never held in memory as a whole.
+
+    The output of a large table (routes, mac addresses, translations) can be
+    parsed from a file or from the lines of a device session, the parsed
+    structure being built as the lines are read.
+
+        example:
+
+            >>> with open('show_ip_route.txt') as f:
+            ...     parsed = ShowIpRoute(device=device).parse_stream(f)
+    '''
+
+    def parse_stream(self, lines, **kwargs):
+        '''Parse the output of the command from an iterable of lines
+
+            Args:
+                lines (`iterable`): the output lines, a file object, a
+                    generator, a list or a string
+                kwargs: the arguments of cli(), other than output
+
+            Returns:
+                dict: the parsed output, validated against the schema
+                      like the output of parse()
+
+            Raises:
+                SchemaEmptyParserError: nothing was parsed from the lines
+        '''
+        return self.parse(output=LineStream(lines), **kwargs)
+
+
+class RecordParser(StreamParser):
+    '''Mixin of the table parsers which can also yield their output one
+    record at a time, instead of returning the whole parsed structure.
+
+    A record is a flat dictionary holding the keys which locate it in the
+    parsed structure (vrf, vlan, mac_address, ...) and the schema fields
+    found on a line of the table. Records are yielded as the lines are read
+    and are not kept, so going through the records of a table of any size
+    only holds one of them at a time.
+
+    cli() builds its result with records_to_dict(), so that records are
+    always what cli() parses.
+
+    Subclasses implement:
+
+        _records(lines, **kwargs): generator of the records of the lines
+        _add_record(parsed, record): add a record to the parsed structure
+
+        example:
+
+            >>> with open('show_mac_address_table.txt') as f:
+            ...     for record in parser.iter_records(f):
+            ...         send(record['vlan'], record['mac_address'],
+            ...              record.get('interface'))
+    '''
+
+    def iter_records(self, lines, **kwargs):
+        '''yield the records of an output
+
+            Args:
+                lines (`iterable`): the output lines, a file object, a
+                    generator, a list or a string
+                kwargs: the arguments of cli() used to parse the output,
+                    other than output
+        '''
+        return self._records(LineStream(lines).splitlines(), **kwargs)
+
+    def records_to_dict(self, records):
+        '''return the structure cli() returns, built from records
+
+            Args:
+                records (`iterable`): the records, from iter_records
+
+            Returns:
+                dict: the parsed output, not validated against the schema
+
+        The nested dictionaries of the records may be used as they are in
+        the parsed output, records should not be modified once added.
+        '''
+        parsed = {}
+        add_record = self._add_record
+        for record in records:
+            add_record(parsed, record)
+        return parsed
+
+    def _records(self, lines, **kwargs):
+        raise NotImplementedError
+
+    def _add_record(self, parsed, record):
+        raise NotImplementedError
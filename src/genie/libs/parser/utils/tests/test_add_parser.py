@@ -1,10 +1,16 @@
+import os
+import shutil
+import tempfile
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from genie.libs.parser.utils.common import (
     parser_data
 )
-from genie.libs.parser.utils.entry_points import add_parser
+from genie.libs.parser.utils import common, entry_points
+from genie.libs.parser.utils.entry_points import add_parser, \
+                                                load_entry_points, \
+                                                entry_point_info
 
 
 class TestAddParser(unittest.TestCase):
@@ -40,5 +46,87 @@ class TestAddParser(unittest.TestCase):
             self.assertIn(cmd, parser_data)
 
 
+class TestLoadEntryPoints(unittest.TestCase):
+
+    cli_command = 'show test_load_entry_points'
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        patch.object(entry_points, 'ENTRY_POINT_CACHE',
+                     os.path.join(self.folder, 'entry_points.json')).start()
+
+        parser = Mock(cli_command=self.cli_command)
+        parser.__name__ = 'MockParser'
+        parser.__module__ = 'genie.libs.parser.utils.tests.test_add_parser'
+        self.function = Mock(return_value={'asa': [parser]})
+        self.load = Mock(return_value=self.function)
+
+        patch.object(entry_points, '_iter_entry_points', return_value=[
+            ('mock', 'mock_package.parsers:add_parsers', '1.0', self.load)
+        ]).start()
+
+    def tearDown(self):
+        patch.stopall()
+        shutil.rmtree(self.folder)
+        parser_data.pop(self.cli_command, None)
+
+    def test_load_entry_points_cached(self):
+        load_entry_points()
+        self.function.assert_called_once_with()
+        self.assertFalse(entry_point_info()['mock']['cached'])
+        self.assertEqual(entry_point_info()['mock']['parsers'], 1)
+        self.assertEqual(parser_data[self.cli_command]['asa']['class'],
+                         'MockParser')
+
+        # Second time the entry point is not loaded
+        parser_data.pop(self.cli_command)
+        load_entry_points()
+        self.load.assert_called_once_with()
+        self.assertTrue(entry_point_info()['mock']['cached'])
+        self.assertEqual(parser_data[self.cli_command]['asa'], {
+            'module_name': 'test_add_parser',
+            'package': 'genie.libs.parser.utils.tests',
+            'class': 'MockParser'})
+
+        load_entry_points(use_cache=False)
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_parser_module_modified(self):
+        load_entry_points()
+        load_entry_points()
+        self.load.assert_called_once_with()
+
+        # A parser module registered by the entry point changed
+        module = 'genie.libs.parser.utils.tests.test_add_parser'
+        mtime = entry_points._module_mtime
+        with patch.object(entry_points, '_module_mtime',
+                          side_effect=lambda name: 0 if name == module
+                          else mtime(name)):
+            load_entry_points()
+        self.assertEqual(self.load.call_count, 2)
+        self.assertFalse(entry_point_info()['mock']['cached'])
+
+    def test_load_time(self):
+        load_entry_points()
+        load_entry_points()
+        info = entry_point_info()['mock']
+        self.assertTrue(info['cached'])
+        self.assertGreaterEqual(info['register_time'], 0)
+        self.assertEqual(info['load_time'], 0)
+
+        # Timed when get_parser imports the parser module
+        data = parser_data[self.cli_command]['asa']
+        lookup = patch.object(common, 'Lookup').start()
+        patch.dict(common.parser_import_times).start()
+        parser_cls = common._find_parser_cls(Mock(os='asa', custom={}), data)
+        self.assertIs(parser_cls,
+                      lookup.from_device.return_value.parser
+                      .test_add_parser.MockParser)
+        key = (data['package'], data['module_name'])
+        self.assertIn(key, common.parser_import_times)
+        self.assertEqual(entry_point_info()['mock']['load_time'],
+                         common.parser_import_times[key])
+
+
 if __name__ == '__main__':
     unittest.main()
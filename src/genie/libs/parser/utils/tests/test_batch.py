@@ -0,0 +1,115 @@
+import os
+import unittest
+
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.utils.batch import BatchParser, parse_batch
+
+
+class ExitParser(ShowArp):
+    '''Parser whose worker dies'''
+
+    def cli(self, output=None):
+        os._exit(1)
+
+
+class UnpicklableParser(ShowArp):
+    '''Parser whose result cannot be sent back by the worker'''
+
+    def cli(self, output=None):
+        return {'parsed': lambda: output}
+
+    def parse(self, **kwargs):
+        return self.cli(**kwargs)
+
+
+class TestBatchParser(unittest.TestCase):
+
+    arp = '''\
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+Internet  192.168.234.2          12   58bf.eaff.e5f7  ARPA   Vlan100
+'''
+
+    items = [
+        ('iosxe', None, 'show arp', arp),
+        ('iosxe', 'cat9k', 'show   arp', arp),
+        ('iosxe', None, 'show arp', ''),
+        ('iosxe', None, 'show something unknown', arp),
+        ('iosxe', {'platform': 'cat9k', 'model': None}, 'show arp', arp),
+    ]
+
+    def check(self, results):
+        results = sorted(results, key=lambda result: result.index)
+        self.assertEqual([result.index for result in results],
+                         list(range(len(self.items))))
+
+        expected = ShowArp(device=None).parse(output=self.arp)
+        for index in (0, 1, 4):
+            self.assertTrue(results[index].ok)
+            self.assertEqual(results[index].parsed, expected)
+        self.assertEqual(results[1].platform, 'cat9k')
+        self.assertEqual(results[1].command, 'show   arp')
+
+        self.assertFalse(results[2].ok)
+        self.assertTrue(
+            results[2].error.startswith('SchemaEmptyParserError'))
+        self.assertIsNone(results[2].parsed)
+
+        self.assertFalse(results[3].ok)
+        self.assertIn('Could not find parser', results[3].error)
+
+    def test_in_process(self):
+        batch = BatchParser(processes=1, chunksize=2)
+        self.check(batch.parse(self.items))
+        self.assertIsNone(batch._pool)
+
+    def test_resolve_once(self):
+        batch = BatchParser(processes=1)
+        list(batch.parse(self.items))
+        # 'show arp' for no platform and cat9k, the unknown command
+        self.assertEqual(len(batch._resolved), 3)
+
+    def test_pool(self):
+        with BatchParser(processes=2, chunksize=1) as batch:
+            self.check(batch.parse(self.items))
+            # The workers are kept for the next batch
+            pool = batch.pool
+            self.check(batch.parse(iter(self.items)))
+            self.assertIs(batch.pool, pool)
+        self.assertIsNone(batch._pool)
+
+    def test_lost_results(self):
+        items = [('iosxe', None, 'show arp', self.arp)] * 2
+        parsers = {'show arp': ShowArp, 'show exit': ExitParser,
+                   'show unpicklable': UnpicklableParser}
+
+        def resolve(os_name, platform, command):
+            parser_cls = parsers[command]
+            return parser_cls.__module__, parser_cls.__qualname__, {}
+
+        with BatchParser(processes=2, chunksize=1) as batch:
+            batch.resolve = resolve
+            results = sorted(batch.parse(items + [
+                ('iosxe', None, 'show unpicklable', self.arp)]),
+                key=lambda result: result.index)
+            self.assertEqual([result.ok for result in results],
+                             [True, True, False])
+            self.assertIn('pickle', results[2].error)
+
+            pool = batch.pool
+            results = list(batch.parse(
+                [('iosxe', None, 'show exit', self.arp)]))
+            self.assertEqual(len(results), 1)
+            self.assertTrue(results[0].error.startswith('BrokenProcessPool'))
+            self.assertEqual(results[0].command, 'show exit')
+
+            # The broken pool is replaced for the next batch
+            self.assertIsNot(batch.pool, pool)
+            self.assertTrue(all(result.ok for result in batch.parse(items)))
+
+    def test_parse_batch(self):
+        self.check(parse_batch(self.items, processes=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
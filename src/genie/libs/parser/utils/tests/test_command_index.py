@@ -0,0 +1,87 @@
+import unittest
+
+from genie.libs.parser.utils.command_index import CommandIndex
+from genie.libs.parser.utils.common import (
+    _fuzzy_search_command,
+    _get_command_index,
+    parser_data
+)
+
+
+class TestCommandIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = CommandIndex({
+            'show version': {'iosxe': {}, 'nxos': {}},
+            'show vrf': {'iosxe': {}},
+            'show vrf {vrf}': {'iosxe': {}},
+            'show vrf {vrf} detail': {'nxos': {}},
+            'show interfaces {interface}': {'iosxe': {}},
+            'show interfaces {interface} detail': {'iosxe': {}},
+            '/dna/intent/api/v1/interface/{interface}': {'dnac': {}},
+        })
+
+    def test_prefix_tokens(self):
+        self.assertEqual(self.index.candidates(['sh', 'ver']),
+                         ['show version'])
+        self.assertEqual(self.index.candidates(['sh', 'v']),
+                         ['show version', 'show vrf'])
+        self.assertEqual(self.index.candidates(['sh', 'x']), [])
+
+    def test_argument_span(self):
+        # vrf only spans a single token
+        self.assertEqual(self.index.candidates(['sh', 'vrf', 'a']),
+                         ['show vrf {vrf}'])
+        self.assertEqual(self.index.candidates(['sh', 'vrf', 'a', 'b']), [])
+
+        # every other argument can span two tokens
+        self.assertEqual(
+            self.index.candidates(['sh', 'int', 'Gi', '1', 'det']),
+            ['show interfaces {interface} detail'])
+        self.assertEqual(
+            self.index.candidates(['sh', 'int', 'Gi1', 'det']),
+            ['show interfaces {interface}',
+             'show interfaces {interface} detail'])
+
+    def test_partial_argument(self):
+        self.assertEqual(
+            self.index.candidates(['/dna/intent/api/v1/interface/x']),
+            ['/dna/intent/api/v1/interface/{interface}'])
+
+    def test_os_filter(self):
+        self.assertEqual(self.index.candidates(['sh', 'vrf', 'a', 'det'],
+                                               os='iosxe'), [])
+        self.assertEqual(self.index.candidates(['sh', 'vrf', 'a', 'det'],
+                                               os='nxos'),
+                         ['show vrf {vrf} detail'])
+        self.assertEqual(self.index.candidates(['sh', 'v'], os='nxos'),
+                         ['show version', 'show vrf'])
+
+    def test_incomplete_search(self):
+        self.assertEqual(self.index.candidates(['sh', 'int'], complete=False),
+                         ['show interfaces {interface}',
+                          'show interfaces {interface} detail'])
+
+    def test_add(self):
+        self.assertEqual(self.index.candidates(['sh', 'ver'], os='junos'), [])
+        self.index.add('show version', {'junos': {}})
+        self.assertEqual(self.index.candidates(['sh', 'ver'], os='junos'),
+                         ['show version'])
+        self.assertEqual(len(self.index), 7)
+
+    def test_index_follows_parser_data(self):
+        index = _get_command_index()
+        self.assertEqual(len(index), len(parser_data))
+
+        command = 'show test_command_index_follows_parser_data'
+        parser_data[command] = {'iosxe': {}}
+        try:
+            results = _fuzzy_search_command(
+                'sh test_command_index_follows', False, 'iosxe')
+            self.assertEqual(results[0][0], command)
+        finally:
+            del parser_data[command]
+
+
+if __name__ == '__main__':
+    unittest.main()
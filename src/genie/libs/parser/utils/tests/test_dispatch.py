@@ -0,0 +1,90 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.dispatch import LineDispatcher
+from genie.libs.parser.utils.patterns import PatternTable
+
+
+class TestLineDispatcher(unittest.TestCase):
+
+    patterns = PatternTable(
+        p1=r'^(?P<intf>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)$',
+        p2=r'^Hardware +is +(?P<type>.+)$',
+        p3=r'^MTU +(?P<mtu>\d+) +bytes$',
+        p4=r'^(?P<pkts>\d+) +packets +input$',
+        p5=r'^(input|output) +flow-control +is +(?P<state>\w+)$',
+        p6=r'^\*? *(?P<nexthop>[\w\.]+)$',
+        p7=r'^.*catch all$',
+        p8=(r'^mtu +(?P<mtu>\d+)$', re.I),
+        p9=r'^\s*via +(?P<nexthop>\S+)$',
+    )
+
+    lines = ['GigabitEthernet1 is up', 'Hardware is CSR vNIC', 'MTU 1500 bytes',
+             '12 packets input', 'input flow-control is off',
+             'output flow-control is on', '* 10.1.1.1', '10.1.1.1',
+             'a catch all', 'MTU 9000', 'mtu 9000', '   via 10.1.1.1',
+             'via Null0', 'Hardware', '', '   ', 'unknown line here']
+
+    def setUp(self):
+        self.dispatch = LineDispatcher(self.patterns)
+
+    def brute_force(self, line):
+        for name, pattern in self.patterns.items():
+            m = pattern.match(line)
+            if m:
+                return name, m.groupdict()
+        return None, None
+
+    def test_first_match(self):
+        for line in self.lines:
+            name, m = self.dispatch.match(line)
+            self.assertEqual((name, m and m.groupdict()),
+                             self.brute_force(line), line)
+
+    def test_candidates(self):
+        names = lambda line: [entry.name
+                              for entry in self.dispatch.candidates(line)]
+
+        self.assertEqual(names('MTU 1500 bytes'),
+                         ['p1', 'p3', 'p6', 'p7', 'p8'])
+        self.assertEqual(names('12 packets input'),
+                         ['p1', 'p4', 'p6', 'p7', 'p8'])
+        self.assertEqual(names('* 10.1.1.1'), ['p6', 'p7', 'p8'])
+        self.assertEqual(names('   via 10.1.1.1'), ['p6', 'p7', 'p8', 'p9'])
+        self.assertEqual(names(''), ['p7', 'p8'])
+
+    def test_prefix(self):
+        entries = {entry.name: entry
+                   for entry in self.dispatch.candidates('Hardware is x')}
+        self.assertEqual(entries['p2'].prefix, 'Hardware')
+        self.assertEqual(entries['p1'].prefix, '')
+
+        # the prefix is checked before the pattern
+        self.assertEqual(self.dispatch.match('Hardwar is up')[0], 'p1')
+
+    def test_literal(self):
+        entries = {entry.name: entry
+                   for entry in self.dispatch.candidates('12 packets input')}
+        self.assertEqual(entries['p4'].literal, 'packets')
+        self.assertEqual(entries['p1'].literal, 'is')
+        self.assertEqual(entries['p6'].literal, '')
+        self.assertEqual(entries['p7'].literal, 'catch all')
+        # case insensitive patterns are not indexed
+        self.assertEqual(entries['p8'].literal, '')
+
+        # the literal is checked before the pattern
+        self.assertEqual(self.dispatch.match('12 packet input'), (None, None))
+
+    def test_names(self):
+        dispatch = LineDispatcher(self.patterns, ['p3', 'p1'])
+        self.assertEqual(dispatch.names, ['p3', 'p1'])
+        self.assertEqual(dispatch.match('Hardware is x')[0], 'p1')
+        self.assertEqual(dispatch.match('10.1.1.1'), (None, None))
+
+        dispatch = LineDispatcher([('a', re.compile('^a')),
+                                   ('b', re.compile('^b'))])
+        self.assertEqual(dispatch.match('b')[0], 'b')
+
+
+if __name__ == '__main__':
+    unittest.main()
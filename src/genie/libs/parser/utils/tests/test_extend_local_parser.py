@@ -1,6 +1,9 @@
 import os
+import shutil
+import tempfile
 import unittest
-from genie.libs.parser.utils.extension import ExtendParsers
+from unittest.mock import patch
+from genie.libs.parser.utils.extension import ExtendParsers, _NotStatic
 from genie.libs.parser.utils.tests.dummy_parser import package_path
 
 class TestExtendParser(unittest.TestCase):
@@ -49,6 +52,131 @@ class TestExtendParser(unittest.TestCase):
                 }
             })
 
+    def test_extend_static(self):
+        folder = tempfile.mkdtemp()
+        cache_file = os.path.join(folder, 'cache.json')
+        try:
+            ext = ExtendParsers('genie.libs.parser.utils.tests.dummy_parser')
+            ext.extend()
+
+            static = ExtendParsers(
+                'genie.libs.parser.utils.tests.dummy_parser',
+                discovery=ExtendParsers.STATIC, cache_file=cache_file)
+            with patch('importlib.import_module') as import_module:
+                static.extend()
+            import_module.assert_not_called()
+
+            self.assertEqual(static.output, ext.output)
+            self.assertTrue(os.path.isfile(cache_file))
+
+            # Second run only reads the cache
+            cached = ExtendParsers(
+                'genie.libs.parser.utils.tests.dummy_parser',
+                discovery=ExtendParsers.STATIC, cache_file=cache_file)
+            with patch.object(ExtendParsers, '_find_static_parsers') as find:
+                cached.extend()
+            find.assert_not_called()
+
+            self.assertEqual(cached.output, ext.output)
+        finally:
+            shutil.rmtree(folder)
+
+    def test_find_static_parsers(self):
+        source = '''
+from genie.metaparser import MetaParser
+
+COMMAND = 'show computed'
+
+class ShowSchema(MetaParser):
+    schema = {}
+
+class ShowOne(ShowSchema):
+    """Parser for show one"""
+    cli_command = ['show one', 'show one {vrf}']
+
+class ShowOneDetail(ShowOne):
+    pass
+
+class _ShowPrivate(ShowSchema):
+    cli_command = 'show private'
+
+class Helper:
+    cli_command = 'show helper'
+'''
+        self.assertEqual(ExtendParsers._find_static_parsers(source), [
+            ('ShowOne', 'Parser for show one',
+                ['show one', 'show one {vrf}']),
+            ('ShowOneDetail', None, ['show one', 'show one {vrf}']),
+        ])
+
+        with self.assertRaises(_NotStatic):
+            ExtendParsers._find_static_parsers(
+                source + "\nclass ShowTwo(ShowSchema):\n"
+                         "    cli_command = COMMAND\n")
+
+    def test_find_static_parsers_not_metaparser(self):
+        source = '''
+import genie.metaparser
+from genie.metaparser import MetaParser as Base
+
+class Command(object):
+    cli_command = 'show object'
+
+class ShowOne(Base):
+    cli_command = 'show one'
+
+class ShowTwo(genie.metaparser.MetaParser):
+    cli_command = 'show two'
+'''
+        self.assertEqual(ExtendParsers._find_static_parsers(source), [
+            ('ShowOne', None, 'show one'),
+            ('ShowTwo', None, 'show two'),
+        ])
+
+        # Defined again, the last definition is the class of the module
+        self.assertEqual(ExtendParsers._find_static_parsers(
+            source + "\nclass ShowOne(Command):\n    pass\n"), [
+            ('ShowTwo', None, 'show two'),
+        ])
+
+    def test_find_static_parsers_imported_base(self):
+        # cli_command inherited from, or MetaParser through, a class of
+        # another module
+        for source in ['''
+from .show_base import ShowBase
+
+class ShowOne(ShowBase):
+    pass
+''', '''
+from genie.libs.parser.iosxe.show_arp import ShowArpSchema
+
+class ShowArp(ShowArpSchema):
+    cli_command = 'show arp'
+''', '''
+import show_base
+
+class ShowOne(show_base.ShowBase):
+    pass
+''']:
+            with self.assertRaises(_NotStatic):
+                ExtendParsers._find_static_parsers(source)
+
+        # Only importing the module can tell them apart
+        folder = tempfile.mkdtemp()
+        cache_file = os.path.join(folder, 'cache.json')
+        try:
+            static = ExtendParsers(
+                'genie.libs.parser.utils.tests.dummy_parser',
+                discovery=ExtendParsers.STATIC, cache_file=cache_file)
+            with patch.object(ExtendParsers, '_find_static_parsers',
+                              side_effect=_NotStatic('ShowClock')), \
+                    patch.object(ExtendParsers, '_import_parsers',
+                                 return_value=[]) as import_parsers:
+                static.extend()
+            self.assertEqual(import_parsers.call_count, 3)
+        finally:
+            shutil.rmtree(folder)
+
 
 if __name__ == '__main__':
     unittest.main()
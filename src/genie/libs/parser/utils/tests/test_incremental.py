@@ -0,0 +1,140 @@
+import os
+import unittest
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAllNeighbors, \
+                                             ShowBgpNeighbors
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces, \
+                                                   ShowIpInterface
+from genie.libs.parser.iosxe.show_ospf import ShowIpOspfDatabaseRouter
+
+IOSXE_TESTS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           os.pardir, os.pardir, 'iosxe', 'tests')
+
+
+def golden_output(cls, name):
+    path = os.path.join(IOSXE_TESTS, cls.__name__, 'cli', 'equal',
+                        name + '_output.txt')
+    with open(path) as f:
+        return f.read()
+
+
+class TestParseIncremental(unittest.TestCase):
+
+    interface = '''\
+GigabitEthernet{index} is up, line protocol is up
+  Hardware is CSR vNIC, address is 5254.00ff.0e7e (bia 5254.00ff.0e7e)
+  Internet address is 10.0.{index}.1/24
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation ARPA, loopback not set
+  5 minute input rate 0 bits/sec, 0 packets/sec
+     {packets} packets input, 2297417 bytes, 0 no buffer
+'''
+
+    ip_interfaces = '''\
+Loopback0 is up, line protocol is up
+  Internet address is 192.168.1.1/32
+  Broadcast address is 255.255.255.255
+Tunnel1 is up, line protocol is up
+  Interface is unnumbered. Using address of Loopback0 (2001:db8::1)
+  MTU is 1500 bytes
+'''
+
+    def interfaces(self, count, packets=None):
+        packets = packets or {}
+        return ''.join(self.interface.format(index=i,
+                                             packets=packets.get(i, 100))
+                       for i in range(1, count + 1))
+
+    def assertParsed(self, parser_cls, output, previous=None, **kwargs):
+        result = parser_cls(device=None).parse_incremental(
+            output, previous=previous, **kwargs)
+        self.assertEqual(result.parsed, parser_cls(device=None).parse(
+            output=output, **kwargs))
+        return result
+
+    def test_changed_block(self):
+        result = self.assertParsed(ShowInterfaces, self.interfaces(4))
+        self.assertEqual((result.parsed_blocks, result.reused_blocks), (4, 0))
+
+        result = self.assertParsed(
+            ShowInterfaces, self.interfaces(4, {2: 150}), previous=result)
+        self.assertEqual((result.parsed_blocks, result.reused_blocks), (1, 3))
+        self.assertEqual(
+            result.parsed['GigabitEthernet2']['counters']['in_pkts'], 150)
+
+    def test_added_removed(self):
+        result = self.assertParsed(ShowInterfaces, self.interfaces(4))
+        result = self.assertParsed(ShowInterfaces, self.interfaces(5),
+                                   previous=result)
+        self.assertEqual((result.parsed_blocks, result.reused_blocks), (1, 4))
+
+        result = self.assertParsed(ShowInterfaces, self.interfaces(3),
+                                   previous=result)
+        self.assertEqual((result.parsed_blocks, result.reused_blocks), (0, 3))
+        self.assertEqual(len(result.blocks), 3)
+
+    def test_copy(self):
+        result = ShowInterfaces(device=None).parse_incremental(
+            self.interfaces(2))
+        result.parsed['GigabitEthernet1'].clear()
+        self.assertParsed(ShowInterfaces, self.interfaces(2),
+                          previous=result)
+
+    def test_other_arguments(self):
+        result = self.assertParsed(ShowInterfaces, self.interfaces(2))
+        result = self.assertParsed(ShowInterfaces, self.interfaces(2),
+                                   previous=result,
+                                   interface='GigabitEthernet1')
+        self.assertEqual(result.reused_blocks, 0)
+
+    def test_unnumbered(self):
+        # Loopback0 is in another block than the interface using it
+        self.assertParsed(ShowIpInterface, self.ip_interfaces)
+
+    def test_list_of_neighbors(self):
+        output = golden_output(ShowBgpAllNeighbors, 'golden_output1')
+        result = self.assertParsed(ShowBgpAllNeighbors, output)
+        self.assertGreater(len(result.parsed['list_of_neighbors']), 1)
+
+    def test_removed_neighbor(self):
+        # ' For address family: ...' within a neighbor is not the context of
+        # the next neighbor
+        lines = golden_output(ShowBgpNeighbors,
+                              'golden_output1').splitlines(True)
+        starts = [i for i, line in enumerate(lines)
+                  if 'BGP neighbor is' in line]
+        header = ''.join(lines[:starts[0]])
+        neighbor = ''.join(lines[starts[0]:starts[1]])
+        neighbors = [neighbor.replace('10.1.1.1', '10.1.1.{}'.format(i))
+                     for i in range(1, 6)]
+
+        result = self.assertParsed(ShowBgpNeighbors,
+                                   header + ''.join(neighbors))
+        result = self.assertParsed(ShowBgpNeighbors,
+                                   header + ''.join(neighbors[1:]),
+                                   previous=result)
+        self.assertEqual(result.parsed_blocks, 0)
+        self.assertEqual(result.reused_blocks, len(result.blocks))
+
+    def test_lead_line(self):
+        output = golden_output(ShowIpOspfDatabaseRouter, 'golden_output1')
+        output = output.replace('  LS age: 1520',
+                                '  Routing Bit Set on this LSA\n'
+                                '  LS age: 1520')
+        result = self.assertParsed(ShowIpOspfDatabaseRouter, output)
+
+        result = self.assertParsed(
+            ShowIpOspfDatabaseRouter,
+            output.replace('LS age: 1520', 'LS age: 1550'), previous=result)
+        self.assertEqual(result.parsed_blocks, 1)
+
+    def test_empty(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            ShowInterfaces(device=None).parse_incremental('\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
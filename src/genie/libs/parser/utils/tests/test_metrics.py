@@ -0,0 +1,139 @@
+import json
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute, ShowIpv6Route
+from genie.libs.parser.utils.common import parse_with
+from genie.libs.parser.utils.metrics import get_metrics, parser_name
+
+
+class TestParserMetrics(unittest.TestCase):
+
+    arp = '''\
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+Internet  192.168.234.2          12   58bf.eaff.e5f7  ARPA   Vlan100
+'''
+
+    interface = '''\
+GigabitEthernet{index} is up, line protocol is up
+  Hardware is CSR vNIC, address is 5254.00ff.0e7e (bia 5254.00ff.0e7e)
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation ARPA, loopback not set
+'''
+
+    def setUp(self):
+        self.metrics = get_metrics()
+        self.metrics.reset()
+        self.metrics.enable()
+
+    def tearDown(self):
+        self.metrics.disable()
+        self.metrics.reset()
+
+    def interfaces(self, count):
+        return ''.join(self.interface.format(index=i)
+                       for i in range(1, count + 1))
+
+    def test_disabled(self):
+        self.metrics.disable()
+        parser = ShowArp(device=None)
+        self.assertIs(parser.patterns, ShowArp.patterns)
+        self.assertIs(ShowInterfaces(device=None).dispatch,
+                      ShowInterfaces.dispatch)
+        parse_with(ShowArp, self.arp)
+        self.assertEqual(self.metrics.as_dict(), {})
+
+    def test_phases(self):
+        output = self.interfaces(3)
+        self.metrics.disable()
+        expected = ShowInterfaces(device=None).parse(output=output)
+        self.metrics.enable()
+        self.assertEqual(parse_with(ShowInterfaces, output), expected)
+
+        stats = self.metrics.as_dict()['iosxe.show_interface.ShowInterfaces']
+        self.assertEqual(stats['parses'], 1)
+        self.assertEqual(list(stats['phases']), ['parse', 'post', 'validate'])
+        for phase in stats['phases'].values():
+            self.assertEqual(phase['count'], 1)
+            self.assertGreater(phase['seconds'], 0)
+
+        # Counted by the LineDispatcher
+        self.assertEqual(stats['patterns']['p1']['hits'], 3)
+        self.assertEqual(stats['patterns']['p2']['hits'], 3)
+        for counters in stats['patterns'].values():
+            self.assertGreaterEqual(counters['attempts'], counters['hits'])
+
+    def test_pattern_table(self):
+        parse_with(ShowArp, self.arp)
+        parse_with(ShowArp, self.arp)
+        stats = self.metrics.stats(ShowArp)
+        self.assertEqual(stats.parses, 2)
+        self.assertEqual(stats.patterns['p1'][:2], [6, 4])
+
+    def test_dispatch_per_address_family(self):
+        parse_with(ShowIpRoute, '''\
+Routing Table: VRF1
+      10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
+C        10.4.1.1 is directly connected, Loopback0
+S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+''')
+        parse_with(ShowIpv6Route, '''\
+L   FF00::/8 [0/0]
+     via Null0, receive
+''')
+        # The dispatcher of IP_VER counts the patterns
+        stats = self.metrics.as_dict()
+        ipv4 = stats['iosxe.show_routing.ShowIpRoute']['patterns']
+        self.assertEqual(ipv4['p3']['hits'], 2)
+        self.assertNotIn('p3_ipv6', ipv4)
+        ipv6 = stats['iosxe.show_routing.ShowIpv6Route']['patterns']
+        self.assertEqual(ipv6['p3_ipv6']['hits'], 1)
+        self.assertNotIn('p3', ipv6)
+
+    def test_execute(self):
+        device = Mock()
+        device.execute.return_value = self.arp
+        parse_with(ShowArp, device=device)
+        device.execute.assert_called_once_with('show arp')
+
+        stats = self.metrics.as_dict()['iosxe.show_arp.ShowArp']
+        self.assertEqual(list(stats['phases']),
+                         ['execute', 'parse', 'validate'])
+
+    def test_chunked(self):
+        parser = ShowInterfaces(device=None)
+        parser.parse_incremental(self.interfaces(2))
+        stats = self.metrics.as_dict()['iosxe.show_interface.ShowInterfaces']
+        self.assertEqual(stats['parses'], 1)
+        self.assertEqual(stats['phases']['parse']['count'], 2)
+        self.assertEqual(stats['phases']['post']['count'], 1)
+        self.assertEqual(stats['phases']['validate']['count'], 1)
+
+    def test_export(self):
+        parse_with(ShowArp, self.arp)
+        self.assertEqual(json.loads(self.metrics.to_json()),
+                         json.loads(json.dumps(self.metrics.as_dict())))
+
+        text = self.metrics.to_prometheus()
+        self.assertIn('# TYPE genie_parser_parses_total counter\n', text)
+        self.assertIn('genie_parser_parses_total'
+                      '{parser="iosxe.show_arp.ShowArp"} 1\n', text)
+        self.assertIn('genie_parser_pattern_hits_total'
+                      '{parser="iosxe.show_arp.ShowArp",pattern="p1"} 2\n',
+                      text)
+        self.assertIn('genie_parser_phase_seconds_total'
+                      '{parser="iosxe.show_arp.ShowArp",phase="parse"} ',
+                      text)
+
+    def test_names(self):
+        self.assertEqual(parser_name(ShowArp), 'iosxe.show_arp.ShowArp')
+        self.assertEqual(parser_name(unittest.TestCase),
+                         'unittest.case.TestCase')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import re
+import unittest
+from unittest.mock import Mock
+from concurrent.futures import ProcessPoolExecutor
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.iosxe.show_bgp import ShowIpBgpAllDetail
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.utils.parallel import split_records
+
+
+class InProcess(object):
+    '''Executor parsing the chunks in the current process, in order'''
+
+    def map(self, fn, iterable):
+        return map(fn, iterable)
+
+
+class TestSplitRecords(unittest.TestCase):
+
+    lines = [
+        'header',
+        'family a',
+        'record 1', 'line',
+        'record 2', 'line', 'line',
+        'family b',
+        'record 3',
+        'record 4', 'line',
+    ]
+
+    def split(self, chunk_lines, context=()):
+        return list(split_records(self.lines, re.compile(r'^record'),
+                                  context, chunk_lines))
+
+    def test_whole(self):
+        self.assertEqual(self.split(100), [self.lines])
+
+    def test_records(self):
+        self.assertEqual(self.split(1), [
+            ['header', 'family a'],
+            ['record 1', 'line'],
+            ['record 2', 'line', 'line', 'family b'],
+            ['record 3'],
+            ['record 4', 'line'],
+        ])
+
+    def test_context(self):
+        self.assertEqual(self.split(3, [r'^family']), [
+            ['header', 'family a', 'record 1', 'line'],
+            ['family a', 'record 2', 'line', 'line', 'family b'],
+            ['family b', 'record 3', 'record 4', 'line'],
+        ])
+
+    def test_context_levels(self):
+        lines = ['family a', 'rd 1', 'record 1', 'rd 2', 'record 2',
+                 'family b', 'record 3']
+        self.assertEqual(list(split_records(
+            lines, re.compile(r'^record'), [r'^family', r'^rd'], 1)), [
+            ['family a', 'rd 1'],
+            ['family a', 'rd 1', 'record 1', 'rd 2'],
+            ['family a', 'rd 2', 'record 2', 'family b'],
+            ['family b', 'record 3'],
+        ])
+
+    def test_outer_context(self):
+        lines = ['family a', 'record 1', ' family b', 'line', 'record 2']
+        self.assertEqual(list(split_records(
+            lines, re.compile(r'^record'), [r'^family'], 1,
+            outer_context=True)), [
+            ['family a'],
+            ['family a', 'record 1', ' family b', 'line'],
+            ['family a', 'record 2'],
+        ])
+
+    def test_lead(self):
+        lines = ['record 1', 'flag', 'record 2', 'line', 'record 3']
+        self.assertEqual(list(split_records(
+            lines, re.compile(r'^record'), chunk_lines=1, lead=[r'^flag'])),
+            [['record 1'], ['flag', 'record 2', 'line'], ['record 3']])
+
+
+class TestParseParallel(unittest.TestCase):
+
+    interfaces = '''\
+GigabitEthernet3 is up, line protocol is up
+  Hardware is CSR vNIC, address is 5254.00ff.0e7e (bia 5254.00ff.0e7e)
+  Interface is unnumbered. Using address of Loopback0 (192.168.154.1)
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation ARPA, loopback not set
+Loopback0 is up, line protocol is up
+  Hardware is Loopback
+  Internet address is 192.168.154.1/24
+  MTU 1514 bytes, BW 8000000 Kbit/sec, DLY 5000 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation LOOPBACK, loopback not set
+'''
+
+    bgp = '''\
+For address family: VPNv4 Unicast
+
+Route Distinguisher: 65000:100 (default for vrf VRF100)
+BGP routing table entry for 65000:100:192.168.111.0/24, version 2
+  Paths: (1 available, best #1, table VRF100)
+  Refresh Epoch 1
+  Local
+    172.16.111.2 (via vrf VRF100) from 0.0.0.0 (10.5.5.5)
+      Origin incomplete, metric 0, localpref 100, weight 32768, valid, sourced, best
+      rx pathid: 0, tx pathid: 0x0
+BGP routing table entry for 65000:100:192.168.112.0/24, version 3
+  Paths: (1 available, best #1, table VRF100)
+  Refresh Epoch 1
+  65001
+    172.17.111.2 (via vrf VRF100) from 172.17.111.2 (172.16.1.209)
+      Origin IGP, metric 0, localpref 100, valid, external, best
+      rx pathid: 0, tx pathid: 0x0
+Route Distinguisher: 65000:200 (default for vrf VRF200)
+BGP routing table entry for 65000:200:192.168.211.0/24, version 4
+  Paths: (1 available, best #1, table VRF200)
+  Refresh Epoch 1
+  Local
+    172.16.211.2 (via vrf VRF200) from 0.0.0.0 (10.5.5.5)
+      Origin incomplete, metric 0, localpref 100, weight 32768, valid, sourced, best
+      rx pathid: 0, tx pathid: 0x0
+'''
+
+    def chunked(self, cls, output, **kwargs):
+        parser = cls(device=Mock())
+        parser.parallel_threshold = 0
+        return parser.parse_parallel(output, executor=InProcess(),
+                                     chunk_lines=1, **kwargs)
+
+    def test_unnumbered(self):
+        # The unnumbered interface and the one it uses are parsed in
+        # different chunks
+        expected = ShowInterfaces(device=Mock()).parse(output=self.interfaces)
+        parsed = self.chunked(ShowInterfaces, self.interfaces)
+        self.assertEqual(parsed, expected)
+        self.assertEqual(
+            parsed['GigabitEthernet3']['ipv4']['unnumbered'],
+            {'interface_ref': 'Loopback0'})
+
+    def test_context(self):
+        expected = ShowIpBgpAllDetail(device=Mock()).parse(output=self.bgp)
+        self.assertEqual(self.chunked(ShowIpBgpAllDetail, self.bgp), expected)
+
+    def test_serial(self):
+        # Below the threshold the output is parsed by parse()
+        parser = ShowInterfaces(device=Mock())
+        parser.parse = Mock(return_value={'parsed': True})
+        self.assertEqual(parser.parse_parallel(self.interfaces, processes=4),
+                         {'parsed': True})
+        parser.parse.assert_called_once_with(output=self.interfaces)
+
+    def test_empty(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            self.chunked(ShowInterfaces, 'not an interface\n')
+
+    def test_pool(self):
+        expected = ShowInterfaces(device=Mock()).parse(output=self.interfaces)
+        parser = ShowInterfaces(device=Mock())
+        parser.parallel_threshold = 0
+        with ProcessPoolExecutor(2) as pool:
+            parsed = parser.parse_parallel(self.interfaces, executor=pool,
+                                           chunk_lines=1)
+        self.assertEqual(parsed, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import (
+    ResolvedCommands,
+    clear_parser_cache,
+    get_output_parser,
+    parse_output,
+    parse_with,
+    parser_data
+)
+
+
+class TokenParser(object):
+    '''Parser registered under the 'tests' token of the 'utils' os'''
+
+
+class StatefulParser(ShowArp):
+    '''Parser which keeps what it parsed on the instance'''
+
+    def cli(self, output=None):
+        self.last_output = output
+        return super().cli(output=output)
+
+
+class TestParseOutput(unittest.TestCase):
+
+    arp = '''\
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+'''
+
+    command = 'show test_parse_output vrf {vrf}'
+
+    def setUp(self):
+        parser_data[self.command] = {
+            'utils': {
+                'tests': {'module_name': 'test_parse_output',
+                          'package': 'genie.libs.parser',
+                          'class': 'TokenParser'},
+                'module_name': 'common',
+                'package': 'genie.libs.parser',
+                'class': 'ResolvedCommands'}}
+        clear_parser_cache()
+
+    def tearDown(self):
+        parser_data.pop(self.command, None)
+        clear_parser_cache()
+
+    def test_parse_output(self):
+        self.assertEqual(parse_output('iosxe', 'show arp', self.arp),
+                         ShowArp(device=Mock()).parse(output=self.arp))
+
+    def test_tokens(self):
+        self.assertEqual(
+            get_output_parser('utils', 'show test_parse_output vrf blue'),
+            (ResolvedCommands, {'vrf': 'blue'}))
+        self.assertEqual(
+            get_output_parser('utils', 'show test_parse_output vrf blue',
+                              platform='tests'),
+            (TokenParser, {'vrf': 'blue'}))
+        # Unknown tokens are skipped
+        self.assertEqual(
+            get_output_parser('utils', 'show test_parse_output vrf blue',
+                              platform='other', model='tests'),
+            (TokenParser, {'vrf': 'blue'}))
+
+    def test_cached(self):
+        get_output_parser('iosxe', 'show arp')
+        hits = common._output_parser_cache.hits
+        get_output_parser('iosxe', 'show  arp')
+        self.assertEqual(common._output_parser_cache.hits, hits + 1)
+
+    def test_unknown(self):
+        with self.assertRaises(Exception) as cm:
+            parse_output('iosxe', 'show test_parse_output unknown', self.arp)
+        self.assertIn('Could not find parser', str(cm.exception))
+
+    def test_empty(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            parse_output('iosxe', 'show arp', '')
+
+    def test_reuse(self):
+        common._parser_instances.instances = {}
+        parse_with(ShowArp, self.arp)
+        instance = common._parser_instances.instances[ShowArp][0]
+        parse_with(ShowArp, self.arp)
+        self.assertIs(common._parser_instances.instances[ShowArp][0],
+                      instance)
+
+        # Not reused once its attributes are modified
+        parsed = parse_with(StatefulParser, self.arp)
+        self.assertEqual(parsed, parse_with(ShowArp, self.arp))
+        self.assertNotIn(StatefulParser, common._parser_instances.instances)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.cache import LRUCache, MISSING
+from genie.libs.parser.utils.common import (
+    get_parser,
+    parser_data,
+    clear_parser_cache,
+    get_parser_cache_info,
+    warm_parser_cache
+)
+from genie.libs.parser.utils.entry_points import add_parser
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+
+        # 'b' is the least recently used entry
+        cache.put('c', 3)
+        self.assertIs(cache.get('b'), MISSING)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(tuple(cache.info()), (3, 1, 2, 2))
+
+        cache.reset()
+        self.assertEqual(tuple(cache.info()), (0, 0, 2, 0))
+
+
+class TestParserCache(unittest.TestCase):
+
+    command = 'show test_parser_cache'
+
+    def setUp(self):
+        parser_data[self.command] = {
+            'iosxe': {'module_name': 'show_platform',
+                      'package': 'genie.libs.parser',
+                      'class': 'ShowVersion'}}
+        clear_parser_cache()
+        common._parser_cache.reset()
+
+        self.device = Mock(os='iosxe', platform='cat9k', model=None,
+                           custom={})
+        self.lookup = patch.object(common, 'Lookup').start()
+        self.lookup.from_device.return_value._tokens = ['iosxe']
+        self.find = patch.object(common, '_find_parser_cls',
+                                 return_value='ShowVersion').start()
+
+    def tearDown(self):
+        patch.stopall()
+        parser_data.pop(self.command, None)
+        clear_parser_cache()
+
+    def test_cache_hit(self):
+        self.assertEqual(get_parser(self.command, self.device),
+                         ('ShowVersion', {}))
+        self.assertEqual(get_parser('  show   test_parser_cache ',
+                                    self.device), ('ShowVersion', {}))
+
+        self.assertEqual(self.find.call_count, 1)
+        self.assertEqual(get_parser_cache_info().hits, 1)
+        self.assertEqual(get_parser_cache_info().misses, 1)
+
+    def test_cache_key_device(self):
+        get_parser(self.command, self.device)
+        self.device.platform = 'cat3k'
+        get_parser(self.command, self.device)
+
+        self.assertEqual(self.find.call_count, 2)
+
+    def test_invalidation(self):
+        get_parser(self.command, self.device)
+
+        mock_parser = Mock(cli_command='show test_parser_cache_invalidation')
+        mock_parser.__name__ = 'MockParser'
+        mock_parser.__module__ = 'genie.libs.parser'
+        try:
+            add_parser(parser=mock_parser, os_name='iosxe')
+            self.assertEqual(get_parser_cache_info().currsize, 0)
+
+            get_parser(self.command, self.device)
+            self.assertEqual(self.find.call_count, 2)
+        finally:
+            parser_data.pop('show test_parser_cache_invalidation', None)
+
+        # A command entry modified in place
+        parser_data[self.command]['iosxe'] = dict(
+            parser_data[self.command]['iosxe'])
+        get_parser(self.command, self.device)
+        self.assertEqual(self.find.call_count, 3)
+
+    def test_warm(self):
+        self.assertEqual(warm_parser_cache(
+            [self.command, 'show test_parser_cache_missing'], self.device),
+            ['show test_parser_cache_missing'])
+
+        get_parser(self.command, self.device)
+        self.assertEqual(self.find.call_count, 1)
+
+
+class TestLookupCache(unittest.TestCase):
+
+    data = {'module_name': 'show_platform',
+            'package': 'genie.libs.parser',
+            'class': 'ShowVersion'}
+
+    def setUp(self):
+        clear_parser_cache()
+        self.lookup = patch.object(common, 'Lookup').start()
+
+    def tearDown(self):
+        patch.stopall()
+        clear_parser_cache()
+
+    def test_identical_devices(self):
+        first = Mock(os='iosxe', platform='cat9k', model='c9300', custom={})
+        second = Mock(os='iosxe', platform='cat9k', model='c9300', custom={})
+
+        parser_cls = common._find_parser_cls(first, self.data)
+        self.assertIs(common._find_parser_cls(second, self.data), parser_cls)
+        self.assertIs(common._get_lookup(second, 'genie.libs.parser'),
+                      self.lookup.from_device.return_value)
+        self.lookup.from_device.assert_called_once()
+
+    def test_device_change(self):
+        device = Mock(os='iosxe', platform='cat9k', model='c9300',
+                      custom={'abstraction': {'order': ['os', 'platform']}})
+        common._find_parser_cls(device, self.data)
+
+        device.platform = 'cat3k'
+        common._find_parser_cls(device, self.data)
+        self.assertEqual(self.lookup.from_device.call_count, 2)
+
+        device.custom['abstraction']['order'] = ['os']
+        common._find_parser_cls(device, self.data)
+        self.assertEqual(self.lookup.from_device.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+import os
+import re
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.utils import dispatch as dispatch_module
+from genie.libs.parser.utils.common import parse_with
+from genie.libs.parser.utils.dispatch import LineDispatcher, \
+                                             get_pattern_profile, \
+                                             set_pattern_profile
+from genie.libs.parser.utils.metrics import get_metrics, parser_name
+from genie.libs.parser.utils.pattern_order import PatternProfile, \
+                                                  evaluation_order, exclusive
+from genie.libs.parser.utils.patterns import PatternTable
+
+
+class ShowStatus(object):
+
+    patterns = PatternTable(
+        intf=r'^(?P<intf>\S+) +is +(?P<state>\w+)$',
+        hardware=r'^Hardware +is +(?P<type>.+)$',
+        mtu=r'^MTU +(?P<mtu>\d+) +bytes$',
+        input=r'^(?P<pkts>\d+) +packets +input$',
+        output=r'^(?P<pkts>\d+) +packets +output$',
+    )
+
+    dispatch = LineDispatcher(patterns)
+
+
+class TestExclusive(unittest.TestCase):
+
+    def assertExclusive(self, first, second, expected=True):
+        first, second = re.compile(first), re.compile(second)
+        self.assertEqual(exclusive(first, second), expected)
+        self.assertEqual(exclusive(second, first), expected)
+
+    def test_exclusive(self):
+        self.assertExclusive(r'^MTU +(?P<mtu>\d+)', r'^Hardware +is')
+        self.assertExclusive(r'^(?P<pkts>\d+) +packets +input',
+                             r'^(?P<pkts>\d+) +packets +output')
+        self.assertExclusive(r'^(?P<rate>\d+) *(minute|second) *input',
+                             r'^(?P<pkts>\d+) +packets')
+        self.assertExclusive(r'^\D', r'^[0-9]')
+        self.assertExclusive(r'^[^0-9 ]+$', r'^ *[0-9]')
+
+    def test_not_exclusive(self):
+        self.assertExclusive(r'^(?P<intf>\S+) +is +(?P<state>.*)$',
+                             r'^Hardware +is', False)
+        # match() only anchors the start of the line
+        self.assertExclusive(r'^MTU', r'^MTU +\d+ +bytes$', False)
+        self.assertExclusive(r'^a', r'^(b|a)', False)
+        self.assertExclusive(r'^\s*via', r'^via', False)
+        self.assertExclusive(r'^\w', r'^\d', False)
+        # unicode digits are not known to be outside \D
+        self.assertExclusive(r'^\D', r'^\d', False)
+        self.assertExclusive(r'^[a-z]{2,}$', r'^ab', False)
+
+    def test_unsupported(self):
+        # back references and case insensitive patterns are never proven
+        self.assertExclusive(r'^(a)\1$', r'^b', False)
+        self.assertEqual(exclusive(re.compile('^mtu', re.I),
+                                   re.compile('^Hardware')), False)
+
+
+class TestEvaluationOrder(unittest.TestCase):
+
+    patterns = [(name, re.compile(pattern)) for name, pattern in [
+        ('intf', r'^(?P<intf>\S+) +is +(?P<state>\w+)$'),
+        ('hardware', r'^Hardware +is +(?P<type>.+)$'),
+        ('mtu', r'^MTU +(?P<mtu>\d+) +bytes$'),
+        ('input', r'^(?P<pkts>\d+) +packets +input$'),
+        ('output', r'^(?P<pkts>\d+) +packets +output$'),
+    ]]
+
+    def test_order(self):
+        self.assertEqual(
+            evaluation_order(self.patterns, {'output': 10, 'input': 5,
+                                             'mtu': 2}),
+            ['output', 'input', 'mtu', 'intf', 'hardware'])
+
+    def test_not_exclusive(self):
+        # hardware lines may match intf, which is tried first
+        self.assertEqual(
+            evaluation_order(self.patterns, {'hardware': 10, 'intf': 1}),
+            ['intf', 'hardware', 'mtu', 'input', 'output'])
+        self.assertEqual(
+            evaluation_order(self.patterns, {'hardware': 10, 'mtu': 5}),
+            ['mtu', 'intf', 'hardware', 'input', 'output'])
+
+    def test_no_hits(self):
+        self.assertEqual(evaluation_order(self.patterns, {}),
+                         [name for name, _ in self.patterns])
+
+
+class TestPatternProfile(unittest.TestCase):
+
+    interface = '''\
+GigabitEthernet1 is up, line protocol is up
+  Hardware is CSR vNIC, address is 5254.00ff.0e7e (bia 5254.00ff.0e7e)
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation ARPA, loopback not set
+  5 minute input rate 0 bits/sec, 0 packets/sec
+  5 minute output rate 0 bits/sec, 0 packets/sec
+     0 output errors, 0 collisions, 1 interface resets
+     0 unknown protocol drops
+'''
+
+    lines = ['GigabitEthernet1 is up', 'Hardware is CSR vNIC',
+             'MTU 1500 bytes', '12 packets input', '12 packets output',
+             'Hardware is up', '12 packets', '']
+
+    def setUp(self):
+        self.previous = set_pattern_profile(PatternProfile())
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        set_pattern_profile(self.previous)
+        shutil.rmtree(self.folder)
+
+    def test_dispatcher(self):
+        dispatch = ShowStatus.dispatch
+        expected = [dispatch.match(line) for line in self.lines]
+        self.assertEqual(dispatch.names,
+                         ['intf', 'hardware', 'mtu', 'input', 'output'])
+
+        set_pattern_profile(PatternProfile({
+            parser_name(ShowStatus): {'output': 10, 'hardware': 5}}))
+        self.assertEqual(dispatch.names,
+                         ['output', 'intf', 'hardware', 'mtu', 'input'])
+        for line, (name, m) in zip(self.lines, expected):
+            self.assertEqual(dispatch.match(line)[0], name, line)
+
+        # a dispatcher not declared on a class is never ordered
+        self.assertEqual(LineDispatcher(ShowStatus.patterns).names,
+                         ['intf', 'hardware', 'mtu', 'input', 'output'])
+
+    def test_corpus(self):
+        metrics = get_metrics()
+        metrics.reset()
+        metrics.enable()
+        try:
+            expected = parse_with(ShowInterfaces, self.interface)
+            profile = PatternProfile.from_metrics(metrics)
+        finally:
+            metrics.disable()
+            metrics.reset()
+
+        hits = profile.hits(ShowInterfaces)
+        self.assertEqual(hits['p30'], 1)
+        self.assertNotIn('p22', hits)
+        self.assertEqual(profile.hits('iosxe.show_interface.ShowInterfaces'),
+                         hits)
+
+        path = os.path.join(self.folder, 'profile.json')
+        profile.save(path)
+        self.assertEqual(PatternProfile.load(path).hits(ShowInterfaces), hits)
+
+        declared = ShowInterfaces.dispatch.names
+        set_pattern_profile(PatternProfile.load(path))
+        self.assertNotEqual(ShowInterfaces.dispatch.names, declared)
+        self.assertEqual(sorted(ShowInterfaces.dispatch.names),
+                         sorted(declared))
+        self.assertEqual(parse_with(ShowInterfaces, self.interface), expected)
+
+    def test_configured(self):
+        path = os.path.join(self.folder, 'profile.json')
+        PatternProfile({'iosxe.show_arp.ShowArp': {'p1': 3}}).save(path)
+        with patch.dict(os.environ, {'GENIE_LIBS_PARSER_PATTERN_PROFILE':
+                                     path}), \
+                patch.object(dispatch_module.cfg, 'get', return_value=None):
+            set_pattern_profile(None)
+            profile = get_pattern_profile()
+        self.assertIs(get_pattern_profile(), profile)
+        self.assertEqual(profile.hits('iosxe.show_arp.ShowArp'), {'p1': 3})
+
+
+if __name__ == '__main__':
+    unittest.main()
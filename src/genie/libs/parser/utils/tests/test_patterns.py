@@ -0,0 +1,64 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.patterns import PatternTable
+
+
+class TestPatternTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = PatternTable(
+            p1=r'^Name: +(?P<name>\S+)$',
+            p2=(r'^mtu +(?P<mtu>\d+)$', re.I),
+            p3=re.compile(r'^up$'))
+
+    def test_lazy_compile(self):
+        self.assertEqual(self.table.compiled, [])
+
+        m = self.table.p1.match('Name: Gi1')
+        self.assertEqual(m.groupdict(), {'name': 'Gi1'})
+        self.assertEqual(self.table.compiled, ['p1'])
+
+        # compiled once, then a plain attribute
+        self.assertIs(self.table.p1, self.table.p1)
+        self.assertIn('p1', vars(self.table))
+
+    def test_flags(self):
+        self.assertTrue(self.table.p2.match('MTU 1500'))
+        self.assertTrue(self.table['p3'].match('up'))
+
+        table = PatternTable(p1=r'^name$', flags=re.I)
+        self.assertTrue(table.p1.match('Name'))
+
+    def test_compile_all(self):
+        self.assertIs(self.table.compile_all(), self.table)
+        self.assertEqual(self.table.compiled, ['p1', 'p2', 'p3'])
+        self.assertEqual([name for name, _ in self.table.items()],
+                         list(self.table))
+
+    def test_extend(self):
+        table = self.table.extend(p1=r'^Interface: +(?P<name>\S+)$',
+                                  p4=r'^down$')
+        self.assertEqual(list(table), ['p1', 'p2', 'p3', 'p4'])
+        self.assertTrue(table.p1.match('Interface: Gi1'))
+        self.assertFalse(self.table.p1.match('Interface: Gi1'))
+
+    def test_errors(self):
+        with self.assertRaises(AttributeError):
+            self.table.p5
+        with self.assertRaises(KeyError):
+            self.table['p5']
+        with self.assertRaises(AttributeError):
+            self.table.p1 = 'x'
+        with self.assertRaises(ValueError):
+            PatternTable(extend=r'^x$')
+
+    def test_class_attribute(self):
+        class Parser(object):
+            patterns = PatternTable(p1=r'^(?P<value>\d+)$')
+
+        self.assertIs(Parser().patterns.p1, Parser().patterns.p1)
+
+
+if __name__ == '__main__':
+    unittest.main()
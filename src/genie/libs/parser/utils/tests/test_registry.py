@@ -0,0 +1,152 @@
+import copy
+import json
+import pickle
+import unittest
+import threading
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.registry import ParserRegistry
+
+
+class TestParserRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = Mock(return_value={'show version': {'iosxe': {}}})
+        self.registry = ParserRegistry(self.loader)
+
+    def test_lazy_load(self):
+        self.assertFalse(self.registry.loaded)
+        self.loader.assert_not_called()
+
+        self.assertIn('show version', self.registry)
+        self.assertTrue(self.registry.loaded)
+
+        self.assertEqual(list(self.registry.items()),
+                         [('show version', {'iosxe': {}})])
+        self.loader.assert_called_once_with()
+
+    def test_preload(self):
+        self.assertIs(self.registry.preload(), self.registry)
+        self.assertTrue(self.registry.loaded)
+        self.assertEqual(len(self.registry), 1)
+        self.loader.assert_called_once_with()
+
+    def test_add(self):
+        # not loaded, applied once loaded
+        self.registry.add('show clock', 'iosxe', {'class': 'ShowClock'})
+        self.loader.assert_not_called()
+        self.assertEqual(self.registry['show clock'],
+                         {'iosxe': {'class': 'ShowClock'}})
+
+        # loaded, applied right away
+        version = self.registry.version
+        self.registry.add('show clock', 'nxos', {'class': 'ShowClock'})
+        self.assertEqual(self.registry['show clock'],
+                         {'iosxe': {'class': 'ShowClock'},
+                          'nxos': {'class': 'ShowClock'}})
+        self.assertGreater(self.registry.version, version)
+
+    def test_shard_loader(self):
+        shard_loader = Mock(return_value={'show version': {'nxos': {}}})
+        registry = ParserRegistry(self.loader, shard_loader)
+        registry.add('show clock', 'nxos', {'class': 'ShowClock'})
+        registry.add('show clock', 'iosxe', {'class': 'ShowClock'})
+
+        self.assertEqual(registry.shard('nxos'),
+                         {'show version': {'nxos': {}},
+                          'show clock': {'nxos': {'class': 'ShowClock'}}})
+        self.assertIs(registry.shard('nxos'), registry.shard('nxos'))
+        self.assertEqual(registry.shards, ['nxos'])
+
+        shard_loader.assert_called_once_with('nxos')
+        self.loader.assert_not_called()
+        self.assertFalse(registry.loaded)
+
+    def test_commands(self):
+        self.loader.return_value = {
+            'show version': {'iosxe': {}},
+            'show vrf {vrf}': {'iosxe': {}},
+            'show clock': {'nxos': {}},
+            'tokens': ['iosxe', 'nxos']}
+
+        commands = self.registry.commands('iosxe')
+        self.assertEqual(commands, ('show version',))
+        self.assertIs(self.registry.commands('iosxe'), commands)
+        self.assertEqual(self.registry.command_set('iosxe'),
+                         frozenset(['show version']))
+
+        # updated by add, arguments are skipped
+        self.registry.add('show inventory', 'iosxe', {})
+        self.registry.add('show ip route {vrf}', 'iosxe', {})
+        self.registry.add('show version', 'iosxe', {})
+        self.assertEqual(self.registry.commands('iosxe'),
+                         ('show version', 'show inventory'))
+        self.assertIn('show inventory', self.registry.command_set('iosxe'))
+
+        # rebuilt after any other modification
+        del self.registry['show version']
+        self.assertEqual(self.registry.commands('iosxe'),
+                         ('show inventory',))
+
+    def test_shard_from_data(self):
+        self.registry['show clock'] = {'nxos': {}, 'iosxe': {}}
+        self.registry['tokens'] = ['iosxe', 'c9300']
+
+        self.assertEqual(self.registry.shard('iosxe'),
+                         {'show version': {'iosxe': {}},
+                          'show clock': {'iosxe': {}},
+                          'tokens': ['iosxe', 'c9300']})
+        self.assertEqual(self.registry.shard('nxos'),
+                         {'show clock': {'nxos': {}}})
+
+        # shards follow the modifications of the registry
+        del self.registry['show clock']
+        self.assertEqual(self.registry.shard('nxos'), {})
+
+    def test_nested_modification(self):
+        self.assertEqual(self.registry.shard('nxos'), {})
+        self.assertEqual(self.registry.commands('nxos'), ())
+        version = self.registry.version
+
+        self.registry['show version']['nxos'] = {'class': 'ShowVersion'}
+        self.assertGreater(self.registry.version, version)
+        self.assertEqual(self.registry.shard('nxos'),
+                         {'show version': {'nxos': {'class': 'ShowVersion'}}})
+        self.assertEqual(self.registry.commands('nxos'), ('show version',))
+
+        version = self.registry.version
+        self.registry['show version']['nxos'].update({'class': 'Other'})
+        self.assertGreater(self.registry.version, version)
+        self.assertEqual(self.registry.shard('nxos')['show version'],
+                         {'nxos': {'class': 'Other'}})
+
+        self.registry.get('show version').pop('nxos')
+        self.assertEqual(self.registry.shard('nxos'), {})
+        self.assertEqual(self.registry.commands('nxos'), ())
+
+        # add does not invalidate what it updates itself
+        self.registry.shard('iosxe')
+        self.registry.add('show version', 'iosxe', {'class': 'ShowVersion'})
+        self.assertIn('iosxe', self.registry.shards)
+
+        # copies are plain dictionaries
+        entry = self.registry['show version']
+        for copied in (copy.copy(entry), copy.deepcopy(entry),
+                       pickle.loads(pickle.dumps(entry))):
+            self.assertIs(type(copied), dict)
+            self.assertEqual(copied, entry)
+        self.assertEqual(json.loads(json.dumps(entry)), entry)
+
+    def test_concurrent_load(self):
+        threads = [threading.Thread(target=self.registry.preload)
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.loader.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import pickle
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import (
+    ResolvedCommands,
+    clear_parser_cache,
+    get_parser_cache_info,
+    parser_data,
+    resolve_many
+)
+
+
+class TestResolveMany(unittest.TestCase):
+
+    commands = ['show test_resolve_many detail',
+                'show test_resolve_many details',
+                'show test_resolve_many vrf {vrf}']
+
+    def setUp(self):
+        for command in self.commands:
+            parser_data[command] = {
+                'iosxe': {'module_name': 'common',
+                          'package': 'genie.libs.parser.utils',
+                          'class': 'ResolvedCommands'}}
+        clear_parser_cache()
+        common._parser_cache.reset()
+
+        self.device = Mock(os='iosxe', platform=None, model=None, custom={})
+        self.lookup = patch.object(common, 'Lookup').start()
+        self.lookup.from_device.return_value._tokens = ['iosxe']
+        self.find = patch.object(common, '_find_parser_cls',
+                                 return_value=ResolvedCommands).start()
+
+    def tearDown(self):
+        patch.stopall()
+        for command in self.commands:
+            parser_data.pop(command, None)
+        clear_parser_cache()
+
+    def test_resolve_many(self):
+        resolved = resolve_many([
+            'show test_resolve_many detail',
+            'show test_resolve_many vrf blue',
+            'show test_resolve_many det',
+            'show test_resolve_many unknown',
+            'show test_resolve_many detail'], self.device)
+
+        self.assertEqual(resolved.parsers, {
+            'show test_resolve_many detail': (ResolvedCommands, {}),
+            'show test_resolve_many vrf blue': (ResolvedCommands,
+                                                {'vrf': 'blue'})})
+        self.assertEqual(resolved.ambiguous, {
+            'show test_resolve_many det': [
+                'show test_resolve_many detail',
+                'show test_resolve_many details']})
+        self.assertEqual(list(resolved.unresolved),
+                         ['show test_resolve_many unknown'])
+
+        # Abstraction lookup done once for the whole list
+        self.lookup.from_device.assert_called_once()
+
+        # Shares the get_parser cache
+        self.assertEqual(common.get_parser('show test_resolve_many detail',
+                                           self.device),
+                         (ResolvedCommands, {}))
+        self.assertEqual(get_parser_cache_info().hits, 1)
+
+    def test_serializable(self):
+        resolved = resolve_many(['show test_resolve_many vrf blue',
+                                 'show test_resolve_many det'], self.device)
+
+        data = json.loads(json.dumps(resolved.to_dict()))
+        loaded = ResolvedCommands.from_dict(data)
+        self.assertEqual(loaded.parsers, resolved.parsers)
+        self.assertEqual(loaded.ambiguous, resolved.ambiguous)
+
+        loaded = pickle.loads(pickle.dumps(resolved))
+        self.assertEqual(loaded.parsers, resolved.parsers)
+
+
+if __name__ == '__main__':
+    unittest.main()
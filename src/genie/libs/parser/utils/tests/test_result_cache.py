@@ -0,0 +1,159 @@
+import os
+import json
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.utils import result_cache
+from genie.libs.parser.utils.common import parse_output
+from genie.libs.parser.utils.result_cache import ParseResultCache
+
+
+class TestParseResultCache(unittest.TestCase):
+
+    arp = '''\
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+Internet  192.168.234.2          12   58bf.eaff.e5f7  ARPA   Vlan100
+'''
+
+    def output(self, i):
+        return self.arp + \
+            'Internet  10.0.0.{}               -   58bf.eaff.e5f7  ARPA   ' \
+            'Vlan100\n'.format(i)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_hit(self):
+        cache = ParseResultCache()
+        parsed = cache.parse(ShowArp, self.arp)
+        self.assertEqual(parsed, ShowArp(device=None).parse(output=self.arp))
+
+        # A copy which can be modified without changing the cached result
+        parsed['interfaces'].clear()
+        self.assertNotEqual(cache.parse(ShowArp, self.arp), parsed)
+
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_key(self):
+        cache = ParseResultCache()
+        cache.parse(ShowArp, self.arp)
+        cache.parse(ShowArp, self.arp + '\n')
+        self.assertEqual(cache.info().misses, 2)
+
+        # Another version of the parser module
+        with patch.object(result_cache, 'module_version', return_value='2'):
+            cache.parse(ShowArp, self.arp)
+        self.assertEqual(cache.info().misses, 3)
+
+    def test_parser_version(self):
+        version = result_cache.parser_version(ShowArp)
+        self.assertEqual(result_cache.parser_version(ShowArp), version)
+
+        # Module of a base class
+        base = ShowArp.__mro__[1].__module__
+        module_version = result_cache.module_version
+        with patch.object(result_cache, 'module_version',
+                          side_effect=lambda name: 'modified' if name == base
+                          else module_version(name)):
+            self.assertNotEqual(result_cache.parser_version(ShowArp), version)
+
+        with patch.object(result_cache.parser, '__version__', 'modified'):
+            self.assertNotEqual(result_cache.parser_version(ShowArp), version)
+
+    def test_read_only(self):
+        cache = ParseResultCache(read_only=True)
+        expected = ShowArp(device=None).parse(output=self.arp)
+        for _ in range(2):
+            parsed = cache.parse(ShowArp, self.arp)
+            self.assertEqual(parsed, expected)
+            with self.assertRaises(TypeError):
+                parsed['interfaces'] = {}
+            with self.assertRaises(TypeError):
+                parsed['interfaces']['Vlan100']['ipv4'] = {}
+
+        copy = parsed.copy()
+        copy['interfaces'].clear()
+        self.assertEqual(cache.parse(ShowArp, self.arp), expected)
+
+    def test_eviction(self):
+        cache = ParseResultCache(maxsize=2, max_bytes=None)
+        for i in range(3):
+            cache.parse(ShowArp, self.output(i))
+        cache.parse(ShowArp, self.output(0))
+
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.evictions,
+                          info.currsize), (0, 4, 2, 2))
+
+        size = cache.info().nbytes // 2
+        cache = ParseResultCache(max_bytes=size * 2)
+        for i in range(4):
+            cache.parse(ShowArp, self.output(i))
+        self.assertLessEqual(cache.info().nbytes, size * 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_disk(self):
+        cache = ParseResultCache(directory=self.directory)
+        expected = cache.parse(ShowArp, self.arp)
+
+        # Warm after a restart
+        cache = ParseResultCache(directory=self.directory)
+        self.assertEqual(cache.parse(ShowArp, self.arp), expected)
+        self.assertEqual(cache.parse(ShowArp, self.arp), expected)
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.disk_hits), (1, 0, 1))
+
+        cache.clear(disk=True)
+        cache.parse(ShowArp, self.arp)
+        self.assertEqual(cache.info().misses, 1)
+
+    def test_disk_json(self):
+        cache = ParseResultCache(directory=self.directory)
+        parsed = {'index': {1: {'up': True, 'mtu': None}}, 'vrf': ['a']}
+        with patch.object(result_cache, 'parse_with', return_value=parsed):
+            cache.parse(ShowArp, self.arp)
+        path, = [os.path.join(self.directory, name)
+                 for name in os.listdir(self.directory)]
+        with open(path) as f:
+            json.load(f)
+
+        # The keys which are not strings are read back as they were
+        cache.clear()
+        self.assertEqual(cache.parse(ShowArp, self.arp), parsed)
+        self.assertEqual(cache.info().disk_hits, 1)
+
+        # A file which is not a result is a miss, parsed again
+        cache.clear()
+        with open(path, 'wb') as f:
+            f.write(pickle.dumps(parsed))
+        cache.parse(ShowArp, self.arp)
+        self.assertEqual(cache.info().misses, 2)
+
+    def test_error(self):
+        cache = ParseResultCache()
+        for _ in range(2):
+            with self.assertRaises(SchemaEmptyParserError):
+                cache.parse(ShowArp, '')
+        self.assertEqual(len(cache), 0)
+
+    def test_parse_output(self):
+        cache = ParseResultCache()
+        parsed = parse_output('iosxe', 'show arp', self.arp, cache=cache)
+        self.assertEqual(parse_output('iosxe', 'show arp', self.arp,
+                                      cache=cache), parsed)
+        self.assertEqual(cache.info().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from genie.libs.parser.utils.common import (
+    _strip_parser_data,
+    make_runtime_index
+)
+
+
+class TestRuntimeIndex(unittest.TestCase):
+
+    parsers = {
+        'show inventory': {
+            'iosxe': {
+                'c9300': {
+                    'module_name': 'show_platform',
+                    'package': 'genie.libs.parser',
+                    'class': 'ShowInventory',
+                    'doc': 'Parser for show inventory',
+                    'schema': "{\n  'index': <class 'dict'>,\n}",
+                    'uid': 'show_inventory',
+                    'url': 'https://github.com/CiscoTestAutomation',
+                },
+                'module_name': 'show_platform',
+                'package': 'genie.libs.parser',
+                'class': 'ShowInventory',
+                'doc': None,
+                'schema': None,
+                'uid': 'show_inventory',
+                'url': 'https://github.com/CiscoTestAutomation',
+            }
+        },
+        'tokens': ['iosxe', 'c9300']
+    }
+
+    expected = {
+        'show inventory': {
+            'iosxe': {
+                'c9300': {
+                    'module_name': 'show_platform',
+                    'package': 'genie.libs.parser',
+                    'class': 'ShowInventory',
+                },
+                'module_name': 'show_platform',
+                'package': 'genie.libs.parser',
+                'class': 'ShowInventory',
+            }
+        },
+        'tokens': ['iosxe', 'c9300']
+    }
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_strip_parser_data(self):
+        self.assertEqual(_strip_parser_data(self.parsers), self.expected)
+
+    def test_make_runtime_index(self):
+        parsers = os.path.join(self.folder, 'parsers.json')
+        with open(parsers, 'w') as f:
+            json.dump(self.parsers, f)
+
+        output = make_runtime_index(parsers)
+        self.assertEqual(output,
+                         os.path.join(self.folder, 'parsers_index.json'))
+
+        with open(output) as f:
+            self.assertEqual(json.load(f), self.expected)
+
+        with open(os.path.join(self.folder, 'parsers_index',
+                               'iosxe.json')) as f:
+            self.assertEqual(json.load(f), self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+from unittest.mock import patch
+
+from genie.metaparser.util.exceptions import SchemaError
+from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, Use
+
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.utils import schema as schema_module
+from genie.libs.parser.utils.schema import ListSchema, compile_schema, \
+                                           compiled_validator
+
+
+class TestListSchema(unittest.TestCase):
+
+    def test_list(self):
+        validate = ListSchema('rt', {'rt-destination': str,
+                                     Optional('rt-prefix-length'): str})
+        value = [{'rt-destination': '10.0.0.0'},
+                 {'rt-destination': '10.0.1.0', 'rt-prefix-length': '24'}]
+        self.assertIs(validate(value), value)
+
+        with self.assertRaises(SchemaError):
+            validate([{'rt-destination': 1}])
+        with self.assertRaises(SchemaError):
+            validate([{'rt-destination': '10.0.0.0', 'unknown': '1'}])
+
+    def test_not_list(self):
+        validate = ListSchema('rt', {'rt-destination': str})
+        with self.assertRaisesRegex(SchemaError, 'rt is not a list'):
+            validate({'rt-destination': '10.0.0.0'})
+
+    def test_single(self):
+        validate = ListSchema('rt', {'rt-destination': str}, single=True)
+        self.assertEqual(validate({'rt-destination': '10.0.0.0'}),
+                         [{'rt-destination': '10.0.0.0'}])
+
+    def test_nested(self):
+        schema = {
+            'route-table': Use(ListSchema('route-table', {
+                'table-name': str,
+                Optional('rt'): Use(ListSchema('rt', {
+                    'rt-destination': str,
+                })),
+            })),
+        }
+        Schema(schema).validate({'route-table': [
+            {'table-name': 'inet.0', 'rt': [{'rt-destination': '10.0.0.0'}]},
+        ]})
+        with self.assertRaises(SchemaError):
+            Schema(schema).validate({'route-table': [
+                {'table-name': 'inet.0', 'rt': {'rt-destination': '10.0.0.0'}},
+            ]})
+
+    def test_built_once(self):
+        built = []
+        validate = ListSchema('rt', lambda: built.append(1) or
+                              {'rt-destination': str})
+        with patch.object(schema_module, 'Schema',
+                          side_effect=schema_module.Schema) as schema:
+            for _ in range(3):
+                validate([{'rt-destination': '10.0.0.0'}])
+        self.assertEqual(schema.call_count, 1)
+        self.assertEqual(built, [1])
+
+
+class TestCompileSchema(unittest.TestCase):
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'index': int,
+                Optional('name'): str,
+                Optional('state'): Or('up', 'down'),
+                Optional('neighbors'): {
+                    Any(): {
+                        'up': bool,
+                        Optional('uptime'): Any(),
+                    },
+                },
+            },
+        },
+        Optional('total'): int,
+    }
+
+    valid = {
+        'vrf': {
+            'default': {'index': 1, 'state': 'up',
+                        'neighbors': {'10.0.0.1': {'up': True,
+                                                   'uptime': [1]}}},
+            'mgmt': {'index': 2, 'name': 'Mgmt-intf', 'neighbors': {}},
+        },
+        'total': 2,
+    }
+
+    def assertSame(self, schema, data):
+        # Either both validate or both raise the same error
+        try:
+            Schema(schema).validate(data)
+        except Exception as e:
+            with self.assertRaises(type(e)) as cm:
+                compile_schema(schema)(data)
+            self.assertEqual(str(cm.exception), str(e))
+        else:
+            self.assertIs(compile_schema(schema)(data), data)
+
+    def test_valid(self):
+        self.assertSame(self.schema, self.valid)
+        self.assertSame(self.schema, {'vrf': {}})
+
+    def test_invalid(self):
+        for data in ({},
+                     {'vrf': [], 'total': 1},
+                     {'vrf': {'default': {'index': '1'}}},
+                     {'vrf': {'default': {'name': 'x'}}},
+                     {'vrf': {'default': {'index': 1, 'state': 'admin'}}},
+                     {'vrf': {'default': {'index': 1, 'unknown': 1}}},
+                     {'vrf': {'default': {'index': 1,
+                                          'neighbors': {'a': {'up': 1}}}}},
+                     {'vrf': {}, 'total': 1, 'unknown': 1}):
+            self.assertSame(self.schema, data)
+
+    def test_generic_keys(self):
+        # Keys which are types or functions are left to Schema
+        schema = {Optional(str): int, 'name': str}
+        self.assertSame(schema, {'name': 'x'})
+        self.assertSame(schema, {'name': 1})
+
+    def test_compiled_validator(self):
+        validate = compiled_validator(ShowArp)
+        self.assertIs(compiled_validator(ShowArp), validate)
+        with patch.object(ShowArp, 'schema', {'interfaces': dict}):
+            self.assertIsNot(compiled_validator(ShowArp), validate)
+        self.assertIsNot(compiled_validator(ShowArp), validate)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import io
+import unittest
+import tracemalloc
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.nxos import show_fdb as nxos_show_fdb
+from genie.libs.parser.utils.stream import LineStream
+
+
+class TestLineStream(unittest.TestCase):
+
+    def test_lines(self):
+        stream = LineStream(io.StringIO('line 1\nline 2\r\n\nline 4'))
+        self.assertTrue(stream)
+        self.assertEqual(list(stream.splitlines()),
+                         ['line 1', 'line 2', '', 'line 4'])
+
+    def test_string(self):
+        stream = LineStream('line 1\nline 2\n')
+        self.assertEqual(list(stream.splitlines()), ['line 1', 'line 2'])
+
+    def test_lazy(self):
+        read = []
+
+        def lines():
+            for i in range(3):
+                read.append(i)
+                yield 'line {}\n'.format(i)
+
+        lines = LineStream(lines()).splitlines()
+        self.assertEqual(read, [])
+        self.assertEqual(next(lines), 'line 0')
+        self.assertEqual(read, [0])
+
+    def test_read_once(self):
+        stream = LineStream(['line 1'])
+        list(stream.splitlines())
+        with self.assertRaises(ValueError):
+            stream.splitlines()
+
+
+class TestParseStream(unittest.TestCase):
+
+    output = '''\
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+Internet  192.168.234.2          12   58bf.eaff.e5f7  ARPA   Vlan100
+Internet  10.169.197.93           -   fa16.3eff.b7ad  ARPA
+'''
+
+    def test_parse_stream(self):
+        expected = ShowArp(device=Mock()).parse(output=self.output)
+        parsed = ShowArp(device=Mock()).parse_stream(io.StringIO(self.output))
+        self.assertEqual(parsed, expected)
+
+        lines = (line for line in self.output.splitlines())
+        parsed = ShowArp(device=Mock()).parse_stream(lines)
+        self.assertEqual(parsed, expected)
+
+    def test_empty(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            ShowArp(device=Mock()).parse_stream(iter([]))
+
+    def test_output_argument(self):
+        output = '''\
+   VLAN     MAC Address      Type      age     Secure NTFY Ports
+---------+-----------------+--------+---------+------+----+---------------
+*   10     aaaa.bbff.8888   static   -         F      F    Eth1/2
+*   20     aaaa.bbff.8888   static   -         F      F    Drop
+'''
+        parser_cls = nxos_show_fdb.ShowMacAddressTable
+        self.assertEqual(
+            parser_cls(device=Mock()).parse_stream(io.StringIO(output)),
+            parser_cls(device=Mock()).parse(output=output))
+
+        # Only the parsers whose cli() takes the output
+        self.assertFalse(hasattr(nxos_show_fdb.ShowMacAddressTableBase,
+                                 'parse_stream'))
+
+
+class TestRecordParser(unittest.TestCase):
+
+    output = '''\
+          Mac Address Table
+-------------------------------------------
+
+Vlan    Mac Address       Type        Ports
+----    -----------       --------    -----
+ All    0100.0cff.999a    STATIC      CPU
+  10    aaaa.bbff.8888    STATIC      Gi1/0/8 Gi1/0/9
+  20    aaaa.bbff.8888    STATIC      Drop
+Total Mac Addresses for this criterion: 3
+'''
+
+    def test_records(self):
+        parser = ShowMacAddressTable(device=Mock())
+        self.assertEqual(list(parser.iter_records(self.output)), [
+            {'vlan': 'all', 'mac_address': '0100.0cff.999a',
+             'interface': 'CPU', 'entry_type': 'static'},
+            {'vlan': 10, 'mac_address': 'aaaa.bbff.8888',
+             'interface': 'GigabitEthernet1/0/8', 'entry_type': 'static'},
+            {'vlan': 10, 'mac_address': 'aaaa.bbff.8888',
+             'interface': 'GigabitEthernet1/0/9', 'entry_type': 'static'},
+            {'vlan': 20, 'mac_address': 'aaaa.bbff.8888', 'drop': True,
+             'entry_type': 'static'},
+            {'total_mac_addresses': 3},
+        ])
+
+    def test_records_to_dict(self):
+        parser = ShowMacAddressTable(device=Mock())
+        self.assertEqual(
+            parser.records_to_dict(parser.iter_records(self.output)),
+            parser.cli(output=self.output))
+
+    def test_flat_memory(self):
+        def lines(count):
+            for i in range(count):
+                yield 'Internet  10.0.{}.{}  -   0050.56ff.{:04x}  ARPA   ' \
+                      'Vlan{}'.format(i >> 8 & 0xff, i & 0xff, i, i % 100)
+
+        def peak(count):
+            tracemalloc.start()
+            for _ in ShowArp(device=Mock()).iter_records(lines(count)):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak
+
+        # Ten times more entries do not take more memory
+        self.assertLess(peak(20000), peak(2000) * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError, \
+                                             SchemaError
+
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.utils import validation
+from genie.libs.parser.utils.common import parse_with
+from genie.libs.parser.utils.validation import ValidationPolicy, \
+                                               ValidationInfo, \
+                                               get_validation_policy, \
+                                               set_validation_policy, \
+                                               parse_mode
+
+
+class TestValidationPolicy(unittest.TestCase):
+
+    arp = '''\
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+'''
+
+    interface = '''\
+GigabitEthernet1 is up, line protocol is up
+  Hardware is CSR vNIC, address is 5254.00ff.0e7e (bia 5254.00ff.0e7e)
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation ARPA, loopback not set
+'''
+
+    def setUp(self):
+        self.previous = set_validation_policy(None)
+
+    def tearDown(self):
+        set_validation_policy(self.previous)
+
+    def parse(self, policy, parser_cls, output, count):
+        set_validation_policy(policy)
+        for _ in range(count):
+            parse_with(parser_cls, output)
+        return policy.info(parser_cls)
+
+    def test_parse_mode(self):
+        self.assertEqual(parse_mode('always'), ('always', 1))
+        self.assertEqual(parse_mode(' Never '), ('never', 0))
+        self.assertEqual(parse_mode('sample:10'), ('sample', 10))
+        self.assertEqual(parse_mode('sample:1'), ('always', 1))
+        for mode in ('sample', 'sample:0', 'sample:x', 'never:2', 'strict'):
+            with self.assertRaises(ValueError):
+                parse_mode(mode)
+
+    def test_always(self):
+        self.assertEqual(self.parse(ValidationPolicy(), ShowArp, self.arp, 3),
+                         ValidationInfo(validated=3, skipped=0, failed=0))
+
+    def test_never(self):
+        policy = ValidationPolicy('never')
+        self.assertEqual(self.parse(policy, ShowArp, self.arp, 3),
+                         ValidationInfo(validated=0, skipped=3, failed=0))
+        self.assertEqual(parse_with(ShowArp, self.arp),
+                         ShowArp(device=None).parse(output=self.arp))
+        with self.assertRaises(SchemaEmptyParserError):
+            parse_with(ShowArp, '')
+
+    def test_sample(self):
+        policy = ValidationPolicy('sample:4')
+        self.assertEqual(self.parse(policy, ShowArp, self.arp, 9),
+                         ValidationInfo(validated=3, skipped=6, failed=0))
+
+        policy.reset()
+        self.assertEqual(self.parse(policy, ShowArp, self.arp, 1),
+                         ValidationInfo(validated=1, skipped=0, failed=0))
+
+    def test_overrides(self):
+        policy = ValidationPolicy('never', overrides={
+            'iosxe.show_arp.ShowArp': 'always',
+            ShowInterfaces: 'sample:2'})
+        self.assertEqual(self.parse(policy, ShowArp, self.arp, 2).validated, 2)
+        self.assertEqual(
+            self.parse(policy, ShowInterfaces, self.interface, 2).validated, 1)
+        self.assertEqual(policy.info(), ValidationInfo(3, 1, 0))
+        self.assertEqual(
+            set(policy.stats()),
+            {'genie.libs.parser.iosxe.show_arp.ShowArp',
+             'genie.libs.parser.iosxe.show_interface.ShowInterfaces'})
+
+        policy = ValidationPolicy(overrides={'ShowArp': 'never'})
+        self.assertEqual(policy.mode_of(ShowArp), ('never', 0))
+        self.assertEqual(policy.mode_of(ShowInterfaces), ('always', 1))
+
+    def test_failed(self):
+        policy = ValidationPolicy()
+        set_validation_policy(policy)
+        with patch.object(ShowArp, 'schema', {'missing': str}):
+            with self.assertRaises(SchemaError):
+                parse_with(ShowArp, self.arp)
+            with self.assertRaises(SchemaEmptyParserError):
+                parse_with(ShowArp, '')
+        self.assertEqual(policy.info(ShowArp), ValidationInfo(0, 0, 1))
+
+    def test_compiled(self):
+        policy = ValidationPolicy(compiled=True)
+        set_validation_policy(policy)
+        with patch.object(ShowArp, 'parse') as parse:
+            self.assertEqual(parse_with(ShowArp, self.arp),
+                             ShowArp(device=None).cli(output=self.arp))
+        parse.assert_not_called()
+        with patch.object(ShowArp, 'schema', {'missing': str}):
+            with self.assertRaises(SchemaError):
+                parse_with(ShowArp, self.arp)
+        self.assertEqual(policy.info(ShowArp), ValidationInfo(1, 0, 1))
+
+    def test_chunked(self):
+        policy = ValidationPolicy('never')
+        set_validation_policy(policy)
+        parser = ShowInterfaces(device=None)
+        parser.parse_incremental(self.interface)
+        parser.parallel_threshold = 0
+        parser.parse_parallel(self.interface, processes=1)
+        self.assertEqual(policy.info(ShowInterfaces).skipped, 2)
+
+    def test_configured(self):
+        environ = {'GENIE_LIBS_PARSER_VALIDATION': 'sample:50',
+                   'GENIE_LIBS_PARSER_VALIDATION_COMPILED': 'true',
+                   'GENIE_LIBS_PARSER_VALIDATION_OVERRIDES':
+                       'ShowArp=never, iosxe.show_interface.ShowInterfaces='
+                       'always'}
+        with patch.dict(os.environ, environ), \
+                patch.object(validation.cfg, 'get', return_value=None):
+            set_validation_policy(None)
+            policy = get_validation_policy()
+        self.assertIs(get_validation_policy(), policy)
+        self.assertEqual(policy.mode, ('sample', 50))
+        self.assertTrue(policy.compiled)
+        self.assertEqual(policy.mode_of(ShowArp), ('never', 0))
+        self.assertEqual(policy.mode_of(ShowInterfaces), ('always', 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,294 @@
+'''Policy of the schema validation of the parsed outputs: every output, none,
+or one output in N of each parser class'''
+
+# python
+import os
+import threading
+from time import perf_counter
+from contextlib import contextmanager
+from collections import namedtuple
+
+# pyats
+from pyats import configuration as cfg
+from pyats.utils.exceptions import SchemaError as PyatsSchemaError
+
+# metaparser
+from genie.metaparser.util.schemaengine import Schema
+from genie.metaparser.util.exceptions import SchemaError, \
+                                             SchemaEmptyParserError
+
+from .schema import compiled_validator
+from .metrics import get_metrics, VALIDATE
+
+# 'always' (default), 'never' or 'sample:<N>'
+PARSER_VALIDATION = 'genie.libs.parser.validation'
+
+# Comma separated '<parser>=<mode>', the parser being the class name,
+# '<os>.<module>.<class>' or the full path of the class
+PARSER_VALIDATION_OVERRIDES = 'genie.libs.parser.validation_overrides'
+
+# 'true' to validate with the compiled schemas, see compile_schema
+PARSER_VALIDATION_COMPILED = 'genie.libs.parser.validation_compiled'
+
+ALWAYS = 'always'
+NEVER = 'never'
+SAMPLE = 'sample'
+
+# Errors raised by the schemas and the validators they use
+VALIDATION_ERRORS = (SchemaError, PyatsSchemaError)
+
+ValidationInfo = namedtuple('ValidationInfo', ['validated', 'skipped',
+                                               'failed'])
+
+PARSER_PACKAGE = 'genie.libs.parser.'
+
+
+def parse_mode(mode):
+    '''return the (mode, rate) of 'always', 'never' or 'sample:<N>'
+
+        Raises:
+            ValueError: not a validation mode
+    '''
+    name, _, rate = mode.strip().partition(':')
+    name = name.strip().lower()
+    if name == ALWAYS and not rate:
+        return ALWAYS, 1
+    if name == NEVER and not rate:
+        return NEVER, 0
+    if name == SAMPLE:
+        try:
+            rate = int(rate)
+        except ValueError:
+            rate = 0
+        if rate > 0:
+            return (SAMPLE, rate) if rate > 1 else (ALWAYS, 1)
+    raise ValueError("'{}' is not a validation mode, expected '{}', '{}' or "
+                     "'{}:<N>'".format(mode, ALWAYS, NEVER, SAMPLE))
+
+
+class ValidationPolicy(object):
+    '''Decides which parsed outputs are validated against the schema of
+       their parser, and counts them per parser class
+
+        Args:
+            mode (`str`): 'always' validates every output, 'never' none of
+                them and 'sample:<N>' the first output of each parser class
+                then one in N
+            overrides (`dict`): parser -> mode of its outputs, the parser
+                being the class, its name, '<os>.<module>.<class>' or the
+                full path of the class
+            compiled (`bool`): validate with the schema of the parser class
+                compiled once, rather than with Schema
+
+    A parser whose output fails its validation raises the error as parse()
+    does, whatever the mode. The counters are kept per process, the parses
+    of the workers of a BatchParser are counted in the workers.
+
+        example:
+
+            >>> policy = ValidationPolicy('sample:100', overrides={
+            ...     'iosxe.show_version.ShowVersion': 'always'})
+            >>> set_validation_policy(policy)
+            >>> parse_output('iosxe', 'show interfaces', output)
+            >>> policy.info(ShowInterfaces)
+            ValidationInfo(validated=1, skipped=0, failed=0)
+    '''
+
+    def __init__(self, mode=ALWAYS, overrides=None, compiled=False):
+        self.mode = parse_mode(mode)
+        self.compiled = compiled
+        self.overrides = {}
+        for parser_cls, parser_mode in (overrides or {}).items():
+            if not isinstance(parser_cls, str):
+                parser_cls = '{}.{}'.format(parser_cls.__module__,
+                                            parser_cls.__name__)
+            self.overrides[parser_cls] = parse_mode(parser_mode)
+
+        # parser class -> [parses, validated, skipped, failed]
+        self._counters = {}
+        self._modes = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        mode, rate = self.mode
+        return '{}({!r})'.format(self.__class__.__name__,
+                                 '{}:{}'.format(mode, rate)
+                                 if mode == SAMPLE else mode)
+
+    def mode_of(self, parser_cls):
+        '''return the (mode, rate) of the outputs of a parser class'''
+        try:
+            return self._modes[parser_cls]
+        except KeyError:
+            pass
+
+        path = '{}.{}'.format(parser_cls.__module__, parser_cls.__name__)
+        names = [path, parser_cls.__name__]
+        if path.startswith(PARSER_PACKAGE):
+            names.insert(1, path[len(PARSER_PACKAGE):])
+        for name in names:
+            if name in self.overrides:
+                mode = self.overrides[name]
+                break
+        else:
+            mode = self.mode
+        self._modes[parser_cls] = mode
+        return mode
+
+    def check(self, parser_cls):
+        '''return whether the output of this parse of the parser class is
+           to be validated, the skipped ones are counted'''
+        mode, rate = self.mode_of(parser_cls)
+        with self._lock:
+            counters = self._counters_of(parser_cls)
+            parses = counters[0]
+            counters[0] += 1
+            if mode == ALWAYS or (mode == SAMPLE and parses % rate == 0):
+                return True
+            counters[2] += 1
+            return False
+
+    @contextmanager
+    def validating(self, parser_cls):
+        '''count the validation done within the block, failed when it
+           raises a schema error'''
+        metrics = get_metrics()
+        start = perf_counter() if metrics.enabled else None
+        try:
+            yield
+        except SchemaEmptyParserError:
+            raise
+        except VALIDATION_ERRORS:
+            self._count(parser_cls, 3)
+            raise
+        finally:
+            if start is not None:
+                metrics.record(parser_cls, VALIDATE, perf_counter() - start)
+        self._count(parser_cls, 1)
+
+    def parse(self, parser, output, **kwargs):
+        '''parse the output with a parser, with parse() when this parse is to
+           be validated and as parse() does without the validation otherwise.
+           With compiled schemas, the output of cli() is validated with the
+           compiled schema of the parser class. With the metrics enabled,
+           cli() and the validation are timed apart.
+
+            Args:
+                parser (`MetaParser`): instance of the parser
+                output (`str`): the output of the command
+                kwargs: the arguments of cli(), other than output
+
+            Returns:
+                dict: the parsed output
+
+            Raises:
+                SchemaEmptyParserError: nothing was parsed from the output
+        '''
+        parser_cls = parser.__class__
+        validated = self.check(parser_cls)
+        metrics = get_metrics()
+        if validated and not self.compiled and not metrics.enabled:
+            with self.validating(parser_cls):
+                return parser.parse(output=output, **kwargs)
+
+        if metrics.enabled:
+            parsed = metrics.cli(parser, output=output, **kwargs)
+        else:
+            parsed = parser.cli(output=output, **kwargs)
+        if not parsed:
+            raise SchemaEmptyParserError(parsed)
+        if validated and parser.schema:
+            with self.validating(parser_cls):
+                self._validator(parser_cls, parser.schema)(parsed)
+        return parsed
+
+    def validate(self, parser_cls, parsed, schema=None):
+        '''validate the parsed output against the schema of the parser
+           class, when this parse is to be validated
+
+            Args:
+                parser_cls (`class`): the parser class
+                parsed (`dict`): the parsed output
+                schema (`dict`): the schema, the one of the class by default
+
+            Returns:
+                dict: the parsed output
+        '''
+        schema = parser_cls.schema if schema is None else schema
+        if schema and self.check(parser_cls):
+            with self.validating(parser_cls):
+                self._validator(parser_cls, schema)(parsed)
+        return parsed
+
+    def info(self, parser_cls=None):
+        '''return the counters of a parser class, of all of them by
+           default'''
+        with self._lock:
+            if parser_cls is not None:
+                counters = [self._counters.get(parser_cls, [0, 0, 0, 0])]
+            else:
+                counters = list(self._counters.values())
+            return ValidationInfo(*(sum(c[i] for c in counters)
+                                    for i in (1, 2, 3)))
+
+    def stats(self):
+        '''return the counters of each parser class parsed so far'''
+        with self._lock:
+            return {'{}.{}'.format(cls.__module__, cls.__name__):
+                    ValidationInfo(*counters[1:])
+                    for cls, counters in self._counters.items()}
+
+    def reset(self):
+        '''reset the counters, the first parse of each class is validated
+           again when sampling'''
+        with self._lock:
+            self._counters.clear()
+
+    def _validator(self, parser_cls, schema):
+        if self.compiled and schema is parser_cls.schema:
+            return compiled_validator(parser_cls)
+        return Schema(schema).validate
+
+    def _counters_of(self, parser_cls):
+        counters = self._counters.get(parser_cls)
+        if counters is None:
+            counters = self._counters[parser_cls] = [0, 0, 0, 0]
+        return counters
+
+    def _count(self, parser_cls, index):
+        with self._lock:
+            self._counters_of(parser_cls)[index] += 1
+
+
+_policy = None
+
+
+def _configured(key, default=None):
+    return cfg.get(key, None) or \
+        os.environ.get(key.upper().replace('.', '_'), default)
+
+
+def get_validation_policy():
+    '''return the validation policy of the parsers, the one configured by
+       default'''
+    global _policy
+    if _policy is None:
+        overrides = {}
+        for override in (_configured(PARSER_VALIDATION_OVERRIDES) or
+                         '').split(','):
+            if override.strip():
+                parser_cls, _, mode = override.partition('=')
+                overrides[parser_cls.strip()] = mode
+        compiled = str(_configured(PARSER_VALIDATION_COMPILED, '')).lower()
+        _policy = ValidationPolicy(_configured(PARSER_VALIDATION, ALWAYS),
+                                   overrides,
+                                   compiled=compiled in ('true', 'yes', '1'))
+    return _policy
+
+
+def set_validation_policy(policy):
+    '''set the validation policy of the parsers, None for the configured
+       one, and return the previous one'''
+    global _policy
+    previous, _policy = _policy, policy
+    return previous
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+'''Throughput of the batch parse by number of worker processes.
+
+A batch is built from the golden outputs of a few parsers, repeated to the
+requested number of items, and parsed with a BatchParser of each pool size.
+The workers are started and warmed up before the batch is timed, as a
+collector keeping its BatchParser would.
+
+    python tools/benchmark_batch.py
+    python tools/benchmark_batch.py --items 20000 --processes 1 2 4 8
+'''
+
+# python
+import os
+import time
+import argparse
+import itertools
+
+from benchmark_utils import golden_outputs
+
+from genie.libs.parser.utils.batch import BatchParser
+
+PARSERS = [
+    ('iosxe.show_interface.ShowInterfaces', 'show interfaces'),
+    ('iosxe.show_arp.ShowArp', 'show arp'),
+    ('iosxe.show_fdb.ShowMacAddressTable', 'show mac address-table'),
+    ('iosxe.show_routing.ShowIpRoute', 'show ip route'),
+    ('nxos.show_fdb.ShowMacAddressTable', 'show mac address-table'),
+]
+
+
+def batch_items(count):
+    '''return count (os, platform, command, output) items'''
+    items = []
+    for name, command in PARSERS:
+        os_name = name.split('.')[0]
+        for output, kwargs in golden_outputs(name):
+            if not kwargs:
+                items.append((os_name, None, command, output))
+    return list(itertools.islice(itertools.cycle(items), count))
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--items', type=int, default=5000,
+                        help='number of outputs of the batch')
+    parser.add_argument('--processes', type=int, nargs='+',
+                        default=sorted({1, 2, 4, cpus}),
+                        help='pool sizes to time')
+    args = parser.parse_args()
+
+    items = batch_items(args.items)
+    os_names = sorted({item[0] for item in items})
+
+    print('{} cpus, {} items'.format(cpus, len(items)))
+    print('{:>7} {:>10} {:>12} {:>8} {:>8}'.format(
+        'procs', 'time (s)', 'items/s', 'speedup', 'errors'))
+    baseline = None
+    for processes in args.processes:
+        with BatchParser(processes, os_names) as batch:
+            # Start the workers and resolve the commands
+            list(batch.parse(items[:processes * batch.chunksize]))
+
+            start = time.perf_counter()
+            errors = sum(not result.ok for result in batch.parse(items))
+            elapsed = time.perf_counter() - start
+
+        # Relative to the first pool size timed
+        baseline = baseline or elapsed
+        print('{:>7} {:>10.2f} {:>12.0f} {:>8.2f} {:>8}'.format(
+            processes, elapsed, len(items) / elapsed, baseline / elapsed,
+            errors))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+'''Time of the incremental parse of consecutive polls by share of changed
+records.
+
+A synthetic 'show interfaces' output of the given number of interfaces is
+parsed once with parse_incremental(), then polls where the counters of some
+of the interfaces changed are parsed with parse() and with
+parse_incremental() given the result of the first poll.
+
+    python tools/benchmark_incremental.py
+    python tools/benchmark_incremental.py --records 2000 --changed 0 1 10 50
+'''
+
+# python
+import argparse
+
+from benchmark_utils import load_parser_class, timeit
+from benchmark_parallel import interfaces_output
+
+
+def poll(output, records, percent):
+    '''return the output with the input counters of percent of the
+       interfaces changed'''
+    step = int(100 / percent) if percent else records + 1
+    lines = output.splitlines()
+    index = 0
+    for number, line in enumerate(lines):
+        if line.startswith('GigabitEthernet'):
+            index += 1
+        elif index % step == 0 and 'packets input' in line:
+            lines[number] = line.replace(' packets', '1 packets', 1)
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--records', type=int, default=2000,
+                        help='number of interfaces of the output')
+    parser.add_argument('--changed', type=float, nargs='+',
+                        default=[0, 1, 10, 50, 100],
+                        help='percents of the interfaces changed by a poll')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='parses per poll')
+    args = parser.parse_args()
+
+    cls = load_parser_class('iosxe.show_interface.ShowInterfaces')
+    output = interfaces_output(args.records)
+    first = cls(device=None).parse_incremental(output)
+
+    print('{:>9} {:>8} {:>12} {:>15} {:>8}'.format(
+        'changed', 'parsed', 'parse (ms)', 'incremental (ms)', 'speedup'))
+    for percent in args.changed:
+        polled = poll(output, args.records, percent)
+        result = cls(device=None).parse_incremental(polled, previous=first)
+
+        full = timeit(lambda: cls(device=None).parse(output=polled),
+                      args.repeat)
+        incremental = timeit(
+            lambda: cls(device=None).parse_incremental(polled,
+                                                       previous=first),
+            args.repeat)
+        print('{:>8.0f}% {:>8} {:>12.1f} {:>15.1f} {:>8.2f}'.format(
+            percent, result.parsed_blocks, full * 1e3, incremental * 1e3,
+            full / incremental))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+'''Per call time of parse_output with the parser metrics disabled and
+enabled.
+
+The golden outputs of parsers using a PatternTable or a LineDispatcher are
+parsed with parse_output, the metrics disabled then enabled, and the
+metrics recorded by the last run are printed.
+
+    python tools/benchmark_metrics.py
+    python tools/benchmark_metrics.py --repeat 1000 --format prometheus
+'''
+
+# python
+import argparse
+
+from benchmark_utils import golden_outputs, timeit
+
+from genie.libs.parser.utils.common import parse_output
+from genie.libs.parser.utils.metrics import get_metrics
+
+PARSERS = [
+    ('iosxe.show_arp.ShowArp', 'show arp'),
+    ('iosxe.show_fdb.ShowMacAddressTable', 'show mac address-table'),
+    ('iosxe.show_interface.ShowInterfaces', 'show interfaces'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=100,
+                        help='calls per output')
+    parser.add_argument('--format', choices=['json', 'prometheus'],
+                        default='json', help='format of the metrics printed')
+    args = parser.parse_args()
+
+    metrics = get_metrics()
+    print('{:<38} {:>6} {:>14} {:>13} {:>9}'.format(
+        'parser', 'lines', 'disabled (us)', 'enabled (us)', 'overhead'))
+    for name, command in PARSERS:
+        os_name = name.split('.')[0]
+        for output, kwargs in golden_outputs(name):
+            if kwargs:
+                continue
+
+            metrics.disable()
+            disabled = timeit(lambda: parse_output(os_name, command, output),
+                              args.repeat)
+            metrics.enable()
+            enabled = timeit(lambda: parse_output(os_name, command, output),
+                             args.repeat)
+            print('{:<38} {:>6} {:>14.1f} {:>13.1f} {:>8.0f}%'.format(
+                name, output.count('\n') + 1, disabled * 1e6, enabled * 1e6,
+                (enabled / disabled - 1) * 100))
+
+    if args.format == 'json':
+        print(metrics.to_json(indent=2))
+    else:
+        print(metrics.to_prometheus())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+'''Speedup of the chunked parse of large outputs by number of processes.
+
+Synthetic 'show interfaces' and 'show ip bgp all detail' outputs of the given
+number of records are parsed with parse(), then with parse_parallel() in a
+pool of 1 to the number of cpus processes. The pool is started before the
+parse is timed, as a long running process would keep it.
+
+    python tools/benchmark_parallel.py
+    python tools/benchmark_parallel.py --records 20000 --processes 1 2 4 8
+'''
+
+# python
+import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmark_utils import load_parser_class, timeit
+
+INTERFACE = '''\
+GigabitEthernet0/0/0.{index} is up, line protocol is up
+  Hardware is BUILT-IN-EPA-8x1G, address is 0057.d2ff.{index:04x} (bia 0057.d2ff.{index:04x})
+  Description: customer {index}
+  Internet address is 10.{high}.{low}.1/24
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation 802.1Q Virtual LAN, Vlan ID  {vlan}.
+  ARP type: ARPA, ARP Timeout 04:00:00
+  Keepalive not supported
+  Last input never, output 00:00:02, output hang never
+  Last clearing of "show interface" counters never
+  Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
+  Queueing strategy: fifo
+  Output queue: 0/40 (size/max)
+  5 minute input rate 0 bits/sec, 0 packets/sec
+  5 minute output rate 0 bits/sec, 0 packets/sec
+     {index} packets input, 2297417 bytes, 0 no buffer
+     Received 4173 broadcasts (0 IP multicasts)
+     0 runts, 0 giants, 0 throttles
+     0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+     0 watchdog, 4171 multicast, 0 pause input
+     12229 packets output, 2321107 bytes, 0 underruns
+     0 output errors, 0 collisions, 2 interface resets
+     0 unknown protocol drops
+     0 babbles, 0 late collision, 0 deferred
+     0 lost carrier, 0 no carrier, 0 pause output
+     0 output buffer failures, 0 output buffers swapped out'''
+
+BGP_HEADER = '''\
+For address family: VPNv4 Unicast
+
+Route Distinguisher: 65000:100 (default for vrf VRF100)'''
+
+BGP_ENTRY = '''\
+BGP routing table entry for 65000:100:10.{high}.{low}.0/24, version {index}
+  Paths: (1 available, best #1, table VRF100)
+  Advertised to update-groups:
+     3
+  Refresh Epoch 1
+  65001
+    172.17.111.2 (via vrf VRF100) from 172.17.111.2 (172.16.1.209)
+      Origin IGP, metric 0, localpref 100, valid, external, best
+      Extended Community: RT:65000:100
+      mpls labels in/out {label}/nolabel
+      rx pathid: 0, tx pathid: 0x0'''
+
+
+def interfaces_output(count):
+    '''return a 'show interfaces' output with count subinterfaces'''
+    return '\n'.join(INTERFACE.format(index=i, high=i >> 8 & 0xff,
+                                      low=i & 0xff, vlan=i % 4094 + 1)
+                     for i in range(1, count + 1))
+
+
+def bgp_detail_output(count):
+    '''return a 'show ip bgp all detail' output with count prefixes'''
+    entries = (BGP_ENTRY.format(index=i, high=i >> 8 & 0xff, low=i & 0xff,
+                                label=i % 1000 + 16)
+               for i in range(1, count + 1))
+    return '\n'.join([BGP_HEADER] + list(entries))
+
+
+BENCHMARKS = [
+    ('iosxe.show_interface.ShowInterfaces', interfaces_output),
+    ('iosxe.show_bgp.ShowIpBgpAllDetail', bgp_detail_output),
+]
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--records', type=int, default=10000,
+                        help='number of records of each output')
+    parser.add_argument('--processes', type=int, nargs='+',
+                        default=sorted({1, 2, 4, cpus} - {0}),
+                        help='pool sizes to time')
+    args = parser.parse_args()
+
+    print('{} cpus'.format(cpus))
+    print('{:<38} {:>9} {:>7} {:>10} {:>8}'.format(
+        'parser', 'lines', 'procs', 'time (s)', 'speedup'))
+    for name, generate in BENCHMARKS:
+        parser_cls = load_parser_class(name)
+        output = generate(args.records)
+        lines = output.count('\n') + 1
+
+        serial = timeit(lambda: parser_cls(device=None).parse(output=output),
+                        1)
+        print('{:<38} {:>9} {:>7} {:>10.2f} {:>8.2f}'.format(
+            name, lines, 'serial', serial, 1))
+
+        for processes in args.processes:
+            with ProcessPoolExecutor(processes) as pool:
+                # Start the workers and import the parser in each of them
+                list(pool.map(load_parser_class, [name] * processes))
+
+                elapsed = timeit(
+                    lambda: parser_cls(device=None).parse_parallel(
+                        output, processes=processes, executor=pool), 1)
+            print('{:<38} {:>9} {:>7} {:>10.2f} {:>8.2f}'.format(
+                name, lines, processes, elapsed, serial / elapsed))
+
+
+if __name__ == '__main__':
+    main()
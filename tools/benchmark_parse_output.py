@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+'''Per call time of parse_output against a Mock device and get_parser.
+
+Each golden output of a few parsers is parsed the way offline scripts used
+to, building a Mock device, resolving the parser with get_parser and calling
+parse(), then with parse_output. Small outputs show the overhead of the
+resolution, which parse_output mostly removes.
+
+    python tools/benchmark_parse_output.py
+    python tools/benchmark_parse_output.py --repeat 1000
+'''
+
+# python
+import argparse
+from unittest.mock import Mock
+
+from benchmark_utils import golden_outputs, timeit
+
+from genie.libs.parser.utils.common import get_parser, parse_output
+
+PARSERS = [
+    ('iosxe.show_arp.ShowArp', 'show arp'),
+    ('iosxe.show_fdb.ShowMacAddressTable', 'show mac address-table'),
+    ('iosxe.show_interface.ShowInterfaces', 'show interfaces'),
+    ('nxos.show_fdb.ShowMacAddressTable', 'show mac address-table'),
+]
+
+
+def with_device(os_name, command, output):
+    device = Mock(os=os_name, platform=None, model=None, custom={})
+    parser_cls, kwargs = get_parser(command, device)
+    return parser_cls(device=device).parse(output=output, **kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=100,
+                        help='calls per output')
+    args = parser.parse_args()
+
+    print('{:<38} {:>8} {:>12} {:>12} {:>8}'.format(
+        'parser', 'lines', 'device (us)', 'output (us)', 'speedup'))
+    for name, command in PARSERS:
+        os_name = name.split('.')[0]
+        for output, kwargs in golden_outputs(name):
+            if kwargs:
+                continue
+
+            device = timeit(lambda: with_device(os_name, command, output),
+                            args.repeat)
+            offline = timeit(lambda: parse_output(os_name, command, output),
+                             args.repeat)
+            print('{:<38} {:>8} {:>12.1f} {:>12.1f} {:>8.2f}'.format(
+                name, output.count('\n') + 1, device * 1e6, offline * 1e6,
+                device / offline))
+
+
+if __name__ == '__main__':
+    main()
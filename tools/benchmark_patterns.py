@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+'''Benchmark the cost of compiling the parser patterns on every cli() call.
+
+Each parser is run over its golden outputs with a warm `re` cache, then with
+the cache purged before every call, like it is once a job uses more patterns
+than the 512 the `re` module keeps. Parsers declaring a PatternTable keep
+their compiled patterns and should show the same time in both columns.
+
+    python tools/benchmark_patterns.py
+    python tools/benchmark_patterns.py iosxe.show_interface.ShowInterfaces
+'''
+
+# python
+import re
+import argparse
+
+from benchmark_utils import load_parser_class, golden_outputs, timeit
+
+from genie.libs.parser.utils.patterns import PatternTable
+
+DEFAULT_PARSERS = ['iosxe.show_interface.ShowInterfaces',
+                   'iosxe.show_interface.ShowIpInterface']
+
+
+def benchmark(name, repeat):
+    parser_cls = load_parser_class(name)
+    outputs = golden_outputs(name)
+
+    def parse():
+        for output, kwargs in outputs:
+            parser_cls(device=None).cli(output=output, **kwargs)
+
+    warm = timeit(parse, repeat) / len(outputs)
+    purged = timeit(parse, repeat, setup=re.purge) / len(outputs)
+
+    table = getattr(parser_cls, 'patterns', None)
+    if isinstance(table, PatternTable):
+        # what every call paid once the re cache was evicted
+        compile_time = timeit(lambda: table.extend().compile_all(), repeat,
+                              setup=re.purge)
+    else:
+        compile_time = None
+    return len(outputs), warm, purged, compile_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('parsers', nargs='*', default=DEFAULT_PARSERS,
+                        help='<os>.<module>.<class> of the parsers')
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    print('{:<45} {:>7} {:>12} {:>12} {:>12}'.format(
+        'parser', 'outputs', 'warm (us)', 'purged (us)', 'table (us)'))
+    for name in args.parsers:
+        count, warm, purged, compile_time = benchmark(name, args.repeat)
+        print('{:<45} {:>7} {:>12.1f} {:>12.1f} {:>12}'.format(
+            name, count, warm * 1e6, purged * 1e6,
+            '-' if compile_time is None else
+            '{:.1f}'.format(compile_time * 1e6)))
+
+
+if __name__ == '__main__':
+    main()
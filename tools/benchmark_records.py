@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+'''Peak memory of the record mode of the table parsers.
+
+Synthetic outputs of the given sizes are generated line by line and parsed
+twice: into the whole structure with cli(), and one record at a time with
+iter_records() over the same lines. The peak memory of the records stays
+flat whatever the size of the table, while the structure grows with it.
+
+    python tools/benchmark_records.py
+    python tools/benchmark_records.py --entries 10000 100000
+'''
+
+# python
+import time
+import argparse
+import tracemalloc
+
+from benchmark_utils import load_parser_class
+from benchmark_routes import ipv4_route_lines
+
+
+def mac_address_lines(count):
+    '''yield the lines of a 'show mac address-table' output with count
+       entries'''
+    yield '          Mac Address Table'
+    yield '-------------------------------------------'
+    yield ''
+    yield 'Vlan    Mac Address       Type        Ports'
+    yield '----    -----------       --------    -----'
+    for i in range(count):
+        yield ' {:<4}   {:04x}.{:04x}.{:04x}    DYNAMIC     Gi1/0/{}'.format(
+            i % 4000 + 1, i >> 32 & 0xffff, i >> 16 & 0xffff, i & 0xffff,
+            i % 48 + 1)
+    yield 'Total Mac Addresses for this criterion: {}'.format(count)
+
+
+def arp_lines(count):
+    '''yield the lines of a 'show arp' output with count entries'''
+    yield 'Protocol  Address          Age (min)  Hardware Addr   Type   Interface'
+    for i in range(count):
+        yield 'Internet  10.{}.{}.{:<10} {:>3}   0050.56ff.{:04x}  ARPA   ' \
+              'Vlan{}'.format(i >> 16 & 0xff, i >> 8 & 0xff, i & 0xff,
+                              i % 240, i & 0xffff, i >> 8 & 0xff)
+
+
+BENCHMARKS = [
+    ('iosxe.show_fdb.ShowMacAddressTable', mac_address_lines),
+    ('iosxe.show_arp.ShowArp', arp_lines),
+    ('iosxe.show_routing.ShowIpRoute', ipv4_route_lines),
+]
+
+
+def measure(func):
+    '''return (seconds, peak MiB) of func'''
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return elapsed, peak / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--entries', type=int, nargs='+',
+                        default=[10000, 100000],
+                        help='number of entries of each output')
+    args = parser.parse_args()
+
+    print('{:<38} {:>9} {:>10} {:>10} {:>11} {:>13}'.format(
+        'parser', 'entries', 'cli (s)', 'cli (MiB)', 'records (s)',
+        'records (MiB)'))
+    for name, generate in BENCHMARKS:
+        parser_cls = load_parser_class(name)
+        for count in args.entries:
+            cli_time, cli_peak = measure(
+                lambda: parser_cls(device=None).cli(
+                    output='\n'.join(generate(count))))
+
+            def records():
+                total = 0
+                for record in parser_cls(device=None).iter_records(
+                        generate(count)):
+                    total += 1
+                return total
+
+            records_time, records_peak = measure(records)
+
+            print('{:<38} {:>9} {:>10.2f} {:>10.2f} {:>11.2f} {:>13.2f}'
+                  .format(name, count, cli_time, cli_peak, records_time,
+                          records_peak))
+
+
+if __name__ == '__main__':
+    main()
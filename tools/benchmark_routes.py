@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+'''Scaling benchmark of the iosxe route table parsers.
+
+Synthetic 'show ip route' and 'show ipv6 route updated' outputs of the given
+sizes are parsed once each. The time per line should stay flat as the table
+grows, the parsers doing a single pass over the output. With the millions of
+dictionaries of the largest tables the cyclic garbage collector adds its own
+growing cost, --no-gc measures the parsers alone.
+
+    python tools/benchmark_routes.py
+    python tools/benchmark_routes.py --routes 10000 100000
+'''
+
+# python
+import gc
+import time
+import argparse
+
+from benchmark_utils import load_parser_class
+
+IPV4_HEADER = '''\
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+       D - EIGRP, EX - EIGRP external, O - OSPF, IA - OSPF inter area
+       i - IS-IS, su - IS-IS summary, L1 - IS-IS level-1, L2 - IS-IS level-2
+
+Gateway of last resort is 10.0.0.1 to network 0.0.0.0
+
+S*    0.0.0.0/0 [1/0] via 10.0.0.1
+'''
+
+IPV6_HEADER = '''\
+IPv6 Routing Table - default - {} entries
+Codes: C - Connected, L - Local, S - Static, U - Per-user Static route
+       B - BGP, HA - Home Agent, MR - Mobile Router, R - RIP
+'''
+
+
+def ipv4_route_lines(count):
+    '''yield the lines of a 'show ip route' output with count routes, a mix
+       of bgp, ospf with two paths, connected and local routes'''
+    for line in IPV4_HEADER.splitlines():
+        yield line
+    for i in range(count):
+        a, b, c = (i >> 16) & 0xff, (i >> 8) & 0xff, i & 0xff
+        if i % 256 == 0:
+            yield ('      {}.{}.0.0/16 is variably subnetted, 256 subnets, '
+                   '2 masks'.format(a + 11, b))
+        kind = i % 8
+        if kind < 5:
+            yield ('B        {}.{}.{}.0/24 [20/0] via 192.168.{}.1, 1w2d'
+                   .format(a + 11, b, c, c))
+        elif kind == 5:
+            yield ('O        {}.{}.{}.0/24 [110/2] via 10.1.2.2, 06:46:59, '
+                   'GigabitEthernet0/1'.format(a + 11, b, c))
+            yield ('                     [110/2] via 10.1.3.2, 06:46:59, '
+                   'GigabitEthernet0/2')
+        elif kind == 6:
+            yield ('C        {}.{}.{}.0/24 is directly connected, '
+                   'Vlan{}'.format(a + 11, b, c, c + 1))
+        else:
+            yield ('L        {}.{}.{}.1/32 is directly connected, '
+                   'Vlan{}'.format(a + 11, b, c, c + 1))
+
+
+def ipv4_routes(count):
+    '''return a 'show ip route' output with count routes'''
+    return '\n'.join(ipv4_route_lines(count))
+
+
+def ipv6_routes(count):
+    '''return a 'show ipv6 route updated' output with count routes'''
+    lines = [IPV6_HEADER.format(count)]
+    for i in range(count):
+        if i % 4:
+            lines.append('B   2001:db8:{:x}:{:x}::/64 [200/0]'.format(
+                i >> 16, i & 0xffff))
+            lines.append('     via 2001:10:1:2::2, GigabitEthernet0/0')
+        else:
+            lines.append('C   2001:db8:{:x}:{:x}::/64 [0/0]'.format(
+                i >> 16, i & 0xffff))
+            lines.append('     via GigabitEthernet0/2, directly connected')
+        lines.append('      Last updated 22:57:07 04 December 2017')
+    return '\n'.join(lines)
+
+
+BENCHMARKS = [
+    ('iosxe.show_routing.ShowIpRoute', ipv4_routes),
+    ('iosxe.show_routing.ShowIpv6RouteUpdated', ipv6_routes),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--routes', type=int, nargs='+',
+                        default=[100000, 1000000],
+                        help='number of routes of each output')
+    parser.add_argument('--no-gc', action='store_true',
+                        help='disable the garbage collector while parsing')
+    args = parser.parse_args()
+
+    print('{:<42} {:>9} {:>9} {:>9} {:>11} {:>9}'.format(
+        'parser', 'routes', 'lines', 'time (s)', 'lines/s', 'us/line'))
+    for name, generate in BENCHMARKS:
+        parser_cls = load_parser_class(name)
+        for count in args.routes:
+            output = generate(count)
+            lines = output.count('\n') + 1
+
+            if args.no_gc:
+                gc.disable()
+            start = time.perf_counter()
+            parsed = parser_cls(device=None).cli(output=output)
+            elapsed = time.perf_counter() - start
+            gc.enable()
+            del parsed
+            gc.collect()
+
+            print('{:<42} {:>9} {:>9} {:>9.2f} {:>11.0f} {:>9.2f}'.format(
+                name, count, lines, elapsed, lines / elapsed,
+                elapsed / lines * 1e6))
+
+
+if __name__ == '__main__':
+    main()
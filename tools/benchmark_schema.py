@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+'''Time of the schema validation of the parsers on their golden outputs,
+generic and compiled.
+
+Each golden output of the parsers is parsed once, then the parsed output is
+validated against the schema of the parser the way parse() validates it,
+with Schema, and with the schema compiled by compile_schema. The times are
+summed per module, or per os with --os.
+
+    python tools/benchmark_schema.py
+    python tools/benchmark_schema.py --modules junos.show_route
+    python tools/benchmark_schema.py --os all
+'''
+
+# python
+import os
+import argparse
+import importlib
+
+from benchmark_utils import PARSER_DIR, golden_outputs, timeit
+
+# metaparser
+from genie.metaparser.util.schemaengine import Schema
+
+from genie.libs.parser.utils.schema import compile_schema
+
+MODULES = ['junos.show_route', 'junos.show_ospf', 'junos.show_ospf3',
+           'junos.show_interface', 'junos.show_chassis', 'junos.show_system']
+
+
+def os_modules(os_name):
+    '''return the <os>.<module> of the parser modules of an os'''
+    folder = os.path.join(PARSER_DIR, os_name)
+    modules = []
+    for root, dirs, files in os.walk(folder):
+        dirs[:] = sorted(d for d in dirs if d != 'tests')
+        for name in sorted(files):
+            if name.endswith('.py') and not name.startswith('_'):
+                path = os.path.relpath(os.path.join(root, name[:-3]),
+                                       PARSER_DIR)
+                modules.append(path.replace(os.sep, '.'))
+    return modules
+
+
+def parsed_outputs(module_name, tests=None):
+    '''yield the (parser class, parsed output) of the golden outputs of the
+       parsers of the module which parse and validate. The tests of the
+       parsers found are removed from tests.'''
+    os_name = module_name.split('.')[0]
+    try:
+        module = importlib.import_module('genie.libs.parser.' + module_name)
+    except Exception:
+        return
+    if tests is None:
+        tests = set(os.listdir(os.path.join(PARSER_DIR, os_name, 'tests')))
+    for name in sorted(tests):
+        cls = getattr(module, name, None)
+        if cls is None or cls.__module__ != module.__name__ or \
+                not isinstance(getattr(cls, 'schema', None), dict):
+            continue
+        tests.discard(name)
+        golden = '.'.join((os_name, module_name.rsplit('.', 1)[-1], name))
+        for output, kwargs in golden_outputs(golden):
+            try:
+                parsed = cls(device=None).parse(output=output, **kwargs)
+            except Exception:
+                continue
+            yield cls, parsed
+
+
+def measure(outputs, repeat):
+    '''return the time of the generic and compiled validations of the
+       outputs'''
+    schemas = [(Schema(cls.schema).validate, compile_schema(cls.schema),
+                parsed) for cls, parsed in outputs]
+
+    def generic():
+        for validate, _, parsed in schemas:
+            validate(parsed)
+
+    def compiled():
+        for _, validate, parsed in schemas:
+            validate(parsed)
+
+    return timeit(generic, repeat), timeit(compiled, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--modules', nargs='+', default=MODULES,
+                        help='<os>.<module> of the parsers')
+    parser.add_argument('--os', nargs='+',
+                        help="os of the parsers, 'all' for every os, "
+                             "instead of --modules")
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='validations per output')
+    args = parser.parse_args()
+
+    groups = [(name, [name]) for name in args.modules]
+    if args.os:
+        names = args.os
+        if names == ['all']:
+            names = sorted(name for name in os.listdir(PARSER_DIR) if
+                           os.path.isdir(os.path.join(PARSER_DIR, name,
+                                                      'tests')))
+        groups = [(name, os_modules(name)) for name in names]
+
+    print('{:<24} {:>8} {:>14} {:>15} {:>8}'.format(
+        'parsers', 'outputs', 'generic (ms)', 'compiled (ms)', 'speedup'))
+    total = [0, 0, 0]
+    for name, modules in groups:
+        tests = None
+        if args.os:
+            tests = set(os.listdir(os.path.join(PARSER_DIR, name, 'tests')))
+        outputs = [output for module_name in modules
+                   for output in parsed_outputs(module_name, tests)]
+        if not outputs:
+            continue
+        generic, compiled = measure(outputs, args.repeat)
+        total = [total[0] + len(outputs), total[1] + generic,
+                 total[2] + compiled]
+        print('{:<24} {:>8} {:>14.2f} {:>15.2f} {:>8.2f}'.format(
+            name, len(outputs), generic * 1e3, compiled * 1e3,
+            generic / compiled))
+    if len(groups) > 1 and total[2]:
+        print('{:<24} {:>8} {:>14.2f} {:>15.2f} {:>8.2f}'.format(
+            'total', total[0], total[1] * 1e3, total[2] * 1e3,
+            total[1] / total[2]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+'''Helpers shared by the parser benchmarks of this directory'''
+
+# python
+import os
+import glob
+import json
+import time
+import importlib
+
+PARSER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          os.pardir, 'src', 'genie', 'libs', 'parser')
+
+
+def load_parser_class(name):
+    '''return the parser class from '<os>.<module>.<class>' '''
+    module, cls = name.rsplit('.', 1)
+    module = importlib.import_module('genie.libs.parser.' + module)
+    return getattr(module, cls)
+
+
+def golden_outputs(name, corpus=None):
+    '''return the (output, kwargs) of the golden tests of a parser
+
+        Args:
+            name (`str`): '<os>.<module>.<class>'
+            corpus (`str`): folder of outputs laid out as the tests folder of
+                an os, <class>/cli/equal/*_output.txt, instead of the tests
+    '''
+    os_name, _, cls = name.split('.')
+    if corpus is None:
+        corpus = os.path.join(PARSER_DIR, os_name, 'tests')
+    folder = os.path.join(corpus, cls, 'cli', 'equal')
+
+    outputs = []
+    for path in sorted(glob.glob(os.path.join(folder, '*_output.txt'))):
+        with open(path) as f:
+            output = f.read()
+
+        arguments = path[:-len('_output.txt')] + '_arguments.json'
+        kwargs = {}
+        if os.path.exists(arguments):
+            with open(arguments) as f:
+                kwargs = json.load(f)
+        outputs.append((output, kwargs))
+    return outputs
+
+
+def timeit(func, repeat, setup=None):
+    '''return the best average time of func over 3 runs of repeat calls'''
+    best = None
+    for _ in range(3):
+        total = 0
+        for _ in range(repeat):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            func()
+            total += time.perf_counter() - start
+        best = total if best is None else min(best, total)
+    return best / repeat
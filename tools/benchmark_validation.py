@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+'''Per call time of parse_output by validation policy.
+
+The golden outputs of a few high volume parsers are parsed with
+parse_output, their result validated against the schema of the parser on
+every call, on one call in N, and never.
+
+    python tools/benchmark_validation.py
+    python tools/benchmark_validation.py --rate 10 --repeat 1000
+'''
+
+# python
+import argparse
+
+from benchmark_utils import golden_outputs, timeit
+
+from genie.libs.parser.utils.common import parse_output
+from genie.libs.parser.utils.validation import ValidationPolicy, \
+                                               set_validation_policy
+
+PARSERS = [
+    ('iosxe.show_interface.ShowInterfaces', 'show interfaces'),
+    ('iosxe.show_bgp.ShowBgpAllSummary', 'show bgp all summary'),
+    ('iosxe.show_fdb.ShowMacAddressTable', 'show mac address-table'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--rate', type=int, default=100,
+                        help='one output in rate validated when sampling')
+    parser.add_argument('--repeat', type=int, default=100,
+                        help='calls per output')
+    args = parser.parse_args()
+
+    modes = ['always', 'sample:{}'.format(args.rate), 'never']
+    print('{:<38} {:>6}'.format('parser', 'lines') +
+          ''.join(' {:>14}'.format(mode + ' (us)') for mode in modes))
+    for name, command in PARSERS:
+        os_name = name.split('.')[0]
+        for output, kwargs in golden_outputs(name):
+            if kwargs:
+                continue
+
+            times = []
+            for mode in modes:
+                set_validation_policy(ValidationPolicy(mode))
+                times.append(timeit(
+                    lambda: parse_output(os_name, command, output),
+                    args.repeat))
+            set_validation_policy(None)
+            print('{:<38} {:>6}'.format(name, output.count('\n') + 1) +
+                  ''.join(' {:>14.1f}'.format(t * 1e6) for t in times))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+'''Pattern profile of the parsers using a LineDispatcher, from their golden
+outputs, and replay of the outputs with the profile.
+
+The outputs are parsed with the parser metrics enabled, the number of lines
+each pattern matched saved as a pattern profile. The outputs are then parsed
+again without and with the profile: the parsed outputs must be identical,
+and the time of each, without schema validation, is printed. The profile is
+used by setting genie.libs.parser.pattern_profile to the file saved.
+
+    python tools/profile_patterns.py --save pattern_profile.json
+    python tools/profile_patterns.py --corpus captured/iosxe --repeat 1000
+'''
+
+# python
+import sys
+import argparse
+
+from benchmark_utils import golden_outputs, load_parser_class, timeit
+
+from genie.libs.parser.utils.common import parse_with
+from genie.libs.parser.utils.metrics import get_metrics
+from genie.libs.parser.utils.dispatch import set_pattern_profile
+from genie.libs.parser.utils.pattern_order import PatternProfile
+from genie.libs.parser.utils.validation import ValidationPolicy, \
+                                               set_validation_policy
+
+PARSERS = ['iosxe.show_interface.ShowInterfaces',
+           'iosxe.show_routing.ShowIpv6RouteUpdated']
+
+
+def profile(corpus):
+    '''return the pattern profile of the parsers over the corpus, a list of
+       (parser class, [(output, kwargs)])'''
+    metrics = get_metrics()
+    enabled = metrics.enabled
+    metrics.reset()
+    metrics.enable()
+    try:
+        for cls, outputs in corpus:
+            for output, kwargs in outputs:
+                parse_with(cls, output, **kwargs)
+        return PatternProfile.from_metrics(metrics)
+    finally:
+        metrics.reset()
+        if not enabled:
+            metrics.disable()
+
+
+def replay(cls, outputs, pattern_profile, repeat):
+    '''return (identical, time without, time with the profile) of parsing
+       the outputs, the time without the schema validation'''
+    results = []
+    times = []
+    for current in (PatternProfile(), pattern_profile):
+        set_pattern_profile(current)
+        results.append([parse_with(cls, output, **kwargs)
+                        for output, kwargs in outputs])
+        previous = set_validation_policy(ValidationPolicy('never'))
+        times.append(timeit(lambda: [parse_with(cls, output, **kwargs)
+                                     for output, kwargs in outputs],
+                            repeat))
+        set_validation_policy(previous)
+    set_pattern_profile(None)
+    return results[0] == results[1], times[0], times[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--parsers', nargs='+', default=PARSERS,
+                        help='<os>.<module>.<class> of the parsers')
+    parser.add_argument('--corpus',
+                        help='folder of the outputs, laid out as the tests '
+                             'folder of the os, instead of the golden tests')
+    parser.add_argument('--save', help='json file the profile is saved to')
+    parser.add_argument('--repeat', type=int, default=100,
+                        help='calls per output')
+    args = parser.parse_args()
+
+    corpus = [(name, load_parser_class(name)) for name in args.parsers]
+    outputs = {name: golden_outputs(name, args.corpus)
+               for name in args.parsers}
+    pattern_profile = profile([(cls, outputs[name]) for name, cls in corpus])
+    if args.save:
+        pattern_profile.save(args.save)
+
+    print('{:<44} {:>8} {:>10} {:>15} {:>15} {:>8}'.format(
+        'parser', 'outputs', 'identical', 'declared (us)', 'profiled (us)',
+        'speedup'))
+    differ = False
+    for name, cls in corpus:
+        if not outputs[name]:
+            continue
+        identical, declared, profiled = replay(cls, outputs[name],
+                                               pattern_profile, args.repeat)
+        differ = differ or not identical
+        print('{:<44} {:>8} {:>10} {:>15.1f} {:>15.1f} {:>8.2f}'.format(
+            name, len(outputs[name]), 'yes' if identical else 'NO',
+            declared * 1e6, profiled * 1e6, declared / profiled))
+    return 1 if differ else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())